@@ -38,6 +38,7 @@ const { applyAuthRateLimits } = require('./lib/auth-rate-limit');
 const { isNeonAuthConfigured, getNeonAuthBaseUrl } = require('./lib/neon-auth-server');
 const { isAdminEmailNotifyConfigured } = require('./lib/admin-notify-email');
 const { installOpsAlerts, createOpsErrorHandler } = require('./lib/ops-alerts');
+const { createIdempotencyMiddleware } = require('./lib/idempotency');
 const { registerUserReportRoutes } = require('./lib/user-report');
 const { registerAppSettingsRoutes } = require('./lib/app-settings');
 const {
@@ -658,6 +659,8 @@ app.use(express.json({ limit: '10mb' }));
 applyAuthRateLimits(app, pool);
 installOpsAlerts(app, pool);
 app.use(createApiAuthMiddleware(pool, apiAuthConfig));
+// Writes with an Idempotency-Key (OSC app retries and outbox replays) run once; repeats get the stored reply.
+app.use(createIdempotencyMiddleware());
 registerAuthRoutes(app, pool, { requireAdminAuth });
 registerUserReportRoutes(app, pool);
 registerAppSettingsRoutes(app, pool, { requireAdminAccess });
@@ -871,6 +874,13 @@ app.get('/health', async (req, res) => {
   }
 });
 
+// Clock sync for OSC/desktop clients: the timestamp is taken when the reply is
+// written, with no DB or Upstash round trip in between (unlike /health).
+app.get('/api/time', (req, res) => {
+  res.set('Cache-Control', 'no-store');
+  res.json({ serverTime: new Date().toISOString() });
+});
+
 // Admin presence: active events and viewers (protected by admin key)
 // Registered early with other /api routes. Handler uses presenceByEvent (defined in Socket section).
 app.get('/api/admin/auth-status', adminAuthStatus);
@@ -6142,9 +6152,15 @@ app.post('/api/timers/start', async (req, res) => {
 
 app.post('/api/timers/stop', async (req, res) => {
   try {
-    const { event_id, item_id } = req.body;
+    const { event_id, item_id, stopped_at } = req.body;
+    // A stop replayed from the OSC app's outbox carries when the operator fired it;
+    // measure overtime to that moment. Missing, unparseable or future values mean now.
+    const requestedStop = stopped_at ? new Date(stopped_at) : null;
+    const stoppedAt = requestedStop && !Number.isNaN(requestedStop.getTime()) && requestedStop <= new Date()
+      ? requestedStop
+      : new Date();
     
-    console.log(`⏹️ OSC: Stopping timer - Event: ${event_id}, Item: ${item_id}`);
+    console.log(`⏹️ OSC: Stopping timer - Event: ${event_id}, Item: ${item_id}, Stopped_at: ${stoppedAt.toISOString()}`);
     clearAllResolumeState(event_id);
     
     // Get timer data BEFORE stopping to calculate overtime
@@ -6170,7 +6186,6 @@ app.post('/api/timers/stop', async (req, res) => {
     if (timerBeforeStop.rows.length > 0 && timerBeforeStop.rows[0].is_running) {
       const timer = timerBeforeStop.rows[0];
       const startedAt = new Date(timer.started_at);
-      const stoppedAt = new Date();
       const actualSeconds = Math.floor((stoppedAt - startedAt) / 1000);
       const scheduledSeconds = timer.duration_seconds || 0;
       const overtimeMinutes = Math.floor((actualSeconds - scheduledSeconds) / 60);
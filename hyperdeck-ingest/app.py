@@ -5,24 +5,36 @@ cues on a HyperDeck, then copies the closed clip to an editor folder.
 """
 from __future__ import annotations
 
+import startup_trace  # first, so its clock starts before the heavy imports
+
+if startup_trace.trace_enabled():
+    startup_trace.install_import_timer()
+
 import os
 import threading
 import time
 import tkinter as tk
-from datetime import date, datetime
+from datetime import date
 from tkinter import filedialog, messagebox, ttk
 
-from config_store import AUTO_STOP_MINUTES, _clamp_auto_stop_hours, _clamp_auto_stop_minutes, load_config, save_config
-from copy_util import CopyError, copy_from_ftp, unique_dest
-from hyperdeck_client import ClipInfo, HyperDeckClient, HyperDeckError
-from names import (
-    DEFAULT_PATTERN,
-    apply_pattern,
-    cue_label,
-    hyperdeck_record_name,
-    item_needs_recording,
+from config_store import (
+    AUTO_STOP_MINUTES,
+    _clamp_auto_stop_hours,
+    _clamp_auto_stop_minutes,
+    config_dir,
+    load_config,
+    save_config,
 )
-from ros_api import RosApi, RosApiError
+from event_index import EventIndex, EventView
+from ingest_core import IngestEngine, IngestHooks
+from local_cache import CACHE_NAME, LocalCache, cache_key, describe_age
+from log_sink import LogSink
+from names import DEFAULT_PATTERN
+from ros_api import RosApi
+from ui_dispatch import UiDispatcher
+from virtual_list import VirtualListbox
+
+startup_trace.mark("imports")
 
 BG = "#0f172a"
 CARD = "#1e293b"
@@ -35,6 +47,7 @@ ERR = "#f87171"
 PILL_STOP = "#334155"
 PILL_FOLLOW = "#065f46"
 PILL_REC = "#991b1b"
+EVENT_SEARCH_DEBOUNCE_MS = 120
 
 
 class HyperDeckIngestApp:
@@ -46,42 +59,54 @@ class HyperDeckIngestApp:
         self.root.configure(bg=BG)
 
         self.cfg = load_config()
-        self.api = RosApi(self.cfg.get("api_base_url") or "", self.cfg.get("api_token") or "")
-        self.deck = HyperDeckClient(
-            str(self.cfg.get("hyperdeck_host") or ""),
-            int(self.cfg.get("hyperdeck_port") or 9993),
-        )
         self.events: list[dict] = []
         self.filtered_events: list[dict] = []
         self.event_list_rows: list[dict | None] = []
-        self._event_list_updating = False
-        self.schedule: list[dict] = []
-        self.clips: list[ClipInfo] = []
-        self.following = False
-        self._follow_thread: threading.Thread | None = None
-        self._busy = False
-        self._last_item_id = None
-        self._last_running = False
-        self._recording_item_id = None
-        self._recording_clip_name = ""
-        self._recording_meta: dict = {}
-        self._recording_seen_running = False
-        self._completed_record_item_ids: set[str] = set()
+        self.event_index = EventIndex()
+        self._event_search_after = None
+        self._event_search_rendered = ""
         self._session_timer_configured = False
-        self.copied_keys = set(str(x) for x in (self.cfg.get("copied_keys") or []))
         self._auto_stop_never = False
         self._auto_stop_ends_at: float | None = None
         self._auto_stop_label = ""
         self._auto_stop_tick = None
         self._auto_stop_notice = ""
-        self._end_lock = threading.Lock()
+        try:
+            self.cache = LocalCache(os.path.join(config_dir(), CACHE_NAME))
+        except Exception:
+            self.cache = LocalCache(":memory:")
+        # Follow loop, deck and copies live in the UI-free engine (shared with ingest_daemon.py).
+        self.engine = IngestEngine(
+            self.cfg,
+            cache=self.cache,
+            hooks=IngestHooks(
+                log=self.log,
+                status=self._on_engine_status,
+                pill=self._set_pill,
+                clips=lambda _clips: self.ui.post("clips", self._render_clips),
+                schedule=lambda _patch: self.ui.post("record_summary", self._update_record_cue_summary),
+                session_ended=self._on_session_ended,
+            ),
+        )
 
+        self.ui = UiDispatcher(self.root)
+        self.log_sink = LogSink("ros-hyperdeck-ingest", os.path.join(config_dir(), "logs"))
         self._build_style()
         self._build_ui()
+        self.log_sink.attach(self.log_text, lambda: self.ui.post("log", self.log_sink.flush))
+        self.ui.start()
         self._load_fields_from_config()
+        self._show_cached_events()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after_idle(self._log_startup)
         self.root.after(300, self._prompt_startup_session)
 
+    def _log_startup(self) -> None:
+        startup_trace.mark("window")
+        self.log(startup_trace.summary())
+        for line in startup_trace.slowest_imports():
+            self.log(f"  import {line}")
+
     def _build_style(self) -> None:
         style = ttk.Style(self.root)
         try:
@@ -344,9 +369,11 @@ class HyperDeckIngestApp:
         list_wrap = tk.Frame(event_pick, bg=LINE)
         list_wrap.grid(row=3, column=0, sticky="ew", pady=(6, 0))
         list_wrap.columnconfigure(0, weight=1)
-        self.event_list = tk.Listbox(
+        self.event_list = VirtualListbox(
             list_wrap,
             height=7,
+            muted_fg=MUTED,
+            on_select=self._on_event_list_select,
             activestyle="none",
             bg="#0b1220",
             fg=FG,
@@ -354,15 +381,8 @@ class HyperDeckIngestApp:
             selectforeground="#fff",
             highlightthickness=0,
             borderwidth=0,
-            exportselection=False,
             font=("Segoe UI", 10),
         )
-        self.event_list.grid(row=0, column=0, sticky="ew")
-        event_scroll = ttk.Scrollbar(list_wrap, orient="vertical", command=self.event_list.yview)
-        self.event_list.configure(yscrollcommand=event_scroll.set)
-        event_scroll.grid(row=0, column=1, sticky="ns")
-        self.event_list.bind("<<ListboxSelect>>", self._on_event_list_select)
-        self.event_list.bind("<Double-Button-1>", self._on_event_list_select)
         self.event_count_label = ttk.Label(event_pick, text="Load events to browse", style="CardMuted.TLabel")
         self.event_count_label.grid(row=4, column=0, sticky="w", pady=(6, 0))
         self.event_selected_label = ttk.Label(event_pick, text="", style="Card.TLabel", wraplength=360)
@@ -484,92 +504,11 @@ class HyperDeckIngestApp:
         self.log_text.tag_config("error", foreground=ERR)
         self.log_text.tag_config("ok", foreground=OK)
 
-    @staticmethod
-    def _event_date_str(ev: dict) -> str:
-        date = str(ev.get("date") or "")
-        if "T" in date:
-            date = date.split("T", 1)[0]
-        return date.strip()
-
-    @classmethod
-    def _parse_event_date(cls, ev: dict) -> date | None:
-        raw = cls._event_date_str(ev)
-        if not raw:
-            return None
-        try:
-            return datetime.strptime(raw, "%Y-%m-%d").date()
-        except ValueError:
-            return None
-
-    @classmethod
-    def _event_sort_key(cls, ev: dict) -> str:
-        return cls._event_date_str(ev) or "9999-99-99"
-
-    def _split_events(self) -> tuple[list[dict], list[dict], list[dict]]:
-        today = date.today()
-        upcoming: list[dict] = []
-        past: list[dict] = []
-        undated: list[dict] = []
-        for ev in self.events:
-            when = self._parse_event_date(ev)
-            if when is None:
-                undated.append(ev)
-            elif when >= today:
-                upcoming.append(ev)
-            else:
-                past.append(ev)
-        upcoming.sort(key=self._event_sort_key)
-        past.sort(key=self._event_sort_key, reverse=True)
-        undated.sort(key=lambda ev: str(ev.get("name") or "").lower())
-        return upcoming, past, undated
-
-    def _matches_event_search(self, ev: dict, query: str) -> bool:
-        return not query or query in self._event_search_blob(ev)
-
-    def _events_for_view(self) -> list[tuple[str, dict | str]]:
-        query = self.event_search_var.get().strip().lower()
-        upcoming, past, undated = self._split_events()
-        mode = self.event_range_var.get()
-
-        def filt(items: list[dict]) -> list[dict]:
-            return [ev for ev in items if self._matches_event_search(ev, query)]
-
-        def grouped(u: list[dict], n: list[dict], p: list[dict]) -> list[tuple[str, dict | str]]:
-            rows: list[tuple[str, dict | str]] = []
-            if u:
-                rows.append(("header", f"Upcoming ({len(u)})"))
-                rows.extend(("event", ev) for ev in u)
-            if n:
-                rows.append(("header", f"No date ({len(n)})"))
-                rows.extend(("event", ev) for ev in n)
-            if p:
-                rows.append(("header", f"Past ({len(p)})"))
-                rows.extend(("event", ev) for ev in p)
-            return rows
-
-        u = filt(upcoming)
-        n = filt(undated)
-        p = filt(past)
-
-        if query:
-            return grouped(u, n, p)
-
-        rows: list[tuple[str, dict | str]] = []
-        if mode == "upcoming":
-            for ev in u + n:
-                rows.append(("event", ev))
-        elif mode == "past":
-            for ev in p:
-                rows.append(("event", ev))
-        else:
-            rows = grouped(u, n, p)
-        return rows
-
     def _auto_range_for_event(self, eid: str) -> None:
-        ev = next((e for e in self.events if str(e.get("id")) == eid), None)
-        if not ev:
+        entry = self._event_index().get(eid)
+        if not entry:
             return
-        when = self._parse_event_date(ev)
+        when = entry.when
         if when is None:
             if self.event_range_var.get() == "past":
                 self.event_range_var.set("upcoming")
@@ -580,18 +519,19 @@ class HyperDeckIngestApp:
         elif self.event_range_var.get() == "upcoming":
             self.event_range_var.set("past")
 
-    def _event_count_text(self) -> str:
+    def _event_index(self) -> EventIndex:
+        if self.event_index.stale():
+            self.event_index = EventIndex(self.events)
+        return self.event_index
+
+    def _event_count_text(self, view: EventView) -> str:
         if not self.events:
             return "Load events to browse"
-        query = self.event_search_var.get().strip().lower()
-        upcoming, past, undated = self._split_events()
-        u = len([ev for ev in upcoming if self._matches_event_search(ev, query)])
-        p = len([ev for ev in past if self._matches_event_search(ev, query)])
-        n = len([ev for ev in undated if self._matches_event_search(ev, query)])
-        shown = len(self.filtered_events)
+        u, p, n = view.upcoming, view.past, view.undated
+        shown = len(view.events)
         total = len(self.events)
         mode = self.event_range_var.get()
-        if query:
+        if self.event_search_var.get().strip():
             return f"{shown} match(es)  ·  {u} upcoming · {p} past · {n} undated"
         if mode == "upcoming":
             return f"{shown} upcoming  ·  {p} past · {n} undated"
@@ -599,90 +539,64 @@ class HyperDeckIngestApp:
             return f"{shown} past  ·  {u} upcoming · {n} undated"
         return f"{total} total  ·  {u} upcoming · {p} past · {n} undated"
 
-    @classmethod
-    def _event_label(cls, ev: dict) -> str:
-        name = str(ev.get("name") or "Untitled")
-        date = cls._event_date_str(ev)
-        return f"{date}  ·  {name}" if date else name
-
-    @classmethod
-    def _event_search_blob(cls, ev: dict) -> str:
-        eid = str(ev.get("id") or "")
-        return " ".join(
-            [
-                cls._event_date_str(ev),
-                str(ev.get("name") or ""),
-                eid,
-                eid.replace("-", ""),
-            ]
-        ).lower()
-
     def _refresh_event_selection_label(self) -> None:
         eid = self.event_id_var.get().strip()
         if not eid:
             self.event_selected_label.configure(text="")
             return
-        ev = next((e for e in self.events if str(e.get("id")) == eid), None)
-        if ev:
+        entry = self._event_index().get(eid)
+        if entry:
             short = eid[:8] + "…" if len(eid) > 8 else eid
             self.event_selected_label.configure(
-                text=f"Selected: {ev.get('name') or 'Untitled'}  ·  {short}"
+                text=f"Selected: {entry.event.get('name') or 'Untitled'}  ·  {short}"
             )
         else:
             self.event_selected_label.configure(text=f"Selected ID: {eid}")
 
     def _render_event_list(self, select_id: str | None = None) -> None:
-        rows = self._events_for_view()
-        self.filtered_events = []
-        self.event_list_rows = []
-        self.event_list.delete(0, "end")
-        for kind, payload in rows:
-            if kind == "header":
-                self.event_list.insert("end", f"— {payload} —")
-                idx = self.event_list.size() - 1
-                self.event_list.itemconfig(idx, fg=MUTED)
-                self.event_list_rows.append(None)
-            else:
-                self.event_list.insert("end", self._event_label(payload))
-                self.event_list_rows.append(payload)
-                self.filtered_events.append(payload)
-
-        self.event_count_label.configure(text=self._event_count_text())
+        view = self._event_index().view(self.event_search_var.get(), self.event_range_var.get())
+        self.filtered_events = view.events
+        self.event_list_rows = [payload.event if kind == "event" else None for kind, payload in view.rows]
+        self.event_list.set_rows(view.labels, view.headers)
+        self.event_count_label.configure(text=self._event_count_text(view))
 
         pick = select_id or self.event_id_var.get().strip()
-        self._event_list_updating = True
-        try:
-            if pick:
-                for i, ev in enumerate(self.event_list_rows):
-                    if ev is not None and str(ev.get("id")) == pick:
-                        self.event_list.selection_set(i)
-                        self.event_list.see(i)
-                        break
-        finally:
-            self._event_list_updating = False
+        if pick:
+            for i, ev in enumerate(self.event_list_rows):
+                if ev is not None and str(ev.get("id")) == pick:
+                    self.event_list.select(i)
+                    break
         self._refresh_event_selection_label()
 
     def _on_event_search(self, _evt=None) -> None:
+        if self._event_search_after is not None:
+            self.root.after_cancel(self._event_search_after)
+        self._event_search_after = self.root.after(EVENT_SEARCH_DEBOUNCE_MS, self._run_event_search)
+
+    def _run_event_search(self) -> None:
+        self._event_search_after = None
+        query = self.event_search_var.get().strip().lower()
+        if query == self._event_search_rendered:
+            return
+        self._event_search_rendered = query
         self._render_event_list()
 
     def _on_event_search_enter(self, _evt=None) -> None:
+        if self._event_search_after is not None:
+            self.root.after_cancel(self._event_search_after)
+            self._run_event_search()
         if not self.filtered_events:
             return
         ev = self.filtered_events[0]
         for i, row in enumerate(self.event_list_rows):
             if row is ev:
-                self._event_list_updating = True
-                try:
-                    self.event_list.selection_clear(0, "end")
-                    self.event_list.selection_set(i)
-                    self.event_list.see(i)
-                finally:
-                    self._event_list_updating = False
+                self.event_list.select(i)
                 break
         self._choose_event(ev)
 
     def _clear_event_search(self) -> None:
         self.event_search_var.set("")
+        self._event_search_rendered = ""
         self._render_event_list()
 
     def _on_event_lock_toggled(self) -> None:
@@ -708,9 +622,8 @@ class HyperDeckIngestApp:
             try:
                 self._refresh_schedule()
                 ev = self._current_event()
-                marked = sum(1 for item in self.schedule if item_needs_recording(item))
-                self.root.after(
-                    0,
+                marked = self.engine.marked_count()
+                self.ui.call(
                     lambda: messagebox.showinfo(
                         "Event locked",
                         f"{ev.get('name') or 'Event'}\n\n"
@@ -720,7 +633,7 @@ class HyperDeckIngestApp:
                     ),
                 )
             except Exception as exc:
-                self.root.after(0, lambda: messagebox.showerror("Event", str(exc)))
+                self.ui.call(messagebox.showerror, "Event", str(exc))
 
         self._bg(work)
 
@@ -737,22 +650,12 @@ class HyperDeckIngestApp:
         self.event_id_var.set(eid)
         self._bg(self._refresh_schedule)
 
-    def _on_event_list_select(self, _evt=None) -> None:
-        if self._event_list_updating:
-            return
-        sel = self.event_list.curselection()
-        if not sel:
-            return
-        idx = int(sel[0])
+    def _on_event_list_select(self, idx: int) -> None:
         if idx < 0 or idx >= len(self.event_list_rows):
             return
         ev = self.event_list_rows[idx]
         if ev is None:
-            self._event_list_updating = True
-            try:
-                self.event_list.selection_clear(0, "end")
-            finally:
-                self._event_list_updating = False
+            self.event_list.clear_selection()
             return
         self._choose_event(ev)
 
@@ -767,7 +670,7 @@ class HyperDeckIngestApp:
         def apply():
             self.follow_pill.configure(text=text, bg=bg)
 
-        self.root.after(0, apply)
+        self.ui.post("follow_pill", apply)
 
     def _format_duration(self, seconds: int) -> str:
         total = max(0, int(seconds))
@@ -1065,34 +968,41 @@ class HyperDeckIngestApp:
             "auto_stop_hours": int(self.cfg.get("auto_stop_hours") or 2),
             "auto_stop_minutes": int(self.cfg.get("auto_stop_minutes") or 0),
             "auto_stop_never": bool(self.cfg.get("auto_stop_never")),
-            "copied_keys": sorted(self.copied_keys),
+            "copied_keys": sorted(self.engine.copied_keys),
         }
 
     def _apply_api_from_fields(self) -> RosApi:
-        self.api = RosApi(self.api_url_var.get(), self.api_token_var.get())
-        return self.api
+        """Hand the current form fields (and selected event) to the engine; returns its API client."""
+        return self.engine.configure(self._snapshot_config(), self._current_event())
 
     def _save(self) -> None:
         self.cfg = save_config(self._snapshot_config())
+        self.engine.configure(self.cfg)
         self.log("Settings saved")
 
-    def log(self, message: str, level: str = "info") -> None:
-        line = f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n"
+    def _on_engine_status(self, field: str, text: str) -> None:
+        var = {"ros": self.status_ros, "deck": self.status_deck, "cue": self.status_cue, "copy": self.status_copy}.get(field)
+        if var is not None:
+            self.ui.set(var, text)
 
-        def _write():
-            self.log_text.insert("end", line, "ok" if level == "ok" else "error" if level == "error" else "")
-            self.log_text.see("end")
+    def _on_session_ended(self, notice: str) -> None:
+        self.ui.call(self._show_auto_stop_notice, notice)
+        self.ui.call(self._clear_auto_stop_timer)
 
-        self.root.after(0, _write)
+    def log(self, message: str, level: str = "info") -> None:
+        self.log_sink.log(message, "ok" if level == "ok" else "error" if level == "error" else "")
 
     def _on_close(self) -> None:
-        self.following = False
+        self.engine.following = False
+        self.ui.stop()
         self._clear_auto_stop_timer()
         try:
             save_config(self._snapshot_config())
         except Exception:
             pass
-        self.deck.disconnect()
+        self.engine.close()
+        self.cache.close()
+        self.log_sink.close()
         self.root.destroy()
 
     def _bg(self, fn, *args) -> None:
@@ -1109,182 +1019,89 @@ class HyperDeckIngestApp:
             api = self._apply_api_from_fields()
             msg = api.validate()
             self.log(msg, "ok")
-            self.root.after(0, lambda: self.status_ros.set(msg))
+            self.ui.set(self.status_ros, msg)
 
         self._bg(work)
 
+    def _show_events(self, events: list[dict], cached=None) -> None:
+        """Index ``events`` (any thread) and render them; ``cached`` is the CacheEntry they came from, if any."""
+        index = EventIndex(events)
+        self.events = events
+        current = self.event_id_var.get().strip()
+        note = f" (cached {describe_age(cached.age)} ago)" if cached else ""
+
+        def apply():
+            self.event_index = index
+            if current:
+                self._auto_range_for_event(current)
+            self._render_event_list(select_id=current or None)
+            self.status_ros.set(f"Loaded {len(events)} event(s){note}")
+            self.log(f"Loaded {len(events)} events{note}", "info" if cached else "ok")
+
+        self.ui.call(apply)
+
+    def _show_cached_events(self) -> None:
+        """Startup: show the last fetched event list without touching the network."""
+        cached = self.cache.get(cache_key(self.engine.api.base_url, "events"))
+        if cached is not None and cached.value:
+            self._show_events(cached.value, cached)
+
     def _load_events(self) -> None:
         def work():
             api = self._apply_api_from_fields()
-            events = api.list_events()
-            self.events = events
-            current = self.event_id_var.get().strip()
-
-            def apply():
-                if current:
-                    self._auto_range_for_event(current)
-                self._render_event_list(select_id=current or None)
-                self.status_ros.set(f"Loaded {len(events)} event(s)")
-                self.log(f"Loaded {len(events)} events", "ok")
-
-            self.root.after(0, apply)
+            if not self.cache.revalidate(cache_key(api.base_url, "events"), api.list_events, self._show_events):
+                self.log("API unreachable — keeping the cached event list", "error")
 
         self._bg(work)
 
     def _current_event(self) -> dict:
         eid = self.event_id_var.get().strip()
-        for ev in self.events:
-            if str(ev.get("id")) == eid:
-                return ev
+        entry = self.event_index.get(eid)
+        if entry:
+            return entry.event
         return {"id": eid, "name": "", "date": ""}
 
     def _update_record_cue_summary(self) -> None:
-        total = len(self.schedule)
-        marked = sum(1 for item in self.schedule if item_needs_recording(item))
-        self.event_rec_summary_var.set(f"Record-marked cues: {marked} / {total}")
+        self.event_rec_summary_var.set(f"Record-marked cues: {self.engine.marked_count()} / {len(self.engine.schedule)}")
 
     def _refresh_schedule(self) -> None:
-        eid = self.event_id_var.get().strip()
-        if not eid:
-            raise RosApiError("Select an event first")
-        api = self._apply_api_from_fields()
-        self.schedule = api.schedule_items(eid)
-        self.log(f"Schedule: {len(self.schedule)} cues")
-        self.root.after(0, self._update_record_cue_summary)
-
-    def _item_by_id(self, item_id) -> dict | None:
-        sid = str(item_id)
-        for item in self.schedule:
-            if str(item.get("id")) == sid:
-                return item
-        return None
+        self._apply_api_from_fields()
+        self.engine.refresh_schedule()
 
     def _connect_deck(self) -> None:
         def work():
-            self.deck.host = self.deck_host_var.get().strip()
-            self.deck.port = int(self.deck_port_var.get() or 9993)
-            model = self.deck.connect()
-            self.log(f"HyperDeck connected: {model or self.deck.host}", "ok")
-            self.root.after(0, lambda: self.status_deck.set(model or "Connected"))
-            self._refresh_clips_sync()
+            self._apply_api_from_fields()
+            self.engine.connect_deck()
+            self.engine.refresh_clips()
 
         self._bg(work)
 
     def _refresh_clips(self) -> None:
-        self._bg(self._refresh_clips_sync)
-
-    def _refresh_clips_sync(self) -> None:
-        clips = self.deck.clips()
-        self.clips = clips
-        self.root.after(0, self._render_clips)
-
-    def _clip_key(self, clip: ClipInfo) -> str:
-        return f"{clip.index}:{clip.name}"
+        self._bg(self.engine.refresh_clips)
 
     def _render_clips(self) -> None:
         for row in self.clip_tree.get_children():
             self.clip_tree.delete(row)
-        for clip in self.clips:
-            copied = "yes" if self._clip_key(clip) in self.copied_keys else ""
+        for clip in self.engine.clips:
+            copied = "yes" if self.engine.clip_key(clip) in self.engine.copied_keys else ""
             self.clip_tree.insert(
                 "", "end", values=(clip.index, clip.name, clip.duration, copied)
             )
 
-    def _dest_name(self, item: dict | None, clip_name: str) -> str:
-        ev = self._current_event()
-        pattern = self.pattern_var.get().strip() or DEFAULT_PATTERN
-        base = apply_pattern(
-            pattern,
-            event_name=str(ev.get("name") or "Event"),
-            event_date=str(ev.get("date") or ""),
-            segment=str((item or {}).get("segmentName") or clip_name or "Segment"),
-            cue=cue_label(item),
-            clip=clip_name,
-        )
-        return base
-
-    def _copy_clip(self, clip: ClipInfo, item: dict | None) -> str:
-        target = self.target_folder_var.get().strip()
-        if not target:
-            raise CopyError("Set a target folder")
-        stem = self._dest_name(item, clip.name)
-        dest = unique_dest(target, stem + ".mov")
-        path = copy_from_ftp(
-            self.deck_host_var.get().strip(),
-            clip.name,
-            dest,
-            port=int(self.ftp_port_var.get() or 21),
-            user=(self.ftp_user_var.get() or "anonymous").strip(),
-            password=self.ftp_pass_var.get(),
-            log=self.log,
-        )
-        self.copied_keys.add(self._clip_key(clip))
-        save_config(self._snapshot_config())
-        self.root.after(0, lambda: self.status_copy.set(os.path.basename(path)))
-        self.root.after(0, self._render_clips)
-        self.log(f"Copied → {path}", "ok")
-        return path
-
     def _copy_last(self) -> None:
-        def work():
-            self._refresh_clips_sync()
-            if not self.clips:
-                raise CopyError("No clips on the HyperDeck")
-            clip = self.clips[-1]
-            item = self._item_by_id(self._recording_item_id or self._last_item_id)
-            self._copy_clip(clip, item)
-
-        self._bg(work)
+        self._apply_api_from_fields()
+        self.engine.copy_last()
 
     def _manual_record(self) -> None:
-        def work():
-            item = self._item_by_id(self._last_item_id)
-            name = hyperdeck_record_name(
-                cue=cue_label(item),
-                segment=str((item or {}).get("segmentName") or "clip"),
-            )
-            self.deck.record(name)
-            self._recording_item_id = (item or {}).get("id")
-            self._recording_clip_name = name
-            self._recording_meta = item or {}
-            self.log(f"Recording as {name}", "ok")
-            self.root.after(0, lambda: self.status_deck.set(f"Recording {name}"))
-            self._set_pill("recording")
-
-        self._bg(work)
+        self._apply_api_from_fields()
+        self._bg(self.engine.manual_record)
 
     def _manual_stop(self) -> None:
-        self._bg(self._stop_and_maybe_copy)
-
-    def _stop_and_maybe_copy(self) -> None:
-        self.deck.stop()
-        self.log("HyperDeck stop")
-        self.root.after(0, lambda: self.status_deck.set("Stopped"))
-        self._set_pill("following" if self.following else "stopped")
-        item = self._recording_meta or self._item_by_id(self._recording_item_id)
-        finished_item_id = str(self._recording_item_id) if self._recording_item_id is not None else ""
-        self._recording_item_id = None
-        if finished_item_id:
-            self._completed_record_item_ids.add(finished_item_id)
-        self._recording_seen_running = False
-        if not self.auto_copy_var.get():
-            self._refresh_clips_sync()
-            return
-        time.sleep(1.5)
-        self._refresh_clips_sync()
-        if not self.clips:
-            raise CopyError("Stopped, but no clips listed yet")
-        clip = self.clips[-1]
-        if self._recording_clip_name:
-            match = next((c for c in reversed(self.clips) if c.name == self._recording_clip_name), None)
-            if match:
-                clip = match
-        self._copy_clip(clip, item)
-        self._recording_clip_name = ""
-        self._recording_meta = {}
+        self._apply_api_from_fields()
+        self._bg(self.engine.stop_and_maybe_copy)
 
     def start_follow(self) -> None:
-        if self.following:
+        if self.engine.following:
             return
         if not self.event_id_var.get().strip():
             messagebox.showinfo("Event", "Load events and select one first.")
@@ -1295,163 +1112,27 @@ class HyperDeckIngestApp:
                 "Confirm and lock the event first (Confirm event button), then Start follow.",
             )
             return
+        if self._auto_stop_never:
+            note = " — polling until session timer expires or you click Stop"
+        elif self._auto_stop_ends_at:
+            left = max(0, int((self._auto_stop_ends_at - time.time() * 1000) / 1000))
+            note = f" — session timer {self._format_duration(left)} remaining"
+        else:
+            note = ""
         try:
             self._apply_api_from_fields()
-            if not self.deck.connected:
-                self.deck.host = self.deck_host_var.get().strip()
-                self.deck.port = int(self.deck_port_var.get() or 9993)
-                model = self.deck.connect()
-                self.status_deck.set(model or "Connected")
-                self.log(f"HyperDeck connected: {model or self.deck.host}", "ok")
-            self._refresh_schedule()
+            self.engine.start_follow(note)
         except Exception as exc:
             messagebox.showerror("Cannot start", str(exc))
             return
         self._hide_auto_stop_notice()
         self._save()
-        self._completed_record_item_ids = set()
-        self._recording_seen_running = False
-        self.following = True
-        self._set_pill("following")
-        if self._auto_stop_never:
-            self.log("Follow started — polling until session timer expires or you click Stop", "ok")
-        elif self._auto_stop_ends_at:
-            left = max(0, int((self._auto_stop_ends_at - time.time() * 1000) / 1000))
-            self.log(f"Follow started — session timer {self._format_duration(left)} remaining", "ok")
-        else:
-            self.log("Follow started", "ok")
-        self._follow_thread = threading.Thread(target=self._follow_loop, daemon=True)
-        self._follow_thread.start()
 
     def stop_follow(self) -> None:
-        self._bg(lambda: self._end_follow(auto=False))
+        self._bg(lambda: self.engine.end_follow(auto=False))
 
     def _session_expire(self) -> None:
-        self._end_follow(auto=True, session_expired=True)
-
-    def _end_follow(self, auto: bool = False, session_expired: bool = False) -> None:
-        if not self._end_lock.acquire(blocking=False):
-            return
-        try:
-            was_following = self.following
-            was_recording = self._recording_item_id is not None
-            label = self._auto_stop_label
-            self.following = False
-            if was_recording:
-                try:
-                    self._stop_and_maybe_copy()
-                except Exception as exc:
-                    self.log(str(exc), "error")
-            if session_expired or auto:
-                try:
-                    self.deck.disconnect()
-                except Exception:
-                    pass
-                self.root.after(0, lambda: self.status_deck.set("Disconnected"))
-                notice = (
-                    f"Railway session ended after {label}. Restart the app to poll again."
-                    if label
-                    else "Railway session ended. Restart the app to poll again."
-                )
-                self.log(notice)
-                self.root.after(0, lambda: self._show_auto_stop_notice(notice))
-                self.root.after(0, self._clear_auto_stop_timer)
-            elif was_following:
-                self.log("Follow stopped")
-            self.root.after(0, lambda: self._set_pill("stopped"))
-            self.root.after(0, lambda: self.status_ros.set("Follow stopped" if was_following else "Session ended"))
-        finally:
-            self._end_lock.release()
-
-    def _follow_loop(self) -> None:
-        poll = max(1, int(self.cfg.get("poll_seconds") or 1))
-        while self.following:
-            try:
-                self._follow_tick()
-            except Exception as exc:
-                self.log(str(exc), "error")
-                self.root.after(0, lambda m=str(exc): self.status_ros.set(m))
-            time.sleep(poll)
-
-    def _cue_timer_stopped(self, timer: dict | None, item_id) -> bool:
-        """True when the given cue's timer has stopped/completed (not merely unloaded)."""
-        if timer is None:
-            return False
-        if str(timer.get("item_id")) != str(item_id):
-            return False
-        state = str(timer.get("timer_state") or "").lower()
-        running = timer.get("is_running") is True or state == "running"
-        if state in ("stopped", "done", "ended", "completed"):
-            return True
-        if self._recording_seen_running and not running:
-            return True
-        return False
-
-    def _follow_tick(self) -> None:
-        eid = self.event_id_var.get().strip()
-        timer = self.api.get_active_timer(eid)
-
-        if self._recording_item_id is not None and timer is None:
-            self._stop_and_maybe_copy()
-            self._last_running = False
-            self._last_item_id = None
-            self.root.after(0, lambda: self.status_cue.set("None"))
-            return
-
-        if not timer:
-            self.root.after(0, lambda: self.status_cue.set("None"))
-            self._last_running = False
-            self._last_item_id = None
-            return
-
-        item_id = timer.get("item_id")
-        state = str(timer.get("timer_state") or "").lower()
-        running = timer.get("is_running") is True or state == "running"
-        item = self._item_by_id(item_id)
-        if item is None:
-            try:
-                self._refresh_schedule()
-                item = self._item_by_id(item_id)
-            except Exception:
-                pass
-        marked = item_needs_recording(item)
-        cue = cue_label(item)
-        segment = str((item or {}).get("segmentName") or "")
-        rec = "REC" if marked else "—"
-        state_label = "running" if running else (state or "loaded")
-        if self._recording_item_id is not None and str(self._recording_item_id) == str(item_id):
-            state_label = f"{state_label} · recording"
-        self.root.after(
-            0,
-            lambda: self.status_cue.set(f"{cue or item_id}  {segment}  [{state_label}]  {rec}"),
-        )
-        self.root.after(0, lambda: self.status_ros.set("Polling OK"))
-
-        if self._recording_item_id is not None and str(self._recording_item_id) == str(item_id):
-            if running:
-                self._recording_seen_running = True
-            if self._cue_timer_stopped(timer, self._recording_item_id):
-                self._stop_and_maybe_copy()
-
-        if (
-            marked
-            and self._recording_item_id is None
-            and state in ("loaded", "running")
-            and str(item_id) not in self._completed_record_item_ids
-        ):
-            name = hyperdeck_record_name(cue=cue, segment=segment or "clip")
-            self.deck.record(name)
-            self._recording_item_id = item_id
-            self._recording_clip_name = name
-            self._recording_meta = item or {}
-            self._recording_seen_running = running
-            self.log(f"Auto-record on load: {name}", "ok")
-            self.root.after(0, lambda: self.status_deck.set(f"Recording {name}"))
-            self._set_pill("recording")
-
-        self._last_item_id = item_id
-        self._last_running = running
-
+        self.engine.end_follow(auto=True, session_expired=True, label=self._auto_stop_label)
 
 def main() -> None:
     root = tk.Tk()
@@ -47,9 +47,10 @@ def config_path() -> str:
     return os.path.join(config_dir(), CONFIG_NAME)
 
 
-def load_config() -> dict[str, Any]:
+def load_config(path: str | None = None) -> dict[str, Any]:
+    """Saved settings over ``DEFAULTS``; ``path`` picks another config file (one per headless session)."""
     data = dict(DEFAULTS)
-    path = config_path()
+    path = path or config_path()
     if not os.path.isfile(path):
         return data
     try:
@@ -79,7 +80,7 @@ def load_config() -> dict[str, Any]:
     return data
 
 
-def save_config(data: dict[str, Any]) -> dict[str, Any]:
+def save_config(data: dict[str, Any], path: str | None = None) -> dict[str, Any]:
     merged = dict(DEFAULTS)
     merged.update(data or {})
     merged["api_base_url"] = normalize_base_url(str(merged.get("api_base_url") or ""))
@@ -96,7 +97,7 @@ def save_config(data: dict[str, Any]) -> dict[str, Any]:
     merged["source_folder"] = ""
     if not str(merged.get("ftp_user") or "").strip():
         merged["ftp_user"] = "anonymous"
-    path = config_path()
+    path = path or config_path()
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as fh:
         json.dump(merged, fh, indent=2)
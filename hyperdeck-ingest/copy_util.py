@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import time
 from datetime import datetime
@@ -10,6 +11,7 @@ from typing import Callable
 
 LogFn = Callable[[str], None]
 MEDIA_EXTS = {".mov", ".mp4", ".mxf", ".m4v"}
+LIST_LINE = re.compile(r"^[-dlcbps][-rwxsStT]{9}[+@.]?\s")
 
 
 class CopyError(Exception):
@@ -234,9 +236,11 @@ def _normalize_remote_names(listing: list[str]) -> list[str]:
         token = line.strip()
         if not token:
             continue
-        # LIST fallback line: permissions/date/size filename -> filename is the final token.
-        if " " in token:
-            token = token.split()[-1]
+        # LIST fallback line: permissions links owner group size month day time/year filename.
+        # Only those are split; MLSD/NLST names may contain spaces ("CUE5 Opening Keynote.mov").
+        if LIST_LINE.match(token):
+            fields = token.split(None, 8)
+            token = fields[-1] if len(fields) == 9 else token.split()[-1]
         if token and token not in (".", ".."):
             cleaned.append(os.path.basename(token))
     # Preserve order and uniqueness.
@@ -0,0 +1,176 @@
+"""Calendar-event search index for the ingest event picker.
+
+Dates, labels and lowercase search blobs are computed once per event list so
+typing in the search box only does substring checks over prebuilt strings.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+Row = tuple[str, object]
+
+
+@dataclass(frozen=True)
+class IndexedEvent:
+    event: dict
+    event_id: str
+    date_str: str
+    when: date | None
+    label: str
+    blob: str
+
+
+@dataclass
+class EventMatches:
+    query: str
+    upcoming: list[IndexedEvent]
+    past: list[IndexedEvent]
+    undated: list[IndexedEvent]
+
+
+@dataclass
+class EventView:
+    """Listbox rows for one (query, range) pair plus the counts shown under the list."""
+
+    rows: list[Row]
+    events: list[dict]
+    upcoming: int
+    past: int
+    undated: int
+    labels: list[str] = field(default_factory=list)
+    headers: set[int] = field(default_factory=set)
+
+
+def event_date_str(ev: dict) -> str:
+    raw = str(ev.get("date") or "")
+    if "T" in raw:
+        raw = raw.split("T", 1)[0]
+    return raw.strip()
+
+
+def parse_event_date(raw: str) -> date | None:
+    if not raw:
+        return None
+    try:
+        return datetime.strptime(raw, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def event_label(ev: dict, date_str: str | None = None) -> str:
+    name = str(ev.get("name") or "Untitled")
+    when = event_date_str(ev) if date_str is None else date_str
+    return f"{when}  ·  {name}" if when else name
+
+
+def search_blob(ev: dict, date_str: str | None = None) -> str:
+    eid = str(ev.get("id") or "")
+    when = event_date_str(ev) if date_str is None else date_str
+    return " ".join([when, str(ev.get("name") or ""), eid, eid.replace("-", "")]).lower()
+
+
+def _index_event(ev: dict) -> IndexedEvent:
+    raw = event_date_str(ev)
+    return IndexedEvent(
+        event=ev,
+        event_id=str(ev.get("id") or ""),
+        date_str=raw,
+        when=parse_event_date(raw),
+        label=event_label(ev, raw),
+        blob=search_blob(ev, raw),
+    )
+
+
+class EventIndex:
+    """Events split into upcoming / past / undated once, with incremental query narrowing."""
+
+    def __init__(self, events: list[dict] | None = None, today: date | None = None):
+        self.today = today or date.today()
+        entries = [_index_event(ev) for ev in (events or []) if isinstance(ev, dict)]
+        self.by_id: dict[str, IndexedEvent] = {}
+        for entry in entries:
+            self.by_id.setdefault(entry.event_id, entry)
+        upcoming = [e for e in entries if e.when is not None and e.when >= self.today]
+        past = [e for e in entries if e.when is not None and e.when < self.today]
+        undated = [e for e in entries if e.when is None]
+        upcoming.sort(key=lambda e: e.date_str or "9999-99-99")
+        past.sort(key=lambda e: e.date_str or "9999-99-99", reverse=True)
+        undated.sort(key=lambda e: str(e.event.get("name") or "").lower())
+        self._all = EventMatches("", upcoming, past, undated)
+        self._last = self._all
+        self._views: dict[tuple[str, str], EventView] = {}
+        self.total = len(entries)
+
+    def __len__(self) -> int:
+        return self.total
+
+    def stale(self) -> bool:
+        """True once the calendar day rolls over (upcoming/past split is out of date)."""
+        return date.today() != self.today
+
+    def get(self, event_id: str) -> IndexedEvent | None:
+        return self.by_id.get(str(event_id))
+
+    def search(self, query: str) -> EventMatches:
+        q = (query or "").strip().lower()
+        if not q:
+            return self._all
+        last = self._last
+        if q == last.query:
+            return last
+        # Typing extends the query: only the previous matches can still match.
+        base = last if last.query and q.startswith(last.query) else self._all
+        result = EventMatches(
+            q,
+            [e for e in base.upcoming if q in e.blob],
+            [e for e in base.past if q in e.blob],
+            [e for e in base.undated if q in e.blob],
+        )
+        self._last = result
+        return result
+
+    def view(self, query: str, mode: str) -> EventView:
+        q = (query or "").strip().lower()
+        key = (q, mode)
+        cached = self._views.get(key)
+        if cached is not None:
+            return cached
+        m = self.search(q)
+        if q or mode not in ("upcoming", "past"):
+            rows = _grouped(m.upcoming, m.undated, m.past)
+        elif mode == "upcoming":
+            rows = [("event", e) for e in m.upcoming + m.undated]
+        else:
+            rows = [("event", e) for e in m.past]
+        view = EventView(
+            rows=rows,
+            events=[e.event for kind, e in rows if kind == "event"],
+            upcoming=len(m.upcoming),
+            past=len(m.past),
+            undated=len(m.undated),
+        )
+        for i, (kind, payload) in enumerate(rows):
+            if kind == "header":
+                view.labels.append(f"— {payload} —")
+                view.headers.add(i)
+            else:
+                view.labels.append(payload.label)
+        if len(self._views) > 64:
+            self._views.clear()
+        self._views[key] = view
+        return view
+
+
+def _grouped(u: list[IndexedEvent], n: list[IndexedEvent], p: list[IndexedEvent]) -> list[Row]:
+    rows: list[Row] = []
+    if u:
+        rows.append(("header", f"Upcoming ({len(u)})"))
+        rows.extend(("event", e) for e in u)
+    if n:
+        rows.append(("header", f"No date ({len(n)})"))
+        rows.extend(("event", e) for e in n)
+    if p:
+        rows.append(("header", f"Past ({len(p)})"))
+        rows.extend(("event", e) for e in p)
+    return rows
@@ -0,0 +1,500 @@
+"""Local HyperDeck stand-in: Ethernet Protocol on TCP plus FTP with synthetic media.
+
+No hardware needed, so ``HyperDeckClient`` and the copy path can be tested
+and benchmarked on their own:
+
+    python fake_hyperdeck.py --clips 20 --ftp-port 2121
+    python fake_hyperdeck.py --delay 0.05 --fragment 3 --drop-after 50
+
+``FakeHyperDeck`` answers ``transport info``, ``clips get``, ``record``
+(optionally ``record: name: X``), ``stop``, ``notify``, ``ping``,
+``remote`` and ``quit``. A record followed by a stop adds a clip, just as
+on the deck. After ``notify: transport: true`` a session also gets
+asynchronous ``508 transport info:`` messages when recording starts or
+stops. Faults are set per instance and can be changed while running:
+- ``delay``: seconds before each reply;
+- ``fragment``: replies sent in chunks of that many bytes;
+- ``drop_after``: close a connection after that many commands.
+``disconnect_all()`` drops every open session.
+
+``FakeFtpServer`` serves each clip as ``<name>.mov`` (``media_dir`` puts the
+clips in a subfolder, like a HyperDeck's ``usb`` folder). Its content is
+deterministic filler of ``clip_bytes`` bytes, generated on the fly.
+
+Both are context managers and bind port 0 by default, so tests and the
+benchmark (``scripts/ingest_bench.py``) get free ports:
+
+    with FakeHyperDeck(clips=3) as deck, FakeFtpServer(deck) as ftp:
+        client = HyperDeckClient(deck.host, deck.port)
+"""
+from __future__ import annotations
+
+import argparse
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+PROTOCOL_VERSION = "1.11"
+MODEL = "HyperDeck Studio (simulated)"
+FRAME_RATE = 25
+FILLER = bytes(range(256)) * 256  # 64 KiB repeating pattern for synthetic media
+
+
+@dataclass
+class FakeClip:
+    name: str
+    frames: int
+    recorded_at: datetime
+
+    @property
+    def filename(self) -> str:
+        return f"{self.name}.mov"
+
+
+def timecode(frames: int, fps: int = FRAME_RATE) -> str:
+    seconds, ff = divmod(max(0, frames), fps)
+    minutes, ss = divmod(seconds, 60)
+    hh, mm = divmod(minutes, 60)
+    return f"{hh:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _Service:
+    """A TCP service on its own thread; ``port=0`` picks a free port."""
+
+    def __init__(self, handler, host: str, port: int):
+        self._server = _Server((host, port), handler)
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name=type(self).__name__, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class FakeHyperDeck(_Service):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        clips: int = 0,
+        delay: float = 0.0,
+        fragment: int = 0,
+        drop_after: int | None = None,
+        model: str = MODEL,
+    ):
+        super().__init__(_DeckHandler, host, port)
+        self.delay = delay
+        self.fragment = fragment
+        self.drop_after = drop_after
+        self.model = model
+        self.lock = threading.Lock()
+        self.clips: list[FakeClip] = [
+            FakeClip(f"Capture{n:04d}", FRAME_RATE * (30 + n), datetime.now()) for n in range(1, clips + 1)
+        ]
+        self.status = "stopped"
+        self.commands: dict[str, int] = {}
+        self.connections = 0
+        self._record_name = ""
+        self._record_started = 0.0
+        self._changed = False
+        self._sessions: set[_DeckHandler] = set()
+
+    @property
+    def recording(self) -> bool:
+        return self.status == "record"
+
+    def add_clip(self, name: str | None = None, seconds: float = 10.0) -> FakeClip:
+        with self.lock:
+            clip = FakeClip(name or f"Capture{len(self.clips) + 1:04d}", int(seconds * FRAME_RATE), datetime.now())
+            self.clips.append(clip)
+        return clip
+
+    def close(self) -> None:
+        self.disconnect_all()
+        super().close()
+
+    def disconnect_all(self) -> None:
+        with self.lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.drop()
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"connections": self.connections, "commands": dict(self.commands), "clips": len(self.clips)}
+
+    def handle(self, line: str, session: "_DeckHandler | None" = None) -> tuple[str, list[str] | None]:
+        """Reply to one command line: (status line, body lines or None)."""
+        verb, _, rest = line.partition(":")
+        verb = verb.strip().lower()
+        params = _params(rest)
+        with self.lock:
+            self.commands[verb] = self.commands.get(verb, 0) + 1
+            if verb in ("ping", "remote"):
+                return "200 ok", None
+            if verb == "notify":
+                if session is None:
+                    return "200 ok", None
+                if not params:
+                    return "209 notify:", [f"transport: {str(session.notify_transport).lower()}"]
+                if "transport" in params:
+                    session.notify_transport = params["transport"].lower() == "true"
+                return "200 ok", None
+            if verb == "transport info":
+                return "208 transport info:", self._transport_info()
+            if verb == "clips get":
+                body = [f"clip count: {len(self.clips)}"]
+                start = 0
+                for index, clip in enumerate(self.clips, 1):
+                    body.append(f"{index}: {clip.name} {timecode(start)} {timecode(clip.frames)}")
+                    start += clip.frames
+                return "205 clips info:", body
+            if verb == "record":
+                if self.status != "record":
+                    self._record_name = params.get("name") or f"Capture{len(self.clips) + 1:04d}"
+                    self._record_started = time.monotonic()
+                    self.status = "record"
+                    self._changed = True
+                return "200 ok", None
+            if verb == "stop":
+                if self.status == "record":
+                    frames = int((time.monotonic() - self._record_started) * FRAME_RATE)
+                    self.clips.append(FakeClip(self._record_name, max(1, frames), datetime.now()))
+                    self._changed = True
+                self.status = "stopped"
+                return "200 ok", None
+        return "100 syntax error", None
+
+    def notify_changes(self) -> None:
+        """Push ``508 transport info`` to subscribed sessions after a record/stop changed the transport."""
+        with self.lock:
+            if not self._changed:
+                return
+            self._changed = False
+            body = self._transport_info()
+            sessions = [s for s in self._sessions if s.notify_transport]
+        for session in sessions:
+            try:
+                session.send("508 transport info:", body)
+            except OSError:
+                pass
+
+    def _transport_info(self) -> list[str]:
+        recording = self.status == "record"
+        frames = int((time.monotonic() - self._record_started) * FRAME_RATE) if recording else 0
+        return [
+            f"status: {self.status}",
+            "speed: 0",
+            "slot id: 1",
+            f"clip id: {len(self.clips) + 1 if recording else (len(self.clips) or 'none')}",
+            f"display timecode: {timecode(frames)}",
+            f"timecode: {timecode(frames)}",
+            "video format: 1080p25",
+            "loop: false",
+        ]
+
+    def _register(self, session: "_DeckHandler", add: bool) -> None:
+        with self.lock:
+            if add:
+                self._sessions.add(session)
+                self.connections += 1
+            else:
+                self._sessions.discard(session)
+
+
+class _DeckHandler(socketserver.StreamRequestHandler):
+    def setup(self) -> None:
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.deck: FakeHyperDeck = self.server.owner
+        self.notify_transport = False
+        self._dropped = False
+        self._send_lock = threading.Lock()
+
+    def drop(self) -> None:
+        self._dropped = True
+        try:
+            self.request.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def handle(self) -> None:
+        deck = self.deck
+        deck._register(self, True)
+        try:
+            self.send("500 connection info:", [f"protocol version: {PROTOCOL_VERSION}", f"model: {deck.model}"])
+            served = 0
+            for raw in self.rfile:
+                line = raw.decode("ascii", errors="replace").strip()
+                if not line:
+                    continue
+                if line.lower() == "quit":
+                    self.send("200 ok", None)
+                    return
+                status, body = deck.handle(line, self)
+                if deck.delay:
+                    time.sleep(deck.delay)
+                self.send(status, body)
+                deck.notify_changes()
+                served += 1
+                if deck.drop_after is not None and served >= deck.drop_after:
+                    return
+        except OSError:
+            pass
+        finally:
+            deck._register(self, False)
+
+    def send(self, status: str, body: list[str] | None) -> None:
+        if self._dropped:
+            raise OSError("dropped")
+        text = status + "\r\n"
+        if body is not None:
+            text += "".join(f"{line}\r\n" for line in body) + "\r\n"
+        data = text.encode("utf-8")
+        size = self.deck.fragment
+        with self._send_lock:
+            if size and size > 0:
+                for i in range(0, len(data), size):
+                    self.request.sendall(data[i:i + size])
+            else:
+                self.request.sendall(data)
+
+
+class FakeFtpServer(_Service):
+    """Just enough FTP for ``copy_util``: PASV, MLSD/NLST/LIST, CWD, MDTM and RETR of each deck clip."""
+
+    def __init__(
+        self,
+        deck: FakeHyperDeck,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        clip_bytes: int = 4 * 1024 * 1024,
+        media_dir: str = "",
+        mlsd: bool = True,
+    ):
+        super().__init__(_FtpHandler, host, port)
+        self.deck = deck
+        self.clip_bytes = clip_bytes
+        self.media_dir = media_dir.strip("/")
+        self.mlsd = mlsd
+        self.bytes_sent = 0
+        self.retrievals = 0
+
+    def files(self, cwd: str) -> dict[str, FakeClip]:
+        if cwd.strip("/") != self.media_dir:
+            return {}
+        with self.deck.lock:
+            return {clip.filename: clip for clip in self.deck.clips}
+
+    def dirs(self, cwd: str) -> list[str]:
+        return [self.media_dir] if self.media_dir and cwd == "/" else []
+
+
+class _FtpHandler(socketserver.StreamRequestHandler):
+    def setup(self) -> None:
+        super().setup()
+        self.ftp: FakeFtpServer = self.server.owner
+        self.cwd = "/"
+        self._pasv: socket.socket | None = None
+
+    def handle(self) -> None:
+        self._reply("220 HyperDeck FTP (simulated)")
+        try:
+            for raw in self.rfile:
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                cmd, _, arg = line.partition(" ")
+                method = getattr(self, f"ftp_{cmd.upper()}", None)
+                if method is None:
+                    self._reply("502 Command not implemented")
+                elif method(arg) is False:
+                    return
+        except OSError:
+            pass
+        finally:
+            if self._pasv is not None:
+                self._pasv.close()
+
+    def _reply(self, text: str) -> None:
+        self.wfile.write((text + "\r\n").encode("utf-8"))
+
+    def _transfer(self, chunks) -> None:
+        if self._pasv is None:
+            self._reply("425 Use PASV first")
+            return
+        listener, self._pasv = self._pasv, None
+        self._reply("150 Opening data connection")
+        listener.settimeout(10)
+        try:
+            conn, _ = listener.accept()
+        finally:
+            listener.close()
+        with conn:
+            for chunk in chunks:
+                conn.sendall(chunk)
+        self._reply("226 Transfer complete")
+
+    def _path(self, arg: str) -> str:
+        if arg.startswith("/"):
+            return "/" + arg.strip("/")
+        if arg == "..":
+            return "/"
+        return "/" + "/".join(p for p in (self.cwd.strip("/"), arg.strip("/")) if p)
+
+    def ftp_USER(self, _arg):
+        self._reply("331 Password required")
+
+    def ftp_PASS(self, _arg):
+        self._reply("230 Logged in")
+
+    def ftp_SYST(self, _arg):
+        self._reply("215 UNIX Type: L8")
+
+    def ftp_TYPE(self, _arg):
+        self._reply("200 Type set")
+
+    def ftp_PWD(self, _arg):
+        self._reply(f'257 "{self.cwd}"')
+
+    def ftp_CWD(self, arg):
+        path = self._path(arg)
+        if path == "/" or path.strip("/") == self.ftp.media_dir:
+            self.cwd = path
+            self._reply("250 OK")
+        else:
+            self._reply("550 No such directory")
+
+    def ftp_PASV(self, _arg):
+        if self._pasv is not None:
+            self._pasv.close()
+        self._pasv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._pasv.bind((self.request.getsockname()[0], 0))
+        self._pasv.listen(1)
+        host, port = self._pasv.getsockname()
+        self._reply(f"227 Entering Passive Mode ({host.replace('.', ',')},{port >> 8},{port & 0xFF})")
+
+    def ftp_MLSD(self, _arg):
+        if not self.ftp.mlsd:
+            self._reply("500 MLSD not understood")
+            return
+        lines = [f"type=dir; {name}\r\n" for name in self.ftp.dirs(self.cwd)]
+        lines += [f"type=file;size={self.ftp.clip_bytes}; {name}\r\n" for name in self.ftp.files(self.cwd)]
+        self._transfer([("".join(lines)).encode("utf-8")])
+
+    def ftp_NLST(self, _arg):
+        names = self.ftp.dirs(self.cwd) + list(self.ftp.files(self.cwd))
+        self._transfer([("".join(f"{name}\r\n" for name in names)).encode("utf-8")])
+
+    def ftp_LIST(self, _arg):
+        lines = [f"drwxr-xr-x 1 deck deck 0 Jan 01 00:00 {name}\r\n" for name in self.ftp.dirs(self.cwd)]
+        lines += [
+            f"-rw-r--r-- 1 deck deck {self.ftp.clip_bytes} Jan 01 00:00 {name}\r\n"
+            for name in self.ftp.files(self.cwd)
+        ]
+        self._transfer([("".join(lines)).encode("utf-8")])
+
+    def ftp_MDTM(self, arg):
+        clip = self.ftp.files(self.cwd).get(arg.strip())
+        if clip is None:
+            self._reply("550 No such file")
+        else:
+            self._reply(f"213 {clip.recorded_at:%Y%m%d%H%M%S}")
+
+    def ftp_RETR(self, arg):
+        if self.ftp.files(self.cwd).get(arg.strip()) is None:
+            self._reply("550 No such file")
+            return
+        total = self.ftp.clip_bytes
+
+        def chunks():
+            left = total
+            while left > 0:
+                chunk = FILLER[:min(left, len(FILLER))]
+                left -= len(chunk)
+                yield chunk
+
+        self._transfer(chunks())
+        with self.ftp.deck.lock:
+            self.ftp.bytes_sent += total
+            self.ftp.retrievals += 1
+
+    def ftp_FEAT(self, _arg):
+        self._reply("211-Features:\r\n MDTM\r\n" + (" MLSD\r\n" if self.ftp.mlsd else "") + "211 End")
+
+    def ftp_NOOP(self, _arg):
+        self._reply("200 OK")
+
+    def ftp_QUIT(self, _arg):
+        self._reply("221 Bye")
+        return False
+
+
+def _params(rest: str) -> dict[str, str]:
+    """``name: X`` after the verb's colon (HyperDeck parameters are ``key: value``)."""
+    key, sep, value = rest.partition(":")
+    return {key.strip().lower(): value.strip()} if sep else {}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulated HyperDeck (Ethernet Protocol + FTP) for testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9993, help="HyperDeck protocol port")
+    parser.add_argument("--ftp-port", type=int, default=2121, help="FTP port (0 = no FTP)")
+    parser.add_argument("--clips", type=int, default=3, help="clips already on the disk")
+    parser.add_argument("--clip-mb", type=float, default=4.0, help="size of each synthetic clip file")
+    parser.add_argument("--media-dir", default="", help="FTP subfolder holding the clips (e.g. usb)")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds before each reply")
+    parser.add_argument("--fragment", type=int, default=0, help="send replies in chunks of N bytes")
+    parser.add_argument("--drop-after", type=int, help="close each connection after N commands")
+    args = parser.parse_args(argv)
+
+    deck = FakeHyperDeck(
+        args.host, args.port, clips=args.clips, delay=args.delay, fragment=args.fragment, drop_after=args.drop_after,
+    ).start()
+    ftp = None
+    if args.ftp_port:
+        ftp = FakeFtpServer(
+            deck, args.host, args.ftp_port, clip_bytes=int(args.clip_mb * 1024 * 1024), media_dir=args.media_dir,
+        ).start()
+    print(f"HyperDeck protocol on {deck.host}:{deck.port}" + (f", FTP on {ftp.host}:{ftp.port}" if ftp else ""))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        deck.close()
+        if ftp is not None:
+            ftp.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,492 @@
+"""UI-free ingest engine: follow the active cue, drive the HyperDeck, copy clips.
+
+``IngestEngine`` owns the API client, the deck client, the schedule and the
+copy queue, plus the recording state the follow loop works from. It reports
+to the outside only through ``IngestHooks`` callbacks, which are optional and
+called from worker threads. The Tk app (``app.py``) and the headless daemon
+(``ingest_daemon.py``) are both thin shells around it.
+
+Copies run on their own thread (``CopyQueue``), so the follow loop keeps
+polling, and can start the next recording, while a clip transfers.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from config_store import save_config
+from copy_util import CopyError, copy_from_ftp, unique_dest
+from hyperdeck_client import ClipInfo, HyperDeckClient
+from local_cache import LocalCache, cache_key, describe_age
+from names import (
+    DEFAULT_PATTERN,
+    apply_pattern,
+    cue_label,
+    hyperdeck_record_name,
+    item_needs_recording,
+)
+from ros_api import RosApi, RosApiError
+from schedule_store import SchedulePatch, ScheduleStore
+
+COPY_SETTLE_SECONDS = 1.5
+STOPPED_STATES = ("stopped", "done", "ended", "completed")
+
+
+@dataclass
+class IngestHooks:
+    """Callbacks into the shell; any may be None. ``status`` fields: ros, deck, cue, copy."""
+
+    log: Callable[[str, str], Any] | None = None
+    status: Callable[[str, str], Any] | None = None
+    pill: Callable[[str], Any] | None = None
+    clips: Callable[[list[ClipInfo]], Any] | None = None
+    schedule: Callable[[SchedulePatch], Any] | None = None
+    session_ended: Callable[[str], Any] | None = None
+
+
+class CopyQueue:
+    """Runs copy jobs one at a time, in order, on a background thread."""
+
+    def __init__(self, log: Callable[[str, str], Any]):
+        self._log = log
+        self._jobs: queue.Queue = queue.Queue()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self.pending = 0
+        self.done = 0
+        self.failed = 0
+        self.current = ""
+        self.last_error = ""
+
+    def submit(self, label: str, fn: Callable[[], Any]) -> None:
+        with self._cond:
+            self.pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ingest-copy", daemon=True)
+                self._thread.start()
+        self._jobs.put((label, fn))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every submitted job has finished; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.pending == 0, timeout)
+
+    def close(self) -> None:
+        self._jobs.put(None)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "pending": self.pending,
+                "done": self.done,
+                "failed": self.failed,
+                "current": self.current,
+                "last_error": self.last_error,
+            }
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            label, fn = job
+            with self._cond:
+                self.current = label
+            ok = True
+            try:
+                fn()
+            except Exception as exc:
+                ok = False
+                self._log(str(exc), "error")
+            with self._cond:
+                self.pending -= 1
+                self.current = ""
+                if ok:
+                    self.done += 1
+                else:
+                    self.failed += 1
+                    self.last_error = label
+                self._cond.notify_all()
+
+
+class IngestEngine:
+    def __init__(
+        self,
+        settings: dict,
+        *,
+        cache: LocalCache,
+        hooks: IngestHooks | None = None,
+        config_file: str | None = None,
+    ):
+        self.settings = dict(settings)
+        self.cache = cache
+        self.hooks = hooks or IngestHooks()
+        self.config_file = config_file
+        self.api = RosApi(self.settings.get("api_base_url") or "", self.settings.get("api_token") or "")
+        self.deck = HyperDeckClient(
+            str(self.settings.get("hyperdeck_host") or ""),
+            int(self.settings.get("hyperdeck_port") or 9993),
+        )
+        self.event: dict = {}
+        self.schedule = ScheduleStore()  # rows kept across refreshes, O(1) lookup by item id
+        self.clips: list[ClipInfo] = []
+        self.copied_keys = set(str(x) for x in (self.settings.get("copied_keys") or []))
+        self.copies = CopyQueue(self.log)
+        self.following = False
+        self._follow_thread: threading.Thread | None = None
+        self._end_lock = threading.Lock()
+        self._last_item_id = None
+        self._last_running = False
+        self._recording_item_id = None
+        self._recording_clip_name = ""
+        self._recording_meta: dict = {}
+        self._recording_seen_running = False
+        self._completed_record_item_ids: set[str] = set()
+        self._status: dict[str, str] = {"ros": "", "deck": "", "cue": "", "copy": ""}
+        self.last_poll = 0.0
+        self.poll_errors = 0
+
+    # -- settings / reporting -------------------------------------------------
+
+    @property
+    def event_id(self) -> str:
+        return str(self.settings.get("event_id") or "").strip()
+
+    def configure(self, settings: dict, event: dict | None = None) -> RosApi:
+        """Adopt new settings; the API client is rebuilt when its URL or token changed."""
+        self.settings = dict(settings)
+        if event is not None:
+            self.event = event
+        api = RosApi(self.settings.get("api_base_url") or "", self.settings.get("api_token") or "")
+        if (api.base_url, api.token) != (self.api.base_url, self.api.token):
+            self.api = api
+        return self.api
+
+    def save(self) -> dict:
+        data = dict(self.settings)
+        data["copied_keys"] = sorted(self.copied_keys)
+        self.settings = save_config(data, self.config_file)
+        return self.settings
+
+    def log(self, message: str, level: str = "info") -> None:
+        if self.hooks.log:
+            self.hooks.log(message, level)
+
+    def set_status(self, field: str, text: str) -> None:
+        self._status[field] = text
+        if self.hooks.status:
+            self.hooks.status(field, text)
+
+    def _pill(self, kind: str) -> None:
+        if self.hooks.pill:
+            self.hooks.pill(kind)
+
+    def status(self) -> dict:
+        """JSON-able snapshot for the daemon's status endpoint."""
+        return {
+            "event_id": self.event_id,
+            "event_name": str(self.event.get("name") or ""),
+            "following": self.following,
+            "recording": None if self._recording_item_id is None else {
+                "item_id": self._recording_item_id,
+                "clip": self._recording_clip_name,
+            },
+            "deck": {"host": self.deck.host, "connected": self.deck.connected, "model": self.deck.model},
+            "schedule_cues": len(self.schedule),
+            "status": dict(self._status),
+            "last_poll_age_s": round(time.time() - self.last_poll, 1) if self.last_poll else None,
+            "poll_errors": self.poll_errors,
+            "copies": self.copies.stats(),
+        }
+
+    # -- schedule ---------------------------------------------------------------
+
+    def refresh_schedule(self) -> SchedulePatch:
+        eid = self.event_id
+        if not eid:
+            raise RosApiError("Select an event first")
+        key = cache_key(self.api.base_url, "schedule", eid)
+        try:
+            patch = self.schedule.replace(self.api.schedule_items(eid))
+            self.cache.put(key, self.schedule.items)
+            if not patch.empty:
+                self.log(f"Schedule: {len(self.schedule)} cues ({patch.describe()})")
+        except RosApiError as exc:
+            cached = self.cache.get(key)
+            if cached is None:
+                raise
+            patch = self.schedule.replace(cached.value)
+            self.log(f"{exc} — using schedule cached {describe_age(cached.age)} ago ({len(self.schedule)} cues)", "error")
+        if not patch.empty and self.hooks.schedule:
+            self.hooks.schedule(patch)
+        return patch
+
+    def item_by_id(self, item_id) -> dict | None:
+        return self.schedule.get(item_id)
+
+    def marked_count(self) -> int:
+        return sum(1 for item in self.schedule if item_needs_recording(item))
+
+    # -- deck / clips -------------------------------------------------------------
+
+    def connect_deck(self) -> str:
+        self.deck.host = str(self.settings.get("hyperdeck_host") or "").strip()
+        self.deck.port = int(self.settings.get("hyperdeck_port") or 9993)
+        model = self.deck.connect()
+        self.log(f"HyperDeck connected: {model or self.deck.host}", "ok")
+        self.set_status("deck", model or "Connected")
+        return model
+
+    def refresh_clips(self) -> list[ClipInfo]:
+        self.clips = self.deck.clips()
+        if self.hooks.clips:
+            self.hooks.clips(self.clips)
+        return self.clips
+
+    def clip_key(self, clip: ClipInfo) -> str:
+        return f"{clip.index}:{clip.name}"
+
+    def dest_name(self, item: dict | None, clip_name: str) -> str:
+        ev = self.event
+        pattern = str(self.settings.get("name_pattern") or "").strip() or DEFAULT_PATTERN
+        return apply_pattern(
+            pattern,
+            event_name=str(ev.get("name") or "Event"),
+            event_date=str(ev.get("date") or ""),
+            segment=str((item or {}).get("segmentName") or clip_name or "Segment"),
+            cue=cue_label(item),
+            clip=clip_name,
+        )
+
+    def copy_clip(self, clip: ClipInfo, item: dict | None) -> str:
+        target = str(self.settings.get("target_folder") or "").strip()
+        if not target:
+            raise CopyError("Set a target folder")
+        stem = self.dest_name(item, clip.name)
+        dest = unique_dest(target, stem + ".mov")
+        path = copy_from_ftp(
+            str(self.settings.get("hyperdeck_host") or "").strip(),
+            clip.name,
+            dest,
+            port=int(self.settings.get("ftp_port") or 21),
+            user=str(self.settings.get("ftp_user") or "anonymous").strip(),
+            password=str(self.settings.get("ftp_password") or ""),
+            log=self.log,
+        )
+        self.copied_keys.add(self.clip_key(clip))
+        self.save()
+        self.set_status("copy", os.path.basename(path))
+        if self.hooks.clips:
+            self.hooks.clips(self.clips)
+        self.log(f"Copied → {path}", "ok")
+        return path
+
+    def copy_last(self) -> None:
+        item = self.item_by_id(self._recording_item_id or self._last_item_id)
+
+        def job():
+            self.refresh_clips()
+            if not self.clips:
+                raise CopyError("No clips on the HyperDeck")
+            self.copy_clip(self.clips[-1], item)
+
+        self.copies.submit("last clip", job)
+
+    # -- recording ------------------------------------------------------------------
+
+    def _start_recording(self, item: dict | None, name: str, running: bool = False) -> None:
+        self.deck.record(name)
+        self._recording_item_id = (item or {}).get("id")
+        self._recording_clip_name = name
+        self._recording_meta = item or {}
+        self._recording_seen_running = running
+        self.set_status("deck", f"Recording {name}")
+        self._pill("recording")
+
+    def manual_record(self) -> None:
+        item = self.item_by_id(self._last_item_id)
+        name = hyperdeck_record_name(
+            cue=cue_label(item),
+            segment=str((item or {}).get("segmentName") or "clip"),
+        )
+        self._start_recording(item, name)
+        self.log(f"Recording as {name}", "ok")
+
+    def stop_and_maybe_copy(self) -> None:
+        """Stop the deck now; the clip copy (if auto copy is on) is queued."""
+        self.deck.stop()
+        self.log("HyperDeck stop")
+        self.set_status("deck", "Stopped")
+        self._pill("following" if self.following else "stopped")
+        item = self._recording_meta or self.item_by_id(self._recording_item_id)
+        finished_item_id = str(self._recording_item_id) if self._recording_item_id is not None else ""
+        clip_name = self._recording_clip_name
+        self._recording_item_id = None
+        self._recording_clip_name = ""
+        self._recording_meta = {}
+        if finished_item_id:
+            self._completed_record_item_ids.add(finished_item_id)
+        self._recording_seen_running = False
+        if self.settings.get("auto_copy") is False:
+            self.refresh_clips()
+            return
+
+        def job():
+            time.sleep(COPY_SETTLE_SECONDS)
+            self.refresh_clips()
+            if not self.clips:
+                raise CopyError("Stopped, but no clips listed yet")
+            clip = self.clips[-1]
+            if clip_name:
+                match = next((c for c in reversed(self.clips) if c.name == clip_name), None)
+                if match:
+                    clip = match
+            self.copy_clip(clip, item)
+
+        self.copies.submit(clip_name or "clip", job)
+
+    # -- follow ---------------------------------------------------------------------
+
+    def start_follow(self, note: str = "") -> None:
+        """Connect the deck if needed, load the schedule and start polling; raises if that fails."""
+        if self.following:
+            return
+        if not self.event_id:
+            raise RosApiError("Select an event first")
+        if not self.deck.connected:
+            self.connect_deck()
+        self.refresh_schedule()
+        self._completed_record_item_ids = set()
+        self._recording_seen_running = False
+        self.following = True
+        self._pill("following")
+        self.log(f"Follow started{note}", "ok")
+        self._follow_thread = threading.Thread(target=self._follow_loop, name="ingest-follow", daemon=True)
+        self._follow_thread.start()
+
+    def end_follow(self, auto: bool = False, session_expired: bool = False, label: str = "") -> None:
+        """Stop polling (and any recording). ``auto``/``session_expired`` also drop the deck; ``label`` is the session length."""
+        if not self._end_lock.acquire(blocking=False):
+            return
+        try:
+            was_following = self.following
+            was_recording = self._recording_item_id is not None
+            self.following = False
+            if was_recording:
+                try:
+                    self.stop_and_maybe_copy()
+                except Exception as exc:
+                    self.log(str(exc), "error")
+            if session_expired or auto:
+                self.copies.wait()  # let the last clip finish copying before the deck goes away
+                try:
+                    self.deck.disconnect()
+                except Exception:
+                    pass
+                self.set_status("deck", "Disconnected")
+                notice = (
+                    f"Railway session ended after {label}. Restart the app to poll again."
+                    if label
+                    else "Railway session ended. Restart the app to poll again."
+                )
+                self.log(notice)
+                if self.hooks.session_ended:
+                    self.hooks.session_ended(notice)
+            elif was_following:
+                self.log("Follow stopped")
+            self._pill("stopped")
+            self.set_status("ros", "Follow stopped" if was_following else "Session ended")
+        finally:
+            self._end_lock.release()
+
+    def close(self) -> None:
+        self.following = False
+        self.copies.close()
+        self.deck.disconnect()
+
+    def _follow_loop(self) -> None:
+        poll = max(1, int(self.settings.get("poll_seconds") or 1))
+        while self.following:
+            try:
+                self.tick()
+            except Exception as exc:
+                self.poll_errors += 1
+                self.log(str(exc), "error")
+                self.set_status("ros", str(exc))
+            time.sleep(poll)
+
+    def _cue_timer_stopped(self, timer: dict | None, item_id) -> bool:
+        """True when the given cue's timer has stopped/completed (not merely unloaded)."""
+        if timer is None:
+            return False
+        if str(timer.get("item_id")) != str(item_id):
+            return False
+        state = str(timer.get("timer_state") or "").lower()
+        running = timer.get("is_running") is True or state == "running"
+        if state in STOPPED_STATES:
+            return True
+        if self._recording_seen_running and not running:
+            return True
+        return False
+
+    def tick(self) -> None:
+        """One poll of /api/active-timers: start or stop recording as the loaded cue changes."""
+        timer = self.api.get_active_timer(self.event_id)
+        self.last_poll = time.time()
+
+        if self._recording_item_id is not None and timer is None:
+            self.stop_and_maybe_copy()
+            self._last_running = False
+            self._last_item_id = None
+            self.set_status("cue", "None")
+            return
+
+        if not timer:
+            self.set_status("cue", "None")
+            self._last_running = False
+            self._last_item_id = None
+            return
+
+        item_id = timer.get("item_id")
+        state = str(timer.get("timer_state") or "").lower()
+        running = timer.get("is_running") is True or state == "running"
+        item = self.item_by_id(item_id)
+        if item is None:
+            try:
+                self.refresh_schedule()
+                item = self.item_by_id(item_id)
+            except Exception:
+                pass
+        marked = item_needs_recording(item)
+        cue = cue_label(item)
+        segment = str((item or {}).get("segmentName") or "")
+        rec = "REC" if marked else "—"
+        state_label = "running" if running else (state or "loaded")
+        if self._recording_item_id is not None and str(self._recording_item_id) == str(item_id):
+            state_label = f"{state_label} · recording"
+        self.set_status("cue", f"{cue or item_id}  {segment}  [{state_label}]  {rec}")
+        self.set_status("ros", "Polling OK")
+
+        if self._recording_item_id is not None and str(self._recording_item_id) == str(item_id):
+            if running:
+                self._recording_seen_running = True
+            if self._cue_timer_stopped(timer, self._recording_item_id):
+                self.stop_and_maybe_copy()
+
+        if (
+            marked
+            and self._recording_item_id is None
+            and state in ("loaded", "running")
+            and str(item_id) not in self._completed_record_item_ids
+        ):
+            name = hyperdeck_record_name(cue=cue, segment=segment or "clip")
+            self._start_recording(item, name, running)
+            self._recording_item_id = item_id
+            self.log(f"Auto-record on load: {name}", "ok")
+
+        self._last_item_id = item_id
+        self._last_running = running
@@ -0,0 +1,184 @@
+"""Headless ingest: the follow engine without Tk, for a rack machine with no display.
+
+Reads the same ``config.json`` as the GUI (or another one via ``--config``),
+follows the event, and serves status as JSON on a local HTTP port:
+
+    python ingest_daemon.py --event 123 --port 8765
+    curl http://127.0.0.1:8765/status
+
+``GET /status`` returns ``IngestEngine.status()``, ``GET /log`` the last log
+lines. Run one process per deck, each with its own ``--config`` and
+``--port``. SIGINT/SIGTERM stop following (the current clip is stopped and
+copied first) and exit.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config_store import APP_DIR_NAME, config_dir, config_path, load_config
+from ingest_core import IngestEngine, IngestHooks
+from local_cache import CACHE_NAME, LocalCache, cache_key
+from log_sink import LogSink
+
+DEFAULT_PORT = 8765
+RETRY_SECONDS = 10
+
+
+class StatusServer:
+    """Read-only HTTP/JSON status endpoint on its own thread."""
+
+    def __init__(self, engine: IngestEngine, log_lines, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        engine_ref, lines_ref = engine, log_lines
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0].rstrip("/")
+                if path in ("", "/status"):
+                    self._send(200, engine_ref.status())
+                elif path == "/log":
+                    self._send(200, {"lines": [line.rstrip("\n") for line in lines_ref()]})
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def _send(self, code: int, body: dict) -> None:
+                data = json.dumps(body, default=str).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *_args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="ingest-status", daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _session_seconds(args, cfg: dict) -> float | None:
+    """Railway session length like the GUI's session timer; None = never stop."""
+    if args.never or (args.hours is None and args.minutes is None and cfg.get("auto_stop_never")):
+        return None
+    hours = args.hours if args.hours is not None else int(cfg.get("auto_stop_hours") or 0)
+    minutes = args.minutes if args.minutes is not None else int(cfg.get("auto_stop_minutes") or 0)
+    seconds = (max(0, hours) * 60 + max(0, minutes)) * 60
+    return seconds or None
+
+
+def _find_event(engine: IngestEngine, cache: LocalCache) -> dict:
+    """Event name/date for clip names: from the API, else the cached event list."""
+    key = cache_key(engine.api.base_url, "events")
+    try:
+        events = engine.api.list_events()
+        cache.put(key, events)
+    except Exception as exc:
+        cached = cache.get(key)
+        events = cached.value if cached else []
+        engine.log(f"Event list unavailable ({exc}); using cached copy" if cached else f"Event list unavailable ({exc})", "error")
+    for ev in events or []:
+        if str(ev.get("id")) == engine.event_id:
+            return ev
+    return {"id": engine.event_id, "name": "", "date": ""}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ROS HyperDeck Ingest without a GUI.")
+    parser.add_argument("--config", help=f"config file (default: {config_path()})")
+    parser.add_argument("--event", help="event id (default: event_id from the config)")
+    parser.add_argument("--host", default="127.0.0.1", help="status endpoint bind address")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="status endpoint port (0 = none)")
+    parser.add_argument("--hours", type=int, help="stop polling after this many hours")
+    parser.add_argument("--minutes", type=int, help="... plus this many minutes")
+    parser.add_argument("--never", action="store_true", help="no session timer")
+    args = parser.parse_args(argv)
+
+    config_file = os.path.abspath(args.config) if args.config else None
+    cfg = load_config(config_file)
+    if args.event:
+        cfg["event_id"] = args.event
+    base_dir = os.path.dirname(config_file) if config_file else config_dir()
+    name = APP_DIR_NAME
+    if config_file:
+        name = f"{APP_DIR_NAME}-{os.path.splitext(os.path.basename(config_file))[0]}"
+
+    sink = LogSink(name, os.path.join(base_dir, "logs"), console=True)
+    try:
+        cache = LocalCache(os.path.join(base_dir, CACHE_NAME))
+    except Exception:
+        cache = LocalCache(":memory:")
+    stop = threading.Event()
+    engine = IngestEngine(
+        cfg,
+        cache=cache,
+        hooks=IngestHooks(
+            log=lambda message, level: sink.log(message, "ok" if level == "ok" else "error" if level == "error" else ""),
+            session_ended=lambda _notice: stop.set(),
+        ),
+        config_file=config_file,
+    )
+    if not engine.event_id:
+        sink.log("No event: pass --event or set event_id in the config", "error")
+        sink.close()
+        return 2
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(sig, lambda *_: stop.set())
+        except (ValueError, OSError):
+            pass
+
+    server = None
+    if args.port:
+        server = StatusServer(engine, sink.recent, args.host, args.port)
+        server.start()
+        sink.log(f"Status: {server.address}/status")
+
+    engine.event = _find_event(engine, cache)
+    session = _session_seconds(args, cfg)
+    ends_at = time.monotonic() + session if session else None
+    label = f"{int(session // 3600)}h {int(session % 3600 // 60)}m" if session else ""
+    try:
+        while not stop.is_set() and not engine.following:
+            try:
+                engine.start_follow(f" — event {engine.event_id}" + (f", session {label}" if label else ", no session timer"))
+            except Exception as exc:
+                sink.log(f"Cannot start: {exc} — retrying in {RETRY_SECONDS}s", "error")
+                stop.wait(RETRY_SECONDS)
+        while not stop.is_set():
+            if ends_at is not None and time.monotonic() >= ends_at:
+                engine.end_follow(auto=True, session_expired=True, label=label)
+                break
+            stop.wait(1.0)
+    finally:
+        if engine.following:
+            engine.end_follow(auto=False)
+        engine.copies.wait(timeout=120)
+        engine.close()
+        if server is not None:
+            server.stop()
+        cache.close()
+        sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,141 @@
+"""Bounded app log built on stdlib ``logging``.
+
+Every line goes to an in-memory ring buffer (last ``max_lines``) and, through
+a ``QueueHandler``/``QueueListener`` pair, to a rotating file written off the
+UI thread. The Tk text widget is fed in batches from the ring buffer and
+trimmed so it never holds more than ``max_lines`` lines, however long the
+show runs.
+"""
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import os
+import queue
+from collections import deque
+from typing import Callable
+
+DEFAULT_MAX_LINES = 2000
+LOG_FILE_BYTES = 2 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+
+_LEVELS = {"error": logging.ERROR, "warning": logging.WARNING}
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the newest formatted lines; ``drain`` returns what the widget has not shown yet."""
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, notify: Callable[[], None] | None = None):
+        super().__init__()
+        self.lines: deque[tuple[str, str]] = deque(maxlen=max_lines)
+        self._pending: deque[tuple[str, str]] = deque(maxlen=max_lines)
+        self.notify = notify
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = (self.format(record) + "\n", getattr(record, "tag", "") or "")
+        except Exception:
+            self.handleError(record)
+            return
+        self.lines.append(entry)
+        self._pending.append(entry)
+        if self.notify is not None:
+            self.notify()
+
+    def drain(self) -> list[tuple[str, str]]:
+        with self.lock:
+            items = list(self._pending)
+            self._pending.clear()
+        return items
+
+
+class LogSink:
+    def __init__(
+        self,
+        name: str,
+        log_dir: str | None = None,
+        *,
+        max_lines: int = DEFAULT_MAX_LINES,
+        console: bool = False,
+    ):
+        self.max_lines = max_lines
+        self.widget = None
+        self.path = ""
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+        self.ring = RingBufferHandler(max_lines)
+        self.ring.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+        self.logger.addHandler(self.ring)
+
+        outputs: list[logging.Handler] = []
+        file_fmt = logging.Formatter("%(asctime)s %(levelname)-7s %(message)s")
+        if log_dir:
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                self.path = os.path.join(log_dir, f"{name}.log")
+                fh = logging.handlers.RotatingFileHandler(
+                    self.path, maxBytes=LOG_FILE_BYTES, backupCount=LOG_FILE_BACKUPS, encoding="utf-8"
+                )
+                fh.setFormatter(file_fmt)
+                outputs.append(fh)
+            except OSError:
+                self.path = ""
+        if console:
+            sh = logging.StreamHandler()
+            sh.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+            outputs.append(sh)
+
+        self._listener: logging.handlers.QueueListener | None = None
+        if outputs:
+            q: queue.Queue = queue.Queue(-1)
+            self.logger.addHandler(logging.handlers.QueueHandler(q))
+            self._listener = logging.handlers.QueueListener(q, *outputs, respect_handler_level=True)
+            self._listener.start()
+
+    def log(self, message: str, tag: str = "") -> None:
+        """Thread-safe. ``tag`` is the text-widget tag (``error``/``warning`` also set the level)."""
+        self.logger.log(_LEVELS.get(tag, logging.INFO), message, extra={"tag": tag})
+
+    def attach(self, widget, notify: Callable[[], None]) -> None:
+        """Feed ``widget`` from the ring buffer; ``notify`` must schedule ``flush`` on the UI thread."""
+        self.widget = widget
+        self.ring.notify = notify
+        notify()
+
+    def recent(self) -> list[str]:
+        """The ring buffer's lines, oldest first (the headless daemon's ``GET /log``)."""
+        return [line for line, _tag in list(self.ring.lines)]
+
+    def flush(self) -> None:
+        """UI thread: insert pending lines in one call and trim the oldest past ``max_lines``."""
+        widget = self.widget
+        entries = self.ring.drain()
+        if widget is None or not entries:
+            return
+        args: list[str] = []
+        for line, tag in entries:
+            args.extend((line, tag))
+        widget.insert("end", *args)
+        lines = int(widget.index("end-1c").split(".")[0])
+        excess = lines - self.max_lines
+        if excess > 0:
+            widget.delete("1.0", f"{excess + 1}.0")
+        widget.see("end")
+
+    def clear(self) -> None:
+        self.ring.drain()
+        if self.widget is not None:
+            self.widget.delete("1.0", "end")
+
+    def close(self) -> None:
+        self.ring.notify = None
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
@@ -2,6 +2,7 @@
 
 Uses Admin → Integration tokens (ros_itok_…) on /api/* routes.
 Cue follow is REST poll of /api/active-timers (Companion / vMix pattern).
+``requests`` is imported on the first call, not at startup.
 """
 from __future__ import annotations
 
@@ -9,8 +10,6 @@ import json
 import re
 from typing import Any
 
-import requests
-
 INTEGRATION_PREFIX = "ros_itok_"
 
 
@@ -57,6 +56,8 @@ class RosApi:
         if not self.base_url:
             raise RosApiError("API base URL is required")
         url = f"{self.base_url}{path if path.startswith('/') else '/' + path}"
+        import requests
+
         try:
             res = requests.get(url, headers=self._headers(), timeout=self.timeout)
         except requests.RequestException as exc:
@@ -77,6 +78,8 @@ class RosApi:
 
     def health(self) -> None:
         url = f"{self.base_url}/health"
+        import requests
+
         try:
             res = requests.get(url, timeout=self.timeout)
         except requests.RequestException as exc:
@@ -0,0 +1,149 @@
+"""Schedule rows kept across refreshes and updated per item.
+
+``ScheduleStore.replace`` takes a full ``schedule_items`` list (an API fetch
+or a ``runOfShowDataUpdated`` socket payload) and compares it with what is
+held, row by row, using a content hash per item id. Rows whose hash did not
+change keep their existing dict, so the held list changes only where the
+schedule did.
+
+It returns a ``SchedulePatch`` naming the added, removed and changed ids,
+so the UI can redraw just those rows. A changed row whose ``day`` moved
+sets ``regrouped``: it leaves one day's view and joins another, so that is
+not a rows-only change. When ids are missing or duplicated the
+rows cannot be matched, and the patch says ``reset``: redraw everything.
+
+The OSC app and the HyperDeck ingest app ship identical copies of this
+module; change both.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+
+def item_key(item: Any) -> str | None:
+    if not isinstance(item, dict) or item.get("id") is None:
+        return None
+    return str(item["id"])
+
+
+def item_hash(item: Any) -> bytes:
+    data = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest()
+
+
+@dataclass(frozen=True)
+class SchedulePatch:
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    changed: tuple[str, ...] = ()
+    reordered: bool = False
+    regrouped: bool = False  # a changed row moved to another day
+    reset: bool = False
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.reordered or self.reset)
+
+    @property
+    def rows_only(self) -> bool:
+        """Only existing rows changed content: same rows, same days, same order."""
+        return bool(self.changed) and not (
+            self.added or self.removed or self.reordered or self.regrouped or self.reset)
+
+    def describe(self) -> str:
+        if self.reset:
+            return "reloaded"
+        if self.empty:
+            return "unchanged"
+        parts = [f"{len(ids)} {label}" for ids, label in (
+            (self.changed, "changed"), (self.added, "added"), (self.removed, "removed")) if ids]
+        if self.reordered:
+            parts.append("reordered")
+        if self.regrouped:
+            parts.append("moved between days")
+        return ", ".join(parts)
+
+
+class ScheduleStore:
+    def __init__(self, items: Iterable[dict] | None = None):
+        self.items: list[dict] = []
+        self._hashes: dict[str, bytes] = {}
+        self._index: dict[str, int] = {}
+        self._source: Any = None
+        self._keyed = True
+        if items is not None:
+            self.replace(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def get(self, item_id) -> dict | None:
+        index = self._index.get(str(item_id))
+        return self.items[index] if index is not None else None
+
+    def clear(self) -> SchedulePatch:
+        return self.replace([])
+
+    def replace(self, items: Iterable[dict]) -> SchedulePatch:
+        """Diff a full schedule against the held rows and keep unchanged rows as they are."""
+        if items is self._source and items is not None:
+            return SchedulePatch()  # same decoded body (e.g. a 304 reuse): nothing to compare
+        source = items
+        items = list(items or [])
+        keys = [item_key(item) for item in items]
+        if None in keys or len(set(keys)) != len(keys):
+            had_rows = bool(self.items)
+            self._load(items, keyed=False)
+            self._source = source
+            return SchedulePatch(reset=had_rows or bool(items))
+        if not self._keyed:
+            self._load(items, keyed=True)
+            self._source = source
+            return SchedulePatch(reset=True)
+
+        old_order = [item_key(item) for item in self.items]
+        hashes: dict[str, bytes] = {}
+        merged: list[dict] = []
+        added, changed = [], []
+        regrouped = False
+        for key, item in zip(keys, items):
+            digest = item_hash(item)
+            hashes[key] = digest
+            previous = self._hashes.get(key)
+            if previous is None:
+                added.append(key)
+                merged.append(item)
+            elif previous != digest:
+                changed.append(key)
+                merged.append(item)
+                regrouped = regrouped or item.get('day', 1) != self.items[self._index[key]].get('day', 1)
+            else:
+                merged.append(self.items[self._index[key]])
+        removed = [key for key in old_order if key not in hashes]
+        kept_new = [key for key in keys if key in self._hashes]
+        kept_old = [key for key in old_order if key in hashes]
+        self.items = merged
+        self._hashes = hashes
+        self._index = {key: i for i, key in enumerate(keys)}
+        self._source = source
+        return SchedulePatch(tuple(added), tuple(removed), tuple(changed), kept_new != kept_old, regrouped)
+
+    def _load(self, items: list[dict], keyed: bool) -> None:
+        self.items = items
+        self._keyed = keyed
+        if keyed:
+            self._hashes = {item_key(item): item_hash(item) for item in items}
+            self._index = {item_key(item): i for i, item in enumerate(items)}
+        else:
+            self._hashes = {}
+            self._index = {}
+            for i, item in enumerate(items):
+                key = item_key(item)
+                if key is not None:
+                    self._index.setdefault(key, i)
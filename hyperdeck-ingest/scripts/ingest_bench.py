@@ -0,0 +1,160 @@
+"""HyperDeck client and copy path against the local simulator (no hardware).
+
+    python scripts/ingest_bench.py [--seconds 1.0] [--clip-mb 64] [--json]
+
+Starts ``fake_hyperdeck.FakeHyperDeck`` and ``FakeFtpServer`` on free ports,
+then measures:
+- protocol round trips with clean, fragmented and delayed replies;
+- ``clips get`` on a full disk;
+- connect, and reconnect after the deck drops the session;
+- FTP copy throughput;
+- a full record → stop → copy cycle through ``IngestEngine``.
+
+The engine cycle skips the copy settle delay, so it times the path itself.
+``--json`` prints one machine-readable object for CI to compare runs. Exits
+non-zero if a case fails.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ingest_core  # noqa: E402
+from copy_util import copy_from_ftp  # noqa: E402
+from fake_hyperdeck import FakeFtpServer, FakeHyperDeck  # noqa: E402
+from hyperdeck_client import HyperDeckClient, HyperDeckError  # noqa: E402
+from ingest_core import IngestEngine  # noqa: E402
+from local_cache import LocalCache  # noqa: E402
+
+
+def timed(fn, seconds, min_runs=5):
+    """Run ``fn`` repeatedly for ``seconds``; per-call latencies in ms."""
+    samples = []
+    deadline = time.perf_counter() + seconds
+    while len(samples) < min_runs or time.perf_counter() < deadline:
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def row(name, samples, **extra):
+    ordered = sorted(samples)
+    return {
+        "case": name,
+        "runs": len(samples),
+        "per_sec": 1000.0 * len(samples) / sum(samples) if sum(samples) else 0.0,
+        "p50_ms": statistics.median(ordered),
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        **extra,
+    }
+
+
+def protocol_cases(seconds):
+    rows = []
+    for label, opts in (
+        ("transport info", {}),
+        ("transport info, 3-byte fragments", {"fragment": 3}),
+        ("transport info, 5 ms reply delay", {"delay": 0.005}),
+    ):
+        with FakeHyperDeck(**opts) as deck:
+            client = HyperDeckClient(deck.host, deck.port, timeout=5)
+            client.connect()
+            rows.append(row(label, timed(client.transport_info, seconds)))
+            client.disconnect()
+    with FakeHyperDeck(clips=200) as deck:
+        client = HyperDeckClient(deck.host, deck.port, timeout=5)
+        client.connect()
+        rows.append(row("clips get, 200 clips", timed(client.clips, seconds)))
+        rows.append(row("connect", timed(client.connect, seconds)))
+        client.disconnect()
+    with FakeHyperDeck(drop_after=2) as deck:
+        client = HyperDeckClient(deck.host, deck.port, timeout=5)
+
+        def drop_and_reconnect():
+            client.connect()  # "remote: enable" is command 1
+            client.ping()     # command 2; the deck hangs up after it
+            try:
+                client.ping()
+            except HyperDeckError:
+                return
+            raise AssertionError("deck did not drop the session")
+
+        rows.append(row("connect, drop, detect", timed(drop_and_reconnect, seconds)))
+    return rows
+
+
+def copy_case(clip_mb, dest):
+    with FakeHyperDeck(clips=2) as deck, FakeFtpServer(deck, clip_bytes=int(clip_mb * 1024 * 1024), media_dir="usb") as ftp:
+        samples = []
+        for _ in range(3):
+            started = time.perf_counter()
+            path = copy_from_ftp(ftp.host, "Capture0002", os.path.join(dest, "copy.mov"), port=ftp.port, retries=1)
+            samples.append((time.perf_counter() - started) * 1000.0)
+            assert os.path.getsize(path) == ftp.clip_bytes
+            os.remove(path)
+    best = min(samples) / 1000.0
+    return row(f"FTP copy, {clip_mb:g} MB", samples, mb_per_sec=clip_mb / best if best else 0.0)
+
+
+def engine_case(dest, cycles=5):
+    ingest_core.COPY_SETTLE_SECONDS = 0.0  # time the path, not the deliberate wait
+    errors = []
+    with FakeHyperDeck(clips=1) as deck, FakeFtpServer(deck, clip_bytes=1024 * 1024) as ftp:
+        cache = LocalCache(":memory:")
+        engine = IngestEngine(
+            {
+                "hyperdeck_host": deck.host,
+                "hyperdeck_port": deck.port,
+                "ftp_port": ftp.port,
+                "target_folder": dest,
+            },
+            cache=cache,
+            hooks=ingest_core.IngestHooks(log=lambda message, level: level == "error" and errors.append(message)),
+            config_file=os.path.join(dest, "config.json"),
+        )
+        engine.connect_deck()
+        samples = []
+        for n in range(cycles):
+            item = {"id": n, "segmentName": f"Segment {n}", "customFields": {"cue": str(n)}}
+            started = time.perf_counter()
+            engine._start_recording(item, f"CUE{n} Segment {n}")
+            engine.stop_and_maybe_copy()
+            if not engine.copies.wait(timeout=30):
+                errors.append("copy did not finish")
+            samples.append((time.perf_counter() - started) * 1000.0)
+        engine.close()
+        cache.close()
+    if errors:
+        raise RuntimeError("; ".join(errors))
+    return row("engine record/stop/copy", samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per protocol case")
+    parser.add_argument("--clip-mb", type=float, default=64.0, help="synthetic clip size for the FTP case")
+    parser.add_argument("--json", action="store_true", help="print one JSON object instead of a table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dest:
+        rows = protocol_cases(args.seconds)
+        rows.append(copy_case(args.clip_mb, dest))
+        rows.append(engine_case(dest))
+
+    if args.json:
+        print(json.dumps({"python": sys.version.split()[0], "cases": rows}, indent=1))
+        return
+    width = max(len(r["case"]) for r in rows)
+    for r in rows:
+        extra = f"  {r['mb_per_sec']:8.1f} MB/s" if "mb_per_sec" in r else ""
+        print(f"{r['case']:<{width}}  {r['per_sec']:>9,.1f}/s  p50 {r['p50_ms']:8.2f} ms  p95 {r['p95_ms']:8.2f} ms{extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Startup timing: named phases since launch, plus optional per-module import times.
+
+The entry script imports this module before anything heavy, so ``T0`` is
+close to the start of the process. ``mark`` records a phase, such as imports
+done, window shown or OSC listening. ``summary`` returns all phases as one log
+line.
+
+With ``ROS_STARTUP_TRACE=1`` set, ``install_import_timer`` also times every
+module imported after it, the way ``python -X importtime`` does.
+``slowest_imports`` then reports the worst ones, with self and cumulative
+times in ms.
+"""
+from __future__ import annotations
+
+import builtins
+import os
+import sys
+import threading
+import time
+
+T0 = time.perf_counter()
+TRACE_ENV = "ROS_STARTUP_TRACE"
+
+_marks: list[tuple[str, float]] = []
+_imports: dict[str, tuple[float, float]] = {}  # module -> (self ms, cumulative ms)
+_local = threading.local()
+_lock = threading.Lock()
+
+
+def trace_enabled() -> bool:
+    return (os.getenv(TRACE_ENV) or "").strip().lower() not in ("", "0", "false", "no")
+
+
+def elapsed_ms() -> float:
+    return (time.perf_counter() - T0) * 1000.0
+
+
+def mark(name: str) -> float:
+    """Record phase ``name`` at the current time; returns ms since ``T0``."""
+    ms = elapsed_ms()
+    with _lock:
+        _marks.append((name, ms))
+    return ms
+
+
+def marks() -> list[tuple[str, float]]:
+    with _lock:
+        return list(_marks)
+
+
+def summary() -> str:
+    return "Startup: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in marks())
+
+
+def install_import_timer() -> None:
+    """Time every later ``import`` statement for a module that is not loaded yet."""
+    original = builtins.__import__
+    if getattr(original, "_startup_timed", False):
+        return
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            took = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += took
+            with _lock:
+                _imports.setdefault(name, ((took - children) * 1000.0, took * 1000.0))
+
+    timed_import._startup_timed = True
+    builtins.__import__ = timed_import
+
+
+def slowest_imports(limit: int = 10) -> list[str]:
+    """``name  self ms  cumulative ms`` for the ``limit`` imports with the largest cumulative time."""
+    with _lock:
+        ranked = sorted(_imports.items(), key=lambda kv: kv[1][1], reverse=True)[:limit]
+    return [f"{name}  {own:.1f} ms self, {total:.1f} ms total" for name, (own, total) in ranked]
@@ -0,0 +1,88 @@
+"""Coalesce cross-thread Tk updates into one periodic drain on the UI thread.
+
+Worker threads never touch Tk. They post into a keyed latest-value map (only
+the newest callback per key survives until the next frame) or queue calls
+that must all run, in order. A single ``after`` loop applies everything at a
+capped frame rate, so a burst of updates costs one redraw instead of one Tk
+event per update. A callback that raises is reported (through Tk's
+``report_callback_exception`` when there is a root) and the drain goes on.
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from typing import Any, Callable, Hashable
+
+Callback = Callable[[], Any]
+
+log = logging.getLogger(__name__)
+
+
+class UiDispatcher:
+    def __init__(self, root, fps: int = 20):
+        self.root = root
+        self.interval_ms = max(1, int(1000 / max(1, int(fps))))
+        self._lock = threading.Lock()
+        self._latest: dict[Hashable, Callback] = {}
+        self._calls: list[Callback] = []
+        self._after_id = None
+        self._running = False
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def post(self, key: Hashable, fn: Callback) -> None:
+        """Run ``fn`` on the next frame, replacing any pending callback with the same key."""
+        with self._lock:
+            self._latest[key] = fn
+
+    def set(self, var, value) -> None:
+        """Latest-value ``var.set(value)`` for a Tk variable."""
+        self.post(("var", id(var)), lambda: var.set(value))
+
+    def call(self, fn: Callable[..., Any], *args) -> None:
+        """Run ``fn(*args)`` on the next frame; every call is kept, in order."""
+        with self._lock:
+            self._calls.append(lambda: fn(*args))
+
+    def flush(self) -> None:
+        """Drain pending work now (UI thread only)."""
+        with self._lock:
+            calls, self._calls = self._calls, []
+            latest, self._latest = self._latest, {}
+        for fn in calls:
+            self._run(fn)
+        for fn in latest.values():
+            self._run(fn)
+
+    def _drain(self) -> None:
+        if not self._running:
+            self._after_id = None
+            return
+        # Re-arm first: a callback that opens a modal dialog must not stall later frames.
+        self._after_id = self.root.after(self.interval_ms, self._drain)
+        self.flush()
+
+    def _run(self, fn: Callback) -> None:
+        try:
+            fn()
+        except Exception:
+            # Report it as Tk would, but keep draining: one bad callback must not stop later frames.
+            report = getattr(self.root, "report_callback_exception", None)
+            if report is None:
+                log.exception("UI callback failed")
+            else:
+                report(*sys.exc_info())
@@ -0,0 +1,143 @@
+"""Tk listbox that only inserts the rows currently in view.
+
+The wrapped ``tk.Listbox`` never holds more than ``height`` items; a separate
+scrollbar and wheel/key bindings move a window over the full row list.
+"""
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+
+class VirtualListbox:
+    def __init__(
+        self,
+        parent: tk.Widget,
+        *,
+        height: int = 7,
+        muted_fg: str = "",
+        on_select: Callable[[int], None] | None = None,
+        **listbox_opts,
+    ):
+        self.height = max(1, int(height))
+        self.muted_fg = muted_fg
+        self.on_select = on_select
+        self._labels: list[str] = []
+        self._muted: set[int] = set()
+        self._offset = 0
+        self._selected: int | None = None
+        self._window: tuple[int, int, tuple[str, ...]] | None = None
+
+        self.listbox = tk.Listbox(parent, height=self.height, exportselection=False, **listbox_opts)
+        self.listbox.grid(row=0, column=0, sticky="ew")
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
+        self.listbox.bind("<Double-Button-1>", self._on_listbox_select)
+        self.listbox.bind("<MouseWheel>", self._on_wheel)
+        self.listbox.bind("<Button-4>", lambda _e: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda _e: self._scroll_by(3))
+        self.listbox.bind("<Up>", lambda _e: self._step(-1))
+        self.listbox.bind("<Down>", lambda _e: self._step(1))
+        self.listbox.bind("<Prior>", lambda _e: self._scroll_by(-self.height))
+        self.listbox.bind("<Next>", lambda _e: self._scroll_by(self.height))
+
+    def size(self) -> int:
+        return len(self._labels)
+
+    def set_rows(self, labels: list[str], muted: set[int] | None = None) -> None:
+        self._labels = labels
+        self._muted = muted or set()
+        self._selected = None
+        self._offset = min(self._offset, self._max_offset())
+        self._window = None
+        self._render()
+
+    def selected(self) -> int | None:
+        return self._selected
+
+    def select(self, index: int) -> None:
+        if not 0 <= index < len(self._labels):
+            return
+        self._selected = index
+        self.see(index)
+        self._render()
+
+    def clear_selection(self) -> None:
+        self._selected = None
+        self.listbox.selection_clear(0, "end")
+
+    def see(self, index: int) -> None:
+        if index < self._offset:
+            self._offset = index
+        elif index >= self._offset + self.height:
+            self._offset = index - self.height + 1
+        self._offset = max(0, min(self._offset, self._max_offset()))
+        self._render()
+
+    def _max_offset(self) -> int:
+        return max(0, len(self._labels) - self.height)
+
+    def _render(self) -> None:
+        start = self._offset
+        visible = tuple(self._labels[start : start + self.height])
+        if self._window != (start, len(self._labels), visible):
+            self._window = (start, len(self._labels), visible)
+            self.listbox.delete(0, "end")
+            if visible:
+                self.listbox.insert("end", *visible)
+            if self.muted_fg:
+                for i in range(len(visible)):
+                    if start + i in self._muted:
+                        self.listbox.itemconfig(i, fg=self.muted_fg)
+        self.listbox.selection_clear(0, "end")
+        if self._selected is not None and start <= self._selected < start + len(visible):
+            self.listbox.selection_set(self._selected - start)
+        self._sync_scrollbar()
+
+    def _sync_scrollbar(self) -> None:
+        total = len(self._labels)
+        if total <= self.height:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.scrollbar.set(self._offset / total, (self._offset + self.height) / total)
+
+    def _scroll_by(self, rows: int) -> str:
+        new = max(0, min(self._offset + rows, self._max_offset()))
+        if new != self._offset:
+            self._offset = new
+            self._render()
+        return "break"
+
+    def _on_scrollbar(self, action: str, *args) -> None:
+        if action == "moveto" and args:
+            self._offset = max(0, min(int(float(args[0]) * len(self._labels)), self._max_offset()))
+            self._render()
+        elif action == "scroll" and len(args) >= 2:
+            step = int(args[0])
+            self._scroll_by(step * self.height if args[1] == "pages" else step)
+
+    def _on_wheel(self, event) -> str:
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _step(self, delta: int) -> str:
+        if not self._labels:
+            return "break"
+        current = self._selected if self._selected is not None else self._offset - delta
+        index = max(0, min(current + delta, len(self._labels) - 1))
+        self.select(index)
+        if self.on_select:
+            self.on_select(index)
+        return "break"
+
+    def _on_listbox_select(self, _evt=None) -> None:
+        sel = self.listbox.curselection()
+        if not sel:
+            return
+        index = self._offset + int(sel[0])
+        if index >= len(self._labels):
+            return
+        self._selected = index
+        if self.on_select:
+            self.on_select(index)
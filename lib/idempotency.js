@@ -0,0 +1,87 @@
+/**
+ * Idempotency-Key support for writes (POST / PUT / PATCH / DELETE).
+ *
+ * The OSC desktop app sends one key per command and keeps it across retries
+ * and across replays from its offline outbox. The first request with a key
+ * runs normally; a repeat within the TTL gets the stored reply (with
+ * `Idempotent-Replayed: true`) instead of running the handler again. A repeat
+ * that arrives while the first is still running waits for its reply.
+ *
+ * Only JSON replies below 500 are stored; a 5xx or a reply that never
+ * completes frees the key so the client can retry. Keys live in memory, per
+ * process.
+ *
+ * Env (optional):
+ *   IDEMPOTENCY_TTL_MIN=10   — how long a reply is kept (matches the app's outbox max age)
+ */
+
+const WRITE_METHODS = new Set(['POST', 'PUT', 'PATCH', 'DELETE']);
+const MAX_KEY_LENGTH = 200;
+
+function readPositiveInt(name, fallback) {
+  const value = parseInt(process.env[name] || '', 10);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+function createIdempotencyMiddleware() {
+  const ttlMs = readPositiveInt('IDEMPOTENCY_TTL_MIN', 10) * 60 * 1000;
+  // `${method} ${path} ${key}` -> { status, body, expires } once answered,
+  // or { waiters: [res, ...], expires } while the first request runs.
+  const replies = new Map();
+
+  const sweep = setInterval(() => {
+    const now = Date.now();
+    for (const [cacheKey, entry] of replies.entries()) {
+      if (!entry.waiters && entry.expires <= now) replies.delete(cacheKey);
+    }
+  }, 60 * 1000);
+  if (sweep.unref) sweep.unref();
+
+  function settle(cacheKey, entry, status, body) {
+    if (replies.get(cacheKey) !== entry) return;
+    if (status !== undefined && status < 500) {
+      replies.set(cacheKey, { status, body, expires: Date.now() + ttlMs });
+    } else {
+      replies.delete(cacheKey);
+    }
+    for (const waiter of entry.waiters) {
+      if (waiter.headersSent) continue;
+      if (status !== undefined && status < 500) {
+        waiter.set('Idempotent-Replayed', 'true');
+        waiter.status(status).json(body);
+      } else {
+        waiter.status(503).json({ error: 'Original request with this Idempotency-Key failed; retry' });
+      }
+    }
+  }
+
+  return function idempotency(req, res, next) {
+    const key = req.get('Idempotency-Key');
+    if (!key || key.length > MAX_KEY_LENGTH || !WRITE_METHODS.has(req.method)) return next();
+
+    const cacheKey = `${req.method} ${req.path} ${key}`;
+    const existing = replies.get(cacheKey);
+    if (existing && existing.waiters) {
+      existing.waiters.push(res);
+      return undefined;
+    }
+    if (existing && existing.expires > Date.now()) {
+      res.set('Idempotent-Replayed', 'true');
+      return res.status(existing.status).json(existing.body);
+    }
+
+    const entry = { waiters: [], expires: Date.now() + ttlMs };
+    replies.set(cacheKey, entry);
+    const json = res.json.bind(res);
+    res.json = (body) => {
+      settle(cacheKey, entry, res.statusCode, body);
+      return json(body);
+    };
+    // Non-JSON replies and dropped connections are not stored.
+    res.on('finish', () => settle(cacheKey, entry, undefined));
+    res.on('close', () => settle(cacheKey, entry, undefined));
+    return next();
+  };
+}
+
+module.exports = { createIdempotencyMiddleware };
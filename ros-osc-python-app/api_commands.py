@@ -0,0 +1,310 @@
+"""Non-blocking API writes for OSC commands.
+
+An OSC handler builds a ``Command``, applies its local change straight away
+(``apply`` returns an undo callable), and hands it to ``CommandExecutor``. The
+executor sends the request on the shared ``RosApi`` session with a per-request
+timeout, retries it where that is safe, and rolls the local change back if
+the request finally fails. ``on_done`` receives the ``CommandResult``; the
+app uses it to send the success/failure OSC ack.
+
+Commands on the same lane (``timer`` or ``subtimer``) are sent one at a time
+in submission order, so a ``/cue/x/load`` followed by ``/timer/start`` reaches
+the server in that order even though neither handler waits for the network.
+
+Each command carries an ``Idempotency-Key`` that stays the same across its
+retries and outbox replays. api-server.js (``lib/idempotency.js``) runs the
+first request with a key and answers repeats within ten minutes with the
+stored reply, so a retry whose first attempt did land is not applied twice.
+Transport errors, read timeouts and 502/503/504 are retried only for
+commands marked ``idempotent`` (stop, reset, load, set duration). Other
+commands are retried only when the connection was never made.
+
+A ``durable`` command that still cannot reach the API is not rolled back. It
+goes to the ``CommandOutbox`` and is replayed in order once the API answers
+again (see ``command_outbox.py``). Until the outbox for its lane is empty,
+later durable commands on that lane queue behind it, so order is kept.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from command_outbox import CommandOutbox, QueuedCommand
+from ros_api import RosApi, RosApiError
+
+CONNECT_TIMEOUT = 3.05
+DEFAULT_TIMEOUT = 5.0
+RETRIES = 2
+BACKOFF = 0.25
+RETRY_STATUS = frozenset({502, 503, 504})
+REPLAY_INTERVAL = 5.0
+# Histogram bucket upper bounds in ms; the last bucket catches everything slower.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class Command:
+    name: str                             # e.g. 'timer/start'; keys the stats
+    method: str
+    path: str
+    json: Any = None
+    lane: str = 'timer'
+    idempotent: bool = False              # safe to resend after the server may have seen it
+    durable: bool = False                 # queue in the outbox when the API is unreachable
+    timeout: float = DEFAULT_TIMEOUT
+    apply: Callable[[], Callable[[], Any] | None] | None = None
+    on_done: Callable[['CommandResult'], Any] | None = None
+    key: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    name: str
+    ok: bool
+    status: int | None = None
+    error: str = ''
+    attempts: int = 1
+    latency_ms: float = 0.0
+    rolled_back: bool = False
+    queued: bool = False                  # waiting in the outbox for the API to come back
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles (bucket upper bound)."""
+
+    def __init__(self, buckets_ms: tuple = LATENCY_BUCKETS_MS):
+        self.bounds = tuple(buckets_ms)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.failed = 0
+        self.max_ms = 0.0
+
+    def record(self, ms: float, ok: bool = True) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.total += 1
+        if not ok:
+            self.failed += 1
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self.total:
+            return 0.0
+        rank = pct / 100.0 * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return float(self.bounds[index]) if index < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        labels = [f'<={b}' for b in self.bounds] + [f'>{self.bounds[-1]}']
+        return {
+            'count': self.total,
+            'failed': self.failed,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'max_ms': self.max_ms,
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+def _unreachable(exc: BaseException | None, status: int | None) -> bool:
+    """The request failed because the API could not be reached, not because it rejected the command."""
+    return status in RETRY_STATUS if status is not None else isinstance(exc, RosApiError)
+
+
+def _retryable(cmd: Command, exc: BaseException | None, status: int | None) -> bool:
+    if status is not None:
+        return cmd.idempotent and status in RETRY_STATUS
+    import requests  # loaded by now: the request that failed came from RosApi
+
+    cause = exc.__cause__ if isinstance(exc, RosApiError) else exc
+    if isinstance(cause, requests.ConnectTimeout):
+        return True  # never reached the server
+    return cmd.idempotent and isinstance(cause, (requests.ConnectionError, requests.Timeout))
+
+
+class CommandExecutor:
+    def __init__(
+        self,
+        api: RosApi,
+        *,
+        retries: int = RETRIES,
+        backoff: float = BACKOFF,
+        outbox: CommandOutbox | None = None,
+        replay_interval: float = REPLAY_INTERVAL,
+        on_result: Callable[[Command, CommandResult], Any] | None = None,
+        on_replay: Callable[[QueuedCommand, CommandResult], Any] | None = None,
+    ):
+        self.api = api
+        self.retries = max(0, int(retries))
+        self.backoff = backoff
+        self.outbox = outbox
+        self.replay_interval = replay_interval
+        self.on_result = on_result
+        self.on_replay = on_replay
+        self._lock = threading.Lock()
+        self._lanes: dict[str, ThreadPoolExecutor] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._replayer: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._closed = False
+        if outbox is not None and len(outbox):
+            self._start_replay()  # left over from the last run
+
+    def submit(self, cmd: Command) -> Future:
+        """Apply ``cmd`` locally and queue the request; returns a Future of its CommandResult."""
+        lane = self._lane(cmd.lane)
+        undo = cmd.apply() if cmd.apply else None
+        return lane.submit(self._run, cmd, undo)
+
+    def queued(self) -> int:
+        return len(self.outbox) if self.outbox is not None else 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            lanes = list(self._lanes.values())
+        self._wake.set()
+        for lane in lanes:
+            lane.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            return {name: h.snapshot() for name, h in sorted(self._histograms.items())}
+
+    def summary(self) -> str:
+        parts = [
+            f"{name} n={s['count']} fail={s['failed']} p50<={s['p50_ms']:.0f} p95<={s['p95_ms']:.0f} ms"
+            for name, s in self.stats().items()
+        ]
+        queued = self.queued()
+        if queued:
+            parts.append(f"{queued} queued for replay")
+        return '; '.join(parts) or 'no API commands yet'
+
+    def _lane(self, name: str) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('command executor is closed')
+            lane = self._lanes.get(name)
+            if lane is None:
+                lane = self._lanes[name] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'api-{name}')
+            return lane
+
+    def _send(self, method: str, path: str, body, key: str, timeout: float):
+        """One attempt; returns (status, error, exception) with error '' on success."""
+        try:
+            res = self.api.request(
+                method, path, json=body,
+                headers={'Idempotency-Key': key},
+                timeout=(CONNECT_TIMEOUT, timeout),
+            )
+        except RosApiError as e:
+            return None, str(e), e
+        return res.status_code, '' if res.ok else f"HTTP {res.status_code}", None
+
+    def _run(self, cmd: Command, undo) -> CommandResult:
+        if cmd.durable and self.outbox is not None and self.outbox.has_pending(cmd.lane):
+            # Earlier commands are still waiting for the API; keep the order.
+            self._enqueue(cmd)
+            return self._finish(cmd, CommandResult(cmd.name, False, error='queued behind earlier commands',
+                                                   attempts=0, queued=True), record=False)
+        started = time.monotonic()
+        attempts = 0
+        while True:
+            attempts += 1
+            status, error, exc = self._send(cmd.method, cmd.path, cmd.json, cmd.key, cmd.timeout)
+            if not error:
+                break
+            if attempts > self.retries or not _retryable(cmd, exc, status):
+                break
+            time.sleep(self.backoff * (2 ** (attempts - 1)))
+        ok = not error
+        queued = rolled_back = False
+        if not ok and cmd.durable and self.outbox is not None and _unreachable(exc, status):
+            self._enqueue(cmd)
+            queued = True
+        elif not ok and undo is not None:
+            try:
+                undo()
+                rolled_back = True
+            except Exception:
+                pass
+        latency_ms = (time.monotonic() - started) * 1000.0
+        return self._finish(cmd, CommandResult(cmd.name, ok, status, error, attempts, latency_ms, rolled_back, queued))
+
+    def _finish(self, cmd: Command, result: CommandResult, record: bool = True) -> CommandResult:
+        if record:
+            with self._lock:
+                hist = self._histograms.get(cmd.name)
+                if hist is None:
+                    hist = self._histograms[cmd.name] = LatencyHistogram()
+                hist.record(result.latency_ms, result.ok)
+        if self.on_result:
+            try:
+                self.on_result(cmd, result)
+            except Exception:
+                pass
+        if cmd.on_done:
+            try:
+                cmd.on_done(result)
+            except Exception:
+                pass
+        return result
+
+    def _enqueue(self, cmd: Command) -> None:
+        self.outbox.add(cmd.key, cmd.name, cmd.method, cmd.path, cmd.json, cmd.lane)
+        self._start_replay()
+
+    def _start_replay(self) -> None:
+        with self._lock:
+            if self._closed or (self._replayer is not None and self._replayer.is_alive()):
+                return
+            self._replayer = threading.Thread(target=self._replay_loop, name='api-replay', daemon=True)
+            self._replayer.start()
+
+    def _replay_loop(self) -> None:
+        while True:
+            self._wake.wait(self.replay_interval)
+            with self._lock:
+                if self._closed:
+                    return
+            for name in self.outbox.lanes():
+                try:
+                    # On the lane's own thread, so new commands cannot overtake the replay.
+                    self._lane(name).submit(self._replay, name).result()
+                except Exception:
+                    pass
+            with self._lock:
+                if not len(self.outbox):
+                    self._replayer = None
+                    return
+
+    def _replay(self, lane: str) -> None:
+        for queued in self.outbox.pending(lane):
+            if queued.age > self.outbox.max_age:
+                self.outbox.remove(queued.key)
+                self._report_replay(queued, CommandResult(queued.name, False, error='expired in outbox', attempts=0))
+                continue
+            started = time.monotonic()
+            status, error, exc = self._send(queued.method, queued.path, queued.json, queued.key, DEFAULT_TIMEOUT)
+            if error and _unreachable(exc, status):
+                return  # still down; try again next round
+            # Delivered, or rejected by the server (which a retry will not fix): either way it leaves the outbox.
+            self.outbox.remove(queued.key)
+            latency_ms = (time.monotonic() - started) * 1000.0
+            self._report_replay(queued, CommandResult(queued.name, not error, status, error, 1, latency_ms))
+
+    def _report_replay(self, queued: QueuedCommand, result: CommandResult) -> None:
+        if self.on_replay:
+            try:
+                self.on_replay(queued, result)
+            except Exception:
+                pass
@@ -0,0 +1,85 @@
+"""Debounce-and-coalesce runner for refetches triggered by push events.
+
+``CoalescingRunner.trigger()`` is cheap and may be called from any thread, as
+often as the server broadcasts. The wrapped function runs on one background
+thread:
+
+* the first trigger runs it after ``delay`` (a short debounce, so a burst of
+  edits is picked up by one fetch);
+* triggers that arrive while it is waiting or running are merged into a
+  single trailing run, so the last edit of a burst is always fetched;
+* runs start at least ``min_interval`` apart, so a stream of edits costs at
+  most one fetch per interval.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+
+class CoalescingRunner:
+    def __init__(self, fn: Callable[[], Any], *, delay: float = 0.25, min_interval: float = 1.0,
+                 name: str = 'coalesce'):
+        self.fn = fn
+        self.delay = delay
+        self.min_interval = min_interval
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending = False
+        self._first_trigger = 0.0
+        self._last_start = float('-inf')
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        self.triggers = 0
+        self.runs = 0
+
+    def trigger(self) -> None:
+        with self._cond:
+            if self._stopped:
+                return
+            self.triggers += 1
+            if not self._pending:
+                self._pending = True
+                self._first_trigger = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def cancel(self) -> None:
+        """Forget a pending run (e.g. the event was closed); a run in progress finishes."""
+        with self._cond:
+            self._pending = False
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._pending = False
+            self._cond.notify()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {'triggers': self.triggers, 'runs': self.runs, 'coalesced': self.triggers - self.runs}
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._pending:
+                        due = max(self._first_trigger + self.delay, self._last_start + self.min_interval)
+                        wait = due - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+                self._pending = False
+                self._last_start = time.monotonic()
+                self.runs += 1
+            try:
+                self.fn()
+            except Exception:
+                pass
@@ -0,0 +1,111 @@
+"""Durable outbox for API writes made while the API is unreachable.
+
+``CommandExecutor`` puts a ``durable`` command here when it cannot reach the
+server, instead of rolling it back. The outbox is a SQLite table in
+``outbox.sqlite3``, so queued commands survive a crash or restart. Rows are
+replayed in insertion order once the API answers again. The idempotency key
+is unique, so a command queued twice is stored, and sent, once.
+
+Timer commands carry the moment they were issued in their JSON body, as a
+server-clock ISO timestamp: ``started_at`` on ``/api/timers/start`` and
+``stopped_at`` on ``/api/timers/stop``. The server uses them, so a replayed
+start runs the timer from the time the operator fired it, and a replayed
+stop measures overtime to that moment, not to when the network came back.
+Rows older than ``MAX_AGE`` are dropped rather than replayed: after a long
+outage the show has moved on.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+OUTBOX_NAME = 'outbox.sqlite3'
+MAX_AGE = 600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    body TEXT,
+    lane TEXT NOT NULL,
+    queued_at REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class QueuedCommand:
+    seq: int
+    key: str
+    name: str
+    method: str
+    path: str
+    json: Any
+    lane: str
+    queued_at: float  # local epoch seconds
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.queued_at)
+
+
+class CommandOutbox:
+    def __init__(self, path: str, max_age: float = MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        try:
+            self._db.execute('PRAGMA journal_mode=WAL')
+        except sqlite3.DatabaseError:
+            pass
+        self._db.execute(_SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM outbox').fetchone()[0]
+
+    def add(self, key: str, name: str, method: str, path: str, body: Any, lane: str) -> bool:
+        """Queue a command; False if one with the same key is already queued."""
+        with self._lock:
+            cur = self._db.execute(
+                'INSERT OR IGNORE INTO outbox (key, name, method, path, body, lane, queued_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, name, method, path, json.dumps(body, default=str), lane, time.time()),
+            )
+            return cur.rowcount == 1
+
+    def pending(self, lane: str | None = None) -> list[QueuedCommand]:
+        sql = 'SELECT seq, key, name, method, path, body, lane, queued_at FROM outbox'
+        params: tuple = ()
+        if lane is not None:
+            sql += ' WHERE lane = ?'
+            params = (lane,)
+        with self._lock:
+            rows = self._db.execute(sql + ' ORDER BY seq', params).fetchall()
+        return [QueuedCommand(r[0], r[1], r[2], r[3], r[4], json.loads(r[5]) if r[5] else None, r[6], r[7]) for r in rows]
+
+    def has_pending(self, lane: str) -> bool:
+        with self._lock:
+            return self._db.execute('SELECT 1 FROM outbox WHERE lane = ? LIMIT 1', (lane,)).fetchone() is not None
+
+    def lanes(self) -> list[str]:
+        with self._lock:
+            return [r[0] for r in self._db.execute('SELECT DISTINCT lane FROM outbox')]
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM outbox WHERE key = ?', (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,594 @@
+"""Local ROS API stand-in: the REST routes both apps call, plus Socket.IO ``update`` pushes.
+
+No Railway deployment or database needed, so ``RosApi``, the OSC bridge and
+the ingest follow loop can be tested and benchmarked on their own:
+
+    python fake_ros_api.py --port 3002 --items 5000 --latency 0.05
+    API_BASE_URL=http://127.0.0.1:3002 python osc_daemon.py --event <id printed at start>
+
+Routes, with the same bodies as ``api-server.js``:
+- ``GET /health``, ``GET /api/time``, ``GET /api/calendar-events``;
+- ``GET /api/run-of-show-data/{id}``, with an ``ETag`` (``If-None-Match``
+  gets a ``304``);
+- ``GET /api/active-timers/{id}`` and ``GET /api/start-cue-selection/{id}``;
+- the timer writes ``POST /api/cues/load``, ``/api/timers/start|stop|reset``,
+  ``PUT /api/active-timers/{id}/{item}/duration``, ``POST /api/sub-cue-timers``,
+  ``PUT /api/sub-cue-timers/stop`` and ``POST|DELETE /api/start-cue-selection``.
+
+Every write broadcasts the matching Socket.IO ``update`` (``timerUpdated``,
+``timerStopped``, ``resetAllStates``, ...) to the ``event:<id>`` room. Clients
+join with ``joinEvent`` and get ``serverTime``, as on the real server. The
+same writes can be made from Python (``load_cue``, ``start_timer``,
+``stop_timer``, ``reset``, ``update_items``), playing the web UI or another
+operator.
+
+Each event gets a generated schedule of ``items`` rows (every row marked for
+recording, cue labels ``1``, ``2``, ...). These can be changed while running:
+- ``latency``: seconds before each HTTP response;
+- ``push_latency``: seconds between a write and its broadcast;
+- ``token``: when set, ``/api/*`` needs ``Authorization: Bearer <token>``.
+
+Served by a threaded ``wsgiref`` server that hands the raw socket to
+simple-websocket, so Socket.IO clients upgrade to a websocket instead of
+staying on long-polling. It is a context manager and binds port 0 by default:
+
+    with FakeRosApi(items=5000) as api:
+        RosApi(api.url).event_snapshot(api.event_ids[0])
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+import socketio
+
+FAR_FUTURE = '2099-12-31T23:59:59.999Z'  # started_at of a loaded, not yet started timer
+FIRST_ITEM_ID = 1000
+ITEM_MINUTES = 5
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def make_schedule(count: int, days: int = 1) -> list[dict]:
+    """``count`` rows split evenly over ``days``; every row is marked for recording."""
+    per_day = max(1, -(-count // max(1, days)))
+    return [
+        {
+            'id': FIRST_ITEM_ID + n,
+            'day': 1 + n // per_day,
+            'segmentName': f'Segment {n + 1}',
+            'programType': 'Podium Transition',
+            'durationHours': 0,
+            'durationMinutes': ITEM_MINUTES,
+            'durationSeconds': 0,
+            'notes': '',
+            'needsRecording': True,
+            'customFields': {'cue': str(n + 1)},
+        }
+        for n in range(count)
+    ]
+
+
+class _Handler(WSGIRequestHandler):
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # small pushes go out at once
+
+    def get_environ(self):
+        env = super().get_environ()
+        env['werkzeug.socket'] = self.connection  # simple-websocket takes the socket over for an upgrade
+        return env
+
+    def log_message(self, *_args):
+        pass
+
+
+class _Server(ThreadingMixIn, WSGIServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _Reply(Exception):
+    def __init__(self, status: int, body=None):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+
+
+class FakeRosApi:
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        events: int = 1,
+        items: int = 50,
+        days: int = 1,
+        latency: float = 0.0,
+        push_latency: float = 0.0,
+        token: str = '',
+    ):
+        self.latency = latency
+        self.push_latency = push_latency
+        self.token = token
+        self.lock = threading.Lock()
+        today = datetime.now().date().isoformat()
+        self.events = [
+            {
+                'id': str(uuid.uuid5(uuid.NAMESPACE_URL, f'ros-fake-event-{n}')),
+                'name': f'Fake Event {n}',
+                'date': today,
+                'location': 'Local',
+                'numberOfDays': days,
+            }
+            for n in range(1, events + 1)
+        ]
+        self.schedules = {ev['id']: make_schedule(items, days) for ev in self.events}
+        self.versions = {ev['id']: 1 for ev in self.events}
+        self.timers: dict[str, dict] = {}
+        self.sub_timers: dict[str, dict] = {}
+        self.start_cues: dict[str, int] = {}
+        self.hits: dict[str, int] = {}
+        self.broadcasts = 0
+        self._clients: set[str] = set()
+        self._rooms: dict[str, set[str]] = {}
+        self._routes = [
+            ('GET', re.compile(r'^/health$'), self._health),
+            ('GET', re.compile(r'^/api/time$'), self._time),
+            ('GET', re.compile(r'^/api/calendar-events$'), self._calendar_events),
+            ('GET', re.compile(r'^/api/run-of-show-data/([^/]+)$'), self._run_of_show),
+            ('GET', re.compile(r'^/api/active-timers/([^/]+)$'), self._active_timers),
+            ('PUT', re.compile(r'^/api/active-timers/([^/]+)/([^/]+)/duration$'), self._put_duration),
+            ('GET', re.compile(r'^/api/start-cue-selection/([^/]+)$'), self._start_cue_selection),
+            ('POST', re.compile(r'^/api/start-cue-selection$'), self._post_start_cue),
+            ('DELETE', re.compile(r'^/api/start-cue-selection$'), self._delete_start_cue),
+            ('POST', re.compile(r'^/api/cues/load$'), self._post_cue_load),
+            ('POST', re.compile(r'^/api/timers/start$'), self._post_timer_start),
+            ('POST', re.compile(r'^/api/timers/stop$'), self._post_timer_stop),
+            ('POST', re.compile(r'^/api/timers/reset$'), self._post_timer_reset),
+            ('POST', re.compile(r'^/api/sub-cue-timers$'), self._post_sub_timer),
+            ('PUT', re.compile(r'^/api/sub-cue-timers/stop$'), self._put_sub_timer_stop),
+        ]
+
+        self.sio = socketio.Server(async_mode='threading', cors_allowed_origins='*')
+        self.sio.on('connect', self._on_connect)
+        self.sio.on('disconnect', self._on_disconnect)
+        self.sio.on('joinEvent', self._on_join)
+        self.sio.on('leaveEvent', self._on_leave)
+        self._sio_app = socketio.WSGIApp(self.sio, self._rest)
+        self._server = _Server((host, port), _Handler)
+        self._server.set_app(self._app)
+        self._thread = threading.Thread(target=self._server.serve_forever, name='FakeRosApi', daemon=True)
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    @property
+    def event_ids(self) -> list[str]:
+        return [ev['id'] for ev in self.events]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        with self.lock:
+            clients = list(self._clients)
+        for sid in clients:
+            try:
+                self.sio.disconnect(sid)
+            except Exception:
+                pass
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def listeners(self, event_id) -> int:
+        """Socket.IO clients currently in the event's room."""
+        with self.lock:
+            return len(self._rooms.get(str(event_id), ()))
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {'hits': dict(self.hits), 'broadcasts': self.broadcasts, 'clients': len(self._clients)}
+
+    # -- writes (also reachable over HTTP) ----------------------------------------------------
+
+    def item(self, event_id, item_id) -> dict | None:
+        for it in self.schedules.get(str(event_id), ()):
+            if str(it.get('id')) == str(item_id):
+                return it
+        return None
+
+    def load_cue(self, event_id, item_id, *, duration_seconds: int | None = None, cue_is: str | None = None,
+                 user_id: str = 'fake-ros-api') -> dict:
+        """Load ``item_id`` (LOADED, not running) and broadcast ``timerUpdated``."""
+        event_id = str(event_id)
+        item = self.item(event_id, item_id) or {}
+        if duration_seconds is None:
+            duration_seconds = (item.get('durationHours', 0) * 3600 + item.get('durationMinutes', 0) * 60
+                                + item.get('durationSeconds', 0)) or 300
+        row = {
+            'event_id': event_id,
+            'item_id': int(item_id),
+            'user_id': user_id,
+            'user_name': 'OSC User',
+            'user_role': 'OPERATOR',
+            'timer_state': 'loaded',
+            'is_active': True,
+            'is_running': False,
+            'started_at': FAR_FUTURE,
+            'last_loaded_cue_id': int(item_id),
+            'cue_is': cue_is or f'CUE {item_id}',
+            'duration_seconds': duration_seconds,
+            'elapsed_seconds': 0,
+            'updated_at': now_iso(),
+        }
+        with self.lock:
+            self.timers[event_id] = row
+        self.broadcast(event_id, 'timerUpdated', dict(row), room_only=True)
+        return row
+
+    def start_timer(self, event_id, item_id=None, started_at: str | None = None) -> dict | None:
+        """Run the loaded timer (``item_id`` must match it) and broadcast ``timerUpdated``."""
+        row = self._update_timer(event_id, item_id, timer_state='running', is_active=True, is_running=True,
+                                 started_at=started_at or now_iso())
+        if row is not None:
+            self.broadcast(event_id, 'timerUpdated', row, room_only=True)
+        return row
+
+    def stop_timer(self, event_id, item_id=None) -> dict | None:
+        """Stop the timer (the row stays, ``stopped``) and broadcast ``timerStopped``."""
+        row = self._update_timer(event_id, item_id, timer_state='stopped', is_active=False, is_running=False)
+        self.broadcast(event_id, 'timerStopped', row, room_only=True)
+        return row
+
+    def reset(self, event_id) -> None:
+        """Clear the event's timers and broadcast ``resetAllStates``."""
+        event_id = str(event_id)
+        with self.lock:
+            self.timers.pop(event_id, None)
+            self.sub_timers.pop(event_id, None)
+        self.broadcast(event_id, 'resetAllStates', {'event_id': event_id}, room_only=True)
+
+    def update_items(self, event_id, changes: dict, *, push_rows: bool = True) -> int:
+        """Apply ``{item_id: {field: value}}`` to the schedule and broadcast ``runOfShowDataUpdated``.
+
+        With ``push_rows`` the broadcast carries the whole row, as the web
+        editor's save does; without it clients have to refetch. Returns the
+        new schedule version (the ``ETag``).
+        """
+        event_id = str(event_id)
+        wanted = {str(k): v for k, v in changes.items()}
+        with self.lock:
+            self.schedules[event_id] = [
+                {**it, **wanted[str(it.get('id'))]} if str(it.get('id')) in wanted else it
+                for it in self.schedules[event_id]
+            ]
+            self.versions[event_id] += 1
+            version = self.versions[event_id]
+        data = self._run_of_show_row(event_id) if push_rows else {'event_id': event_id}
+        self.broadcast(event_id, 'runOfShowDataUpdated', data)
+        return version
+
+    def broadcast(self, event_id, update_type: str, data, *, room_only: bool = False) -> None:
+        """Emit ``update`` to ``event:<id>``; ``room_only`` leaves out ``eventId`` like broadcastTimerUpdated."""
+        message = {'type': update_type, 'data': data}
+        if not room_only:
+            message.update(eventId=str(event_id), timestamp=now_iso())
+        with self.lock:
+            self.broadcasts += 1
+        if self.push_latency > 0:
+            timer = threading.Timer(self.push_latency, self._emit, (event_id, message))
+            timer.daemon = True
+            timer.start()
+        else:
+            self._emit(event_id, message)
+
+    def _emit(self, event_id, message) -> None:
+        try:
+            self.sio.emit('update', message, room=f'event:{event_id}')
+        except Exception:
+            pass
+
+    def _update_timer(self, event_id, item_id, **fields) -> dict | None:
+        event_id = str(event_id)
+        with self.lock:
+            row = self.timers.get(event_id)
+            if row is None or (item_id is not None and str(row['item_id']) != str(item_id)):
+                return None
+            row.update(fields, updated_at=now_iso())
+            return dict(row)
+
+    # -- Socket.IO ------------------------------------------------------------------------------
+
+    def _on_connect(self, sid, _environ, _auth=None):
+        with self.lock:
+            self._clients.add(sid)
+        self.sio.emit('serverTime', {'serverTime': now_iso()}, to=sid)
+
+    def _on_disconnect(self, sid, *_args):
+        with self.lock:
+            self._clients.discard(sid)
+            for members in self._rooms.values():
+                members.discard(sid)
+
+    def _on_join(self, sid, event_id):
+        event_id = str(event_id)
+        self.sio.enter_room(sid, f'event:{event_id}')
+        with self.lock:
+            self._rooms.setdefault(event_id, set()).add(sid)
+        self.sio.emit('serverTime', {'serverTime': now_iso()}, to=sid)
+
+    def _on_leave(self, sid, event_id):
+        event_id = str(event_id)
+        self.sio.leave_room(sid, f'event:{event_id}')
+        with self.lock:
+            self._rooms.get(event_id, set()).discard(sid)
+
+    # -- HTTP -----------------------------------------------------------------------------------
+
+    def _app(self, environ, start_response):
+        try:
+            return self._sio_app(environ, start_response)
+        except ConnectionError as exc:
+            # A websocket session ended; simple-websocket owned the socket, so there is nothing to send.
+            raise ConnectionAbortedError() from exc
+
+    def _rest(self, environ, start_response):
+        method = environ.get('REQUEST_METHOD', 'GET')
+        path = environ.get('PATH_INFO', '') or '/'
+        if self.latency > 0:
+            time.sleep(self.latency)
+        headers = [('Content-Type', 'application/json')]
+        try:
+            if self.token and path.startswith('/api/'):
+                if environ.get('HTTP_AUTHORIZATION', '') != f'Bearer {self.token}':
+                    raise _Reply(401, {'error': 'Unauthorized'})
+            for verb, pattern, handler in self._routes:
+                match = pattern.match(path)
+                if match and verb == method:
+                    with self.lock:
+                        self.hits[pattern.pattern] = self.hits.get(pattern.pattern, 0) + 1
+                    status, body, extra = handler(environ, *match.groups())
+                    headers.extend(extra)
+                    break
+            else:
+                raise _Reply(404, {'error': 'Not found'})
+        except _Reply as reply:
+            status, body = reply.status, reply.body
+        if status == 304:
+            start_response('304 Not Modified', headers[1:])
+            return [b'']
+        data = json.dumps(body).encode('utf-8')
+        headers.append(('Content-Length', str(len(data))))
+        start_response(f'{status} {_REASONS.get(status, "")}'.strip(), headers)
+        return [data]
+
+    def _body(self, environ) -> dict:
+        try:
+            size = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            size = 0
+        try:
+            body = json.loads(environ['wsgi.input'].read(size) or b'{}') if size else {}
+        except ValueError:
+            raise _Reply(400, {'error': 'Invalid JSON'})
+        return body if isinstance(body, dict) else {}
+
+    def _event(self, event_id) -> str:
+        event_id = str(event_id)
+        if event_id not in self.schedules:
+            raise _Reply(404, {'error': 'Event not found'})
+        return event_id
+
+    def _run_of_show_row(self, event_id) -> dict:
+        ev = next(e for e in self.events if e['id'] == event_id)
+        with self.lock:
+            items, version = self.schedules[event_id], self.versions[event_id]
+        return {
+            'id': self.event_ids.index(event_id) + 1,
+            'event_id': event_id,
+            'event_name': ev['name'],
+            'event_date': ev['date'],
+            'schedule_items': items,
+            'custom_columns': [{'name': 'cue'}],
+            'settings': {},
+            'last_modified_by': 'fake-ros-api',
+            'updated_at': now_iso(),
+            'version': version,
+        }
+
+    def _health(self, _environ):
+        return 200, {'status': 'healthy', 'timestamp': now_iso()}, []
+
+    def _time(self, _environ):
+        return 200, {'serverTime': now_iso()}, [('Cache-Control', 'no-store')]
+
+    def _calendar_events(self, _environ):
+        return 200, self.events, []
+
+    def _run_of_show(self, environ, event_id):
+        event_id = self._event(event_id)
+        with self.lock:
+            etag = f'"{event_id}-{self.versions[event_id]}"'
+        if environ.get('HTTP_IF_NONE_MATCH') == etag:
+            return 304, None, [('ETag', etag)]
+        return 200, self._run_of_show_row(event_id), [('ETag', etag)]
+
+    def _active_timers(self, _environ, event_id):
+        with self.lock:
+            row = self.timers.get(str(event_id))
+            row = dict(row) if row else None
+        if row is None:
+            return 200, [], []
+        if row['is_running'] and row['started_at'] != FAR_FUTURE:
+            try:
+                started = datetime.fromisoformat(row['started_at'].replace('Z', '+00:00'))
+                row['elapsed_seconds'] = max(0, int((datetime.now(timezone.utc) - started).total_seconds()))
+            except ValueError:
+                pass
+        return 200, [row], []
+
+    def _put_duration(self, environ, event_id, item_id):
+        event_id = self._event(event_id)
+        seconds = self._body(environ).get('duration_seconds')
+        if seconds is None or float(seconds) < 0:
+            raise _Reply(400, {'error': 'duration_seconds must be a non-negative number'})
+        total = int(float(seconds))
+        self.update_items(event_id, {item_id: {
+            'durationHours': total // 3600, 'durationMinutes': total % 3600 // 60, 'durationSeconds': total % 60,
+        }})
+        row = self._update_timer(event_id, item_id, duration_seconds=total)
+        if row is not None:
+            self.broadcast(event_id, 'timerUpdated', row, room_only=True)
+        return 200, {'success': True, 'event_id': event_id, 'item_id': item_id, 'duration_seconds': total}, []
+
+    def _start_cue_selection(self, _environ, event_id):
+        with self.lock:
+            item_id = self.start_cues.get(str(event_id))
+        return 200, ({'itemId': item_id} if item_id is not None else None), []
+
+    def _post_start_cue(self, environ):
+        body = self._body(environ)
+        if not body.get('event_id') or not body.get('item_id'):
+            raise _Reply(400, {'error': 'event_id and item_id are required'})
+        event_id = str(body['event_id'])
+        with self.lock:
+            self.start_cues[event_id] = int(body['item_id'])
+        self.broadcast(event_id, 'startCueSelectionUpdate', {'event_id': event_id, 'item_id': body['item_id']})
+        return 200, {'success': True, 'item_id': body['item_id']}, []
+
+    def _delete_start_cue(self, environ):
+        body = self._body(environ)
+        event_id = str(body.get('event_id'))
+        with self.lock:
+            removed = self.start_cues.pop(event_id, None)
+        if removed is None:
+            raise _Reply(404, {'error': 'START cue selection not found'})
+        self.broadcast(event_id, 'startCueSelectionUpdate', {'event_id': event_id, 'item_id': None})
+        return 200, {'success': True}, []
+
+    def _post_cue_load(self, environ):
+        body = self._body(environ)
+        event_id, item_id = str(body.get('event_id')), body.get('item_id')
+        if item_id is None:
+            raise _Reply(400, {'error': 'item_id is required'})
+        self.load_cue(event_id, item_id, duration_seconds=body.get('duration_seconds'), cue_is=body.get('cue_is'),
+                      user_id=body.get('user_id') or 'python-osc-server')
+        return 200, {'success': True, 'message': 'Cue loaded in active_timers', 'event_id': event_id,
+                     'item_id': item_id}, []
+
+    def _post_timer_start(self, environ):
+        body = self._body(environ)
+        event_id = str(body.get('event_id'))
+        self.start_timer(event_id, body.get('item_id'), body.get('started_at'))
+        return 200, {'success': True, 'message': 'Timer started', 'event_id': event_id,
+                     'item_id': body.get('item_id')}, []
+
+    def _post_timer_stop(self, environ):
+        body = self._body(environ)
+        event_id = str(body.get('event_id'))
+        self.stop_timer(event_id, body.get('item_id'))
+        return 200, {'success': True, 'message': 'Timer stopped', 'event_id': event_id,
+                     'item_id': body.get('item_id')}, []
+
+    def _post_timer_reset(self, environ):
+        body = self._body(environ)
+        event_id = str(body.get('event_id'))
+        self.reset(event_id)
+        return 200, {'success': True, 'message': 'Timer reset - all timer tables cleared', 'event_id': event_id,
+                     'item_id': body.get('item_id')}, []
+
+    def _post_sub_timer(self, environ):
+        body = self._body(environ)
+        event_id = str(body.get('event_id'))
+        row = {**body, 'event_id': event_id, 'timer_state': 'running', 'created_at': now_iso(), 'updated_at': now_iso()}
+        with self.lock:
+            self.sub_timers.setdefault(event_id, {})[str(body.get('item_id'))] = row
+        self.broadcast(event_id, 'subCueTimerStarted', row, room_only=True)
+        return 200, {'success': True, 'data': row}, []
+
+    def _put_sub_timer_stop(self, environ):
+        body = self._body(environ)
+        event_id, item_id = str(body.get('event_id')), body.get('item_id')
+        with self.lock:
+            running = self.sub_timers.get(event_id, {})
+            stopped = [running.pop(str(item_id), None)] if item_id is not None else list(running.values())
+            if item_id is None:
+                running.clear()
+        count = len([row for row in stopped if row])
+        self.broadcast(event_id, 'subCueTimerStopped', {'event_id': event_id, 'item_id': item_id, 'stopped_count': count})
+        return 200, {'success': True, 'stopped_count': count}, []
+
+
+_REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found'}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Local ROS API stand-in (REST + Socket.IO) for testing.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3002)
+    parser.add_argument('--events', type=int, default=1, help='calendar events to serve')
+    parser.add_argument('--items', type=int, default=50, help='schedule rows per event (e.g. 5000)')
+    parser.add_argument('--days', type=int, default=1, help='days the rows are split over')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds before each HTTP response')
+    parser.add_argument('--push-latency', type=float, default=0.0, help='seconds between a write and its broadcast')
+    parser.add_argument('--token', default='', help='require this bearer token on /api/*')
+    parser.add_argument('--auto-cue', type=float, default=0.0, metavar='SECONDS',
+                        help='load and start the next row of the first event every SECONDS')
+    args = parser.parse_args(argv)
+
+    api = FakeRosApi(
+        args.host, args.port, events=args.events, items=args.items, days=args.days,
+        latency=args.latency, push_latency=args.push_latency, token=args.token,
+    ).start()
+    print(f'ROS API on {api.url}')
+    for ev in api.events:
+        print(f"  event {ev['id']}  {ev['name']}  ({args.items} rows)")
+    try:
+        n = 0
+        while True:
+            if args.auto_cue > 0:
+                time.sleep(args.auto_cue)
+                event_id = api.event_ids[0]
+                item = api.schedules[event_id][n % len(api.schedules[event_id])]
+                api.load_cue(event_id, item['id'])
+                api.start_timer(event_id, item['id'])
+                print(f"  cue {item['customFields']['cue']} running")
+                n += 1
+            else:
+                time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+"""Offline-first cache of API responses in a local SQLite file.
+
+Every successful fetch is stored as JSON under a key (calendar events, an
+event's schedule, the last active-timer record). At startup the app shows
+the stored copy at once and refreshes it in the background, using
+stale-while-revalidate (``LocalCache.revalidate``). If the API cannot be
+reached, the last good copy stays on screen and the show keeps running.
+
+Keys are scoped by API base URL (``cache_key``), so switching servers never
+shows another server's data.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+CACHE_NAME = "cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+def cache_key(base_url: str, *parts: Any) -> str:
+    return "|".join([(base_url or "").rstrip("/")] + [str(p) for p in parts])
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    stored_at: float  # epoch seconds
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.stored_at)
+
+
+def describe_age(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 90:
+        return f"{seconds}s"
+    if seconds < 90 * 60:
+        return f"{seconds // 60}m"
+    if seconds < 48 * 3600:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+
+class LocalCache:
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        try:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.DatabaseError:
+            pass
+        self._db.execute(_SCHEMA)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._db.execute("SELECT value, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return CacheEntry(json.loads(row[0]), row[1])
+        except ValueError:
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value, separators=(",", ":"), default=str)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def revalidate(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        deliver: Callable[[Any, CacheEntry | None], Any],
+    ) -> bool:
+        """Stale-while-revalidate; call from a background thread.
+
+        ``deliver(value, entry)`` runs first with the cached copy (``entry`` set),
+        then with the fresh value (``entry`` None) once ``fetch`` returns. On a
+        fetch error the cached copy stands and False is returned; the error is
+        raised only when nothing was cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            deliver(cached.value, cached)
+        try:
+            fresh = fetch()
+        except Exception:
+            if cached is None:
+                raise
+            return False
+        self.put(key, fresh)
+        deliver(fresh, None)
+        return True
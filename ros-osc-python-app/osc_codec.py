@@ -0,0 +1,420 @@
+"""OSC 1.0/1.1 packet encoding and decoding.
+
+Decoding walks each message with ``struct.unpack_from`` and index
+arithmetic. A message header (address plus type tags) is compiled once into
+a cached plan in which a run of fixed-width arguments is one ``Struct``, so
+a repeated command costs a dict lookup and one or two unpacks. Bundle
+elements are sliced out and decoded the same way.
+
+Supported type tags: ``i f s S b h d t c T F N I``. Bundles are decoded
+recursively into ``OscBundle`` objects whose timetags can be honoured with
+``timetag_delay``.
+"""
+from __future__ import annotations
+
+import struct
+import time
+from typing import Iterator, NamedTuple, Union
+
+BUNDLE_TAG = b'#bundle\x00'
+NTP_DELTA = 2208988800  # seconds between 1900-01-01 (NTP) and 1970-01-01 (Unix)
+MAX_BUNDLE_DEPTH = 16
+
+_I32 = struct.Struct('>i')
+_F32 = struct.Struct('>f')
+_I64 = struct.Struct('>q')
+_F64 = struct.Struct('>d')
+_U64 = struct.Struct('>Q')
+
+
+class OscDecodeError(ValueError):
+    pass
+
+
+class Timetag(int):
+    """64-bit NTP timestamp (seconds since 1900 << 32 | fraction). ``IMMEDIATELY`` is 1."""
+
+    @classmethod
+    def from_unix(cls, seconds: float) -> 'Timetag':
+        whole = int(seconds)
+        frac = int((seconds - whole) * (1 << 32)) & 0xFFFFFFFF
+        return cls(((whole + NTP_DELTA) << 32) | frac)
+
+    def to_unix(self) -> float:
+        return (int(self) >> 32) - NTP_DELTA + (int(self) & 0xFFFFFFFF) / (1 << 32)
+
+    @property
+    def immediate(self) -> bool:
+        return int(self) == 1
+
+
+IMMEDIATELY = Timetag(1)
+
+
+class Impulse:
+    """``I`` (infinitum / impulse) argument."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return 'Impulse'
+
+
+IMPULSE = Impulse()
+
+
+# Named tuples rather than dataclasses: the decoder builds one per datagram
+# and ``tuple.__new__`` is several times cheaper than a generated __init__.
+class OscMessage(NamedTuple):
+    address: str
+    args: list = ()
+    typetags: str = ''
+
+
+class OscBundle(NamedTuple):
+    timetag: Timetag = IMMEDIATELY
+    elements: list = ()
+
+
+Packet = Union[OscMessage, OscBundle]
+
+
+# -- decoding ---------------------------------------------------------------
+
+PLAN_CACHE_SIZE = 1024
+
+# Decode plans, keyed by a message's raw header. Control traffic repeats a
+# handful of headers, so the address and tags are decoded once and a repeat
+# costs one dict lookup. When the type tag string fits in its first word
+# (",", up to two tags, NUL) the key runs through that word and no second
+# NUL search is needed. Longer headers are keyed through the tag string's NUL,
+# which makes them longer than any first-word key for the same address.
+# A run of fixed-width tags becomes one Struct: ",iif" is one unpack_from.
+_SEG_FIXED, _SEG_STRING, _SEG_BLOB, _SEG_CONST = range(4)
+_FIXED_FORMAT = {'i': 'i', 'f': 'f', 'h': 'q', 'd': 'd', 't': 'Q', 'c': 'i'}
+_CONSTANTS = {'T': True, 'F': False, 'N': None, 'I': IMPULSE}
+_plans: dict[bytes, tuple[str, str, tuple, int]] = {}
+_new = tuple.__new__
+
+
+def _padded(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def _char(value: int) -> str:
+    return chr(value & 0x10FFFF)
+
+
+def _fixed_segment(run: str) -> tuple:
+    packer = struct.Struct('>' + ''.join(_FIXED_FORMAT[tag] for tag in run))
+    converters = tuple(Timetag if tag == 't' else _char if tag == 'c' else None for tag in run)
+    return (_SEG_FIXED, packer, packer.size, converters if any(converters) else None)
+
+
+def _plan(buf: bytes, address_end: int, tags_start: int) -> tuple[str, str, tuple, int]:
+    """Compile (and cache) the plan for ``buf``'s header: address, tags, segments, first argument offset."""
+    tags_end = buf.find(b'\x00', tags_start)
+    if tags_end == -1:
+        raise OscDecodeError(f'unterminated type tags at {tags_start}')
+    key = buf[:tags_start + 4] if tags_end < tags_start + 4 else buf[:tags_end + 1]
+    plan = _plans.get(key)
+    if plan is not None:
+        return plan
+    tags = buf[tags_start + 1:tags_end].decode()
+    segments = []
+    run = ''
+    for tag in tags:
+        if tag in _FIXED_FORMAT:
+            run += tag
+            continue
+        if run:
+            segments.append(_fixed_segment(run))
+            run = ''
+        if tag == 's' or tag == 'S':
+            segments.append((_SEG_STRING,))
+        elif tag == 'b':
+            segments.append((_SEG_BLOB,))
+        elif tag in _CONSTANTS:
+            segments.append((_SEG_CONST, _CONSTANTS[tag]))
+        else:
+            raise OscDecodeError(f'unsupported type tag {tag!r}')
+    if run:
+        segments.append(_fixed_segment(run))
+    if len(_plans) >= PLAN_CACHE_SIZE:
+        _plans.clear()
+    plan = _plans[key] = (buf[:address_end].decode(), tags, tuple(segments), (tags_end + 4) & ~3)
+    return plan
+
+
+def _decode_bundle(buf: bytes, depth: int) -> OscBundle:
+    if len(buf) < 16 or not buf.startswith(BUNDLE_TAG):
+        raise OscDecodeError('not an OSC packet')
+    if depth >= MAX_BUNDLE_DEPTH:
+        raise OscDecodeError('bundle nesting too deep')
+    timetag = Timetag(_U64.unpack_from(buf, 8)[0])
+    pos = 16
+    end = len(buf)
+    elements = []
+    while pos < end:
+        if pos + 4 > end:
+            raise OscDecodeError(f'truncated bundle element at {pos}')
+        size = _I32.unpack_from(buf, pos)[0]
+        pos += 4
+        if size <= 0 or size % 4:
+            raise OscDecodeError(f'bad bundle element size {size}')
+        if pos + size > end:
+            raise OscDecodeError(f'truncated bundle element at {pos}')
+        element = buf[pos:pos + size]
+        elements.append(decode_packet(element) if element[:1] == b'/' else _decode_bundle(element, depth + 1))
+        pos += size
+    return _new(OscBundle, (timetag, elements))
+
+
+def decode_packet(data) -> Packet:
+    """Decode a datagram/SLIP frame into an ``OscMessage`` or ``OscBundle``. Raises ``OscDecodeError``."""
+    buf = data if type(data) is bytes else bytes(data)
+    if buf[:1] != b'/':
+        return _decode_bundle(buf, 0)
+    try:
+        nul = buf.find(b'\x00')
+        if nul == -1:
+            raise OscDecodeError('unterminated address')
+        pos = (nul + 4) & ~3
+        if buf[pos:pos + 1] != b',':
+            # OSC 1.0 allows a missing type tag string; treat as no arguments.
+            return _new(OscMessage, (buf[:nul].decode(), [], ''))
+        address, tags, segments, pos = _plans.get(buf[:pos + 4]) or _plan(buf, nul, pos)
+        end = len(buf)
+        args = []
+        for segment in segments:
+            kind = segment[0]
+            if kind == _SEG_FIXED:
+                size = segment[2]
+                if pos + size > end:
+                    raise OscDecodeError(f'truncated argument at {pos}')
+                if segment[3] is None:
+                    args += segment[1].unpack_from(buf, pos)
+                else:
+                    args += [v if c is None else c(v) for c, v in zip(segment[3], segment[1].unpack_from(buf, pos))]
+                pos += size
+            elif kind == _SEG_STRING:
+                nul = buf.find(b'\x00', pos)
+                if nul == -1:
+                    raise OscDecodeError(f'unterminated string at {pos}')
+                args.append(buf[pos:nul].decode())
+                pos = (nul + 4) & ~3
+            elif kind == _SEG_BLOB:
+                if pos + 4 > end:
+                    raise OscDecodeError(f'truncated argument at {pos}')
+                size = _I32.unpack_from(buf, pos)[0]
+                pos += 4
+                if size < 0:
+                    raise OscDecodeError(f'negative blob size at {pos}')
+                if pos + size > end:
+                    raise OscDecodeError(f'truncated argument at {pos}')
+                args.append(buf[pos:pos + size])
+                pos += _padded(size)
+            else:
+                args.append(segment[1])
+        return _new(OscMessage, (address, args, tags))
+    except UnicodeDecodeError as e:
+        raise OscDecodeError(str(e)) from e
+
+
+def iter_messages(packet: Packet, timetag: Timetag = IMMEDIATELY) -> Iterator[tuple[Timetag, OscMessage]]:
+    """Flatten bundles into ``(timetag, message)``; a nested bundle never fires before its parent."""
+    if isinstance(packet, OscMessage):
+        yield timetag, packet
+        return
+    own = packet.timetag
+    if timetag.immediate or (not own.immediate and own > timetag):
+        timetag = own
+    for element in packet.elements:
+        yield from iter_messages(element, timetag)
+
+
+def timetag_delay(timetag: Timetag, now: float | None = None) -> float:
+    """Seconds until ``timetag`` is due (0 for immediate or past timetags)."""
+    if timetag.immediate:
+        return 0.0
+    return max(0.0, timetag.to_unix() - (time.time() if now is None else now))
+
+
+# -- encoding ---------------------------------------------------------------
+
+PREFIX_CACHE_SIZE = 1024
+
+# Python type -> type tag for inference; bool, None, Timetag and the rest fall
+# back to ``typetag_for``.
+_TAG_BY_TYPE = {str: 's', int: 'i', float: 'f', bytes: 'b'}
+# NUL padding that follows a string of length n: ``_STRING_PAD[n & 3]``.
+_STRING_PAD = (b'\x00\x00\x00\x00', b'\x00\x00\x00', b'\x00\x00', b'\x00')
+
+# (address, typetags) -> (padded address + padded ",tags" string, encode
+# segments), shared by every reply with the same signature. Segments mirror
+# the decode plans: a run of fixed-width tags is one Struct.pack. Cleared
+# wholesale if it ever fills (addresses are a small set).
+_prefix_cache: dict[tuple[str, str], tuple[bytes, tuple]] = {}
+
+
+def _string(value: str) -> bytes:
+    raw = value.encode('utf-8')
+    return raw + _STRING_PAD[len(raw) & 3]
+
+
+def _encode_plan(address: str, typetags: str) -> tuple[bytes, tuple]:
+    key = (address, typetags)
+    plan = _prefix_cache.get(key)
+    if plan is not None:
+        return plan
+    segments = []
+    run = ''
+    for tag in typetags + '\x00':  # sentinel flushes the last fixed run
+        if tag in _FIXED_FORMAT:
+            run += tag
+            continue
+        if run:
+            packer = struct.Struct('>' + ''.join(_FIXED_FORMAT[t] for t in run))
+            converters = tuple(ord if t == 'c' else int if t == 't' else None for t in run)
+            segments.append((_SEG_FIXED, packer, len(run), converters if any(converters) else None))
+            run = ''
+        if tag == 's' or tag == 'S':
+            segments.append((_SEG_STRING,))
+        elif tag == 'b':
+            segments.append((_SEG_BLOB,))
+        elif tag in _CONSTANTS:
+            segments.append((_SEG_CONST,))
+        elif tag != '\x00':
+            raise TypeError(f'unsupported type tag {tag!r}')
+    if len(_prefix_cache) >= PREFIX_CACHE_SIZE:
+        _prefix_cache.clear()
+    plan = _prefix_cache[key] = (_string(address) + _string(',' + typetags), tuple(segments))
+    return plan
+
+
+def message_prefix(address: str, typetags: str) -> bytes:
+    return _encode_plan(address, typetags)[0]
+
+
+def typetag_for(value) -> str:
+    if value is True:
+        return 'T'
+    if value is False:
+        return 'F'
+    if value is None:
+        return 'N'
+    if value is IMPULSE:
+        return 'I'
+    if isinstance(value, Timetag):
+        return 't'
+    if isinstance(value, int):
+        return 'i' if -0x80000000 <= value <= 0x7FFFFFFF else 'h'
+    if isinstance(value, float):
+        return 'f'
+    if isinstance(value, str):
+        return 's'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return 'b'
+    raise TypeError(f'cannot encode {type(value).__name__} as OSC')
+
+
+def encode_message(address: str, args=None, typetags: str | None = None) -> bytes:
+    """Encode one message. ``typetags`` overrides inference (e.g. ``'d'`` for a double).
+
+    The address/type-tag prefix and the argument layout come from a cache;
+    the parts are joined once at the end.
+    """
+    if not args:
+        if typetags:
+            raise ValueError('typetags and args differ in length')
+        return _encode_plan(address, '')[0]
+    if type(args) is not list and type(args) is not tuple:
+        args = list(args)
+    if typetags is None:
+        typetags = ''
+        for value in args:
+            tag = _TAG_BY_TYPE.get(type(value))
+            if tag is None or (tag == 'i' and not -0x80000000 <= value <= 0x7FFFFFFF):
+                tag = typetag_for(value)
+            typetags += tag
+    elif len(typetags) != len(args):
+        raise ValueError('typetags and args differ in length')
+    prefix, segments = _prefix_cache.get((address, typetags)) or _encode_plan(address, typetags)
+    parts = [prefix]
+    i = 0
+    for segment in segments:
+        kind = segment[0]
+        if kind == _SEG_FIXED:
+            count = segment[2]
+            values = args[i:i + count]
+            if segment[3] is not None:
+                values = [v if c is None else c(v) for c, v in zip(segment[3], values)]
+            parts.append(segment[1].pack(*values))
+            i += count
+        elif kind == _SEG_STRING:
+            raw = args[i].encode('utf-8')
+            parts.append(raw + _STRING_PAD[len(raw) & 3])
+            i += 1
+        elif kind == _SEG_BLOB:
+            raw = bytes(args[i])
+            parts.append(_I32.pack(len(raw)) + raw + b'\x00' * (-len(raw) % 4))
+            i += 1
+        else:
+            i += 1
+    return b''.join(parts)
+
+
+def encode_packet(packet: Packet) -> bytes:
+    if isinstance(packet, OscMessage):
+        return encode_message(packet.address, packet.args, packet.typetags or None)
+    return encode_bundle(packet.timetag, packet.elements)
+
+
+def encode_bundle(timetag=IMMEDIATELY, elements=()) -> bytes:
+    """Encode a bundle; elements may be ``OscMessage``/``OscBundle`` objects or encoded bytes."""
+    parts = [BUNDLE_TAG, _U64.pack(int(timetag))]
+    for element in elements:
+        raw = element if isinstance(element, (bytes, bytearray)) else encode_packet(element)
+        parts.append(_I32.pack(len(raw)))
+        parts.append(raw)
+    return b''.join(parts)
+
+
+def encode_list_bundles(address: str, items, max_size: int, timetag=IMMEDIATELY) -> list[bytes]:
+    """One ``address item`` message per item, packed into as few bundles of at most ``max_size`` bytes as possible."""
+    bundles = []
+    batch: list[bytes] = []
+    size = 16
+    for item in items:
+        raw = encode_message(address, item if isinstance(item, (list, tuple)) else [item])
+        if batch and size + 4 + len(raw) > max_size:
+            bundles.append(encode_bundle(timetag, batch))
+            batch, size = [], 16
+        batch.append(raw)
+        size += 4 + len(raw)
+    if batch:
+        bundles.append(encode_bundle(timetag, batch))
+    return bundles
+
+
+# -- compatibility ------------------------------------------------------------
+
+def parse_osc_message(data):
+    """Single-message parse returning ``(address, args)``; ``(None, [])`` on error or bundle."""
+    try:
+        packet = decode_packet(data)
+    except OscDecodeError:
+        return None, []
+    if isinstance(packet, OscBundle):
+        return None, []
+    return packet.address, packet.args
+
+
+def create_osc_message(address, args=None):
+    """Create OSC message bytes."""
+    return encode_message(address, args)
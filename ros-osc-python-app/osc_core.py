@@ -0,0 +1,1108 @@
+"""UI-free OSC bridge: OSC server, API client, timer state and live updates.
+
+``OscBridge`` owns everything that makes the bridge work without a window:
+- the OSC server, dispatcher, router and subscriptions;
+- the pooled API client, command executor and offline outbox;
+- the event cache, schedule and timer state;
+- the server clock and the Socket.IO supervisor.
+
+Most state changes run on the ``dispatcher`` passed in: the Tk app passes
+its ``UiDispatcher``, ``osc_daemon.py`` a ``ThreadDispatcher``. Some writes
+happen where the data arrives instead: optimistic timer changes and their
+undo run on OSC worker and command lane threads, ``/set-day`` on an OSC
+worker, and pushed schedules are cached from the socket thread. Those go
+through ``_state_lock`` (timer and day) or the cache's own lock, and the
+read-modify-write of the timer is done under the lock so a late undo never
+overwrites a newer state.
+
+A front-end hears about changes through ``BridgeHooks``. The callbacks are
+all optional and always run on the dispatcher thread. The Tk app in
+``app.py`` is one such front-end; without hooks the bridge runs headless.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from api_commands import Command, CommandExecutor
+from coalesce import CoalescingRunner
+from command_outbox import OUTBOX_NAME, CommandOutbox
+from local_cache import CACHE_NAME, LocalCache, cache_key, describe_age
+from osc_dispatch import OscDispatcher
+from osc_router import OscArgumentError, OscRouter, osc_route
+from osc_server import OSCServer, DEFAULT_RECV_BUFFER, TRANSPORTS
+from osc_subscriptions import SubscriptionRegistry
+from ros_api import RUN_OF_SHOW, EventSnapshot, RosApi, schedule_items_of
+from schedule_model import ScheduleModel, item_cue, item_custom_fields
+from schedule_store import ScheduleStore
+from server_clock import ServerClock, format_server_time, parse_server_time, sample_http
+from timer_state import IDLE, reduce_timer
+from ws_supervisor import SocketSupervisor
+
+# API Configuration (same pattern as websocket_osc_app.py)
+API_BASE_URL = os.getenv('API_BASE_URL', 'https://ros-50-production.up.railway.app')
+# API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:3002')  # Uncomment for local
+_osc_port_env = os.getenv('OSC_LISTEN_PORT', '57121')
+try:
+    OSC_PORT = int(_osc_port_env) if _osc_port_env else 57121
+except (ValueError, TypeError):
+    OSC_PORT = 57121
+try:
+    OSC_WORKERS = max(1, int(os.getenv('OSC_WORKERS', '4')))
+except (ValueError, TypeError):
+    OSC_WORKERS = 4
+OSC_TRANSPORT = (os.getenv('OSC_TRANSPORT', 'udp') or 'udp').strip().lower()
+if OSC_TRANSPORT not in TRANSPORTS:
+    OSC_TRANSPORT = 'udp'
+try:
+    OSC_RECV_BUFFER = int(os.getenv('OSC_RECV_BUFFER', str(DEFAULT_RECV_BUFFER)))
+except (ValueError, TypeError):
+    OSC_RECV_BUFFER = DEFAULT_RECV_BUFFER
+
+# Socket 'update' types that mean the run-of-show rows changed.
+SCHEDULE_UPDATE_TYPES = frozenset({'runOfShowDataUpdated', 'scheduleUpdated'})
+
+# Server clock: samples per sync round and seconds between rounds (an event load also triggers one).
+# /api/time answers without touching the database; /health is the fallback for servers without it.
+CLOCK_SYNC_BURST = 4
+CLOCK_SYNC_INTERVAL_SEC = 60
+CLOCK_SYNC_PATHS = ('/api/time', '/health')
+
+APP_DIR = os.path.join(os.getenv('LOCALAPPDATA') or os.path.expanduser('~'), 'ros-osc-python-app')
+LOG_DIR = os.path.join(APP_DIR, 'logs')
+
+WS_URL = API_BASE_URL.replace('https://', 'wss://').replace('http://', 'ws://')
+
+
+def filter_events(events, which='upcoming', today=None):
+    """Events dated today or later (``upcoming``) or before today (``past``); undated events are skipped."""
+    today = today or datetime.now().date()
+    shown = []
+    for ev in events or []:
+        d = ev.get('date')
+        if not d:
+            continue
+        if isinstance(d, str) and 'T' in d:
+            d = d.split('T')[0]
+        try:
+            parts = d.split('-')
+            if len(parts) != 3:
+                continue
+            y, m, day = int(parts[0]), int(parts[1]), int(parts[2])
+            event_date = datetime(y, m, day).date()
+            if which == 'upcoming' and event_date >= today:
+                shown.append(ev)
+            elif which == 'past' and event_date < today:
+                shown.append(ev)
+        except (ValueError, IndexError):
+            continue
+    return shown
+
+
+@dataclass
+class BridgeHooks:
+    """Front-end callbacks, all optional, all called on the dispatcher thread."""
+    events: Optional[Callable[[list], Any]] = None                     # filtered event list (see set_event_filter)
+    event_loaded: Optional[Callable[[dict], Any]] = None               # an event was opened (days are in bridge.schedule)
+    schedule_changed: Optional[Callable[[Optional[tuple]], Any]] = None  # changed item ids, or None = redraw all
+    day_changed: Optional[Callable[[int], Any]] = None
+    tick: Optional[Callable[[int], Any]] = None                        # every second while a cue is loaded
+    status: Optional[Callable[[str, str], Any]] = None                 # ('osc' | 'ws', text)
+    error: Optional[Callable[[str, str], Any]] = None                  # (title, message) for the operator
+
+
+class OscBridge:
+    def __init__(
+        self,
+        dispatcher,
+        log_sink,
+        *,
+        hooks: Optional[BridgeHooks] = None,
+        api_base_url: str = API_BASE_URL,
+        osc_port: int = OSC_PORT,
+        osc_transport: str = OSC_TRANSPORT,
+        osc_recv_buffer: int = OSC_RECV_BUFFER,
+        osc_workers: int = OSC_WORKERS,
+        app_dir: str = APP_DIR,
+    ):
+        self.ui = dispatcher
+        self.log_sink = log_sink
+        self.hooks = hooks or BridgeHooks()
+        self.api_base_url = api_base_url
+        self.api = RosApi(api_base_url)
+        try:
+            self.cache = LocalCache(os.path.join(app_dir, CACHE_NAME))  # offline copy of events/schedules
+            self.outbox = CommandOutbox(os.path.join(app_dir, OUTBOX_NAME))  # timer commands made while offline
+        except Exception:
+            self.cache = LocalCache(':memory:')
+            self.outbox = CommandOutbox(':memory:')
+        self.commands = CommandExecutor(
+            self.api,
+            outbox=self.outbox,
+            on_result=self._on_command_result,
+            on_replay=self._on_command_replayed,
+        )
+        self.osc_server = OSCServer(
+            port=osc_port,
+            transport=osc_transport,
+            recv_buffer=osc_recv_buffer,
+            on_message=self._on_osc_message,
+            on_client_gone=self._on_osc_client_gone,
+        )
+        self.osc_subscriptions = SubscriptionRegistry(self.osc_server.send_packet)
+        self.osc_router = OscRouter()
+        self.osc_router.include(self)
+        self.osc_dispatch = OscDispatcher(self._handle_osc, workers=osc_workers)
+        self.current_event = None
+        self.current_event_id = None
+        self.schedule = ScheduleModel()
+        self.schedule_store = ScheduleStore()  # per-item hashes across refreshes; see schedule_store.py
+        self._state_lock = threading.RLock()  # timer, current_day and cached snapshots; see module docstring
+        self.timer = IDLE          # active cue (only one at a time, like Electron); see timer_state.py
+        self.clock = ServerClock()  # server time on a monotonic base; see server_clock.py
+        self._clock_sync = threading.Event()
+        self._closed = threading.Event()
+        self._schedule_refetch = CoalescingRunner(self._fetch_schedule_update, name='schedule-refetch')
+        self.auto_refresh_interval_sec = 0  # 0 = off; see set_auto_refresh
+        self._auto_refresh_lock = threading.Lock()
+        self._auto_refresh_timer = None
+        self.start_cue_id = None  # item_id of row marked as SHOW START (STAR)
+        self.all_events = []
+        self.event_filter = 'upcoming'
+        self.filtered_events = []
+        self.current_day = 1
+        self.default_day = None  # day to open events on (headless --day); None = first day
+        self.ws = None  # SocketSupervisor; see connect_websocket
+        self.processing_messages = False
+
+    def start(self):
+        """Start serving: OSC first, then clock sync, the socket and the event list."""
+        self.start_message_processor()
+        self.start_osc_server()
+        self.start_clock_sync()
+        self.connect_websocket()
+        self.load_events()
+        threading.Thread(target=self._tick_loop, name='timer-tick', daemon=True).start()
+
+    def close(self):
+        self._closed.set()
+        self.processing_messages = False
+        self.osc_dispatch.stop()
+        self._schedule_refetch.stop()
+        self._stop_auto_refresh()
+        self.osc_server.stop()
+        self.commands.close()
+        self.api.close()
+        self.cache.close()
+        self.outbox.close()
+        if self.ws is not None:
+            self.ws.stop()
+
+    def log_message(self, message, level="info"):
+        """Thread-safe: ring buffer + rotating file/console via the log sink."""
+        self.log_sink.log(message, level if level in ("success", "error", "warning", "info") else "")
+
+    def _status(self, field, text):
+        if self.hooks.status:
+            self.ui.post(('status', field), lambda: self.hooks.status(field, text))
+
+    def _error(self, title, message):
+        if self.hooks.error:
+            self.ui.call(self.hooks.error, title, message)
+
+    @property
+    def active_item_id(self):
+        return self.timer.item_id
+
+    def _set_timer(self, state):
+        """Swap in a new TimerState (any thread); the 1s tick runs while a cue is loaded."""
+        with self._state_lock:
+            self.timer = state
+
+    def _reduce_timer(self, action, payload=None):
+        """Apply a ``reduce_timer`` action to the current state atomically (any thread)."""
+        with self._state_lock:
+            self.timer = reduce_timer(self.timer, action, payload)
+            return self.timer
+
+    def _tick_loop(self):
+        """Every second while a cue is loaded: OSC state push and the front-end's countdown (no API calls)."""
+        count = 0
+        while not self._closed.wait(1.0):
+            if not self.current_event_id or not self.timer.active:
+                count = 0
+                continue
+            count += 1
+            self.ui.post('timer_tick', lambda n=count: self._tick(n))
+
+    def _tick(self, count):
+        self._publish_osc_state()
+        if self.hooks.tick:
+            self.hooks.tick(count)
+
+    def start_clock_sync(self):
+        """Sample the server clock from /api/time: a burst now and after each event load, then once a minute."""
+        def run():
+            paths = list(CLOCK_SYNC_PATHS)
+            while not self._closed.is_set():
+                for _ in range(CLOCK_SYNC_BURST):
+                    try:
+                        if not sample_http(self.clock, self.api.url(paths[0]), self.api.session.get) and len(paths) > 1:
+                            paths.pop(0)  # older server: fall back to the next endpoint for good
+                    except Exception:
+                        pass
+                self.log_message(self.clock.describe())
+                self._clock_sync.wait(CLOCK_SYNC_INTERVAL_SEC)
+                self._clock_sync.clear()
+
+        threading.Thread(target=run, name='clock-sync', daemon=True).start()
+
+    @property
+    def schedule_data(self):
+        return self.schedule.items
+
+    @schedule_data.setter
+    def schedule_data(self, items):
+        self._apply_schedule_items(items)
+
+    def _apply_schedule_items(self, items):
+        """Diff ``items`` into the store; lookup maps are rebuilt only when something changed. Returns the SchedulePatch."""
+        patch = self.schedule_store.replace(items)
+        if not patch.empty:
+            self.schedule = ScheduleModel(self.schedule_store.items)
+        return patch
+
+    def _schedule_changed(self, changed=None):
+        """Dispatcher thread: schedule, timer or STAR row changed. ``changed`` limits the redraw to those item ids."""
+        star = self.start_cue_id
+        self._update_start_cue_id()
+        if self.start_cue_id != star:
+            changed = None  # the STAR moved: both rows need redrawing
+        self._publish_osc_state()
+        if self.hooks.schedule_changed:
+            self.hooks.schedule_changed(changed)
+
+    # -- events -----------------------------------------------------------------
+
+    def load_events(self):
+        """Deliver the cached event list at once, then refresh it from the API in the background."""
+        self.log_message("Loading events...")
+
+        def deliver(events, cached):
+            self.ui.call(self._apply_events, events, cached)
+
+        def do_load():
+            try:
+                if not self.cache.revalidate(cache_key(self.api_base_url, 'events'), self.api.list_events, deliver):
+                    self.log_message("API unreachable; showing the cached event list", "warning")
+            except Exception as e:
+                self.log_message(f"Error loading events: {e}", "error")
+
+        threading.Thread(target=do_load, daemon=True).start()
+
+    def _apply_events(self, events, cached=None):
+        self.all_events = events
+        self.set_event_filter(self.event_filter)
+        note = f" (cached {describe_age(cached.age)} ago)" if cached else ""
+        self.log_message(f"Loaded {len(self.all_events)} events{note}")
+
+    def set_event_filter(self, which):
+        """``upcoming`` or ``past``: the list shown by the front-end and returned by /list-events."""
+        self.event_filter = which
+        self.filtered_events = filter_events(self.all_events, which)
+        if self.hooks.events:
+            self.hooks.events(self.filtered_events)
+
+    def open_event(self, event_id, ev=None):
+        """Load event in background so the dispatcher stays responsive."""
+        self.log_message(f"Loading event: {event_id}", "info")
+        ev_ref = ev or next(
+            (e for e in (self.all_events or []) if str(e.get('id')) == str(event_id)),
+            None
+        )
+        if not ev_ref:
+            ev_ref = {'id': event_id, 'name': 'Event', 'date': '', 'location': ''}
+
+        def do_load():
+            # Stale-while-revalidate: show the cached copy at once, then the fresh one.
+            cached = self.cache.get(cache_key(self.api_base_url, 'event', event_id))
+            if cached is not None:
+                self.ui.call(self._apply_event_loaded, EventSnapshot.from_cache(event_id, cached.value, cached.age), ev_ref)
+            snapshot = self.api.event_snapshot(event_id)
+            if not snapshot.has_schedule:
+                error = snapshot.errors.get('run_of_show', '')
+                if cached is not None:
+                    self.log_message(
+                        f"API unreachable ({error}); running from the schedule cached {describe_age(cached.age)} ago",
+                        "warning",
+                    )
+                    return
+                self.log_message(f"Event not found: {event_id} ({error})", "error")
+                self._error("Error", f"Event not found: {event_id}\n{error}")
+                return
+            self.log_message(f"Event data fetched in {snapshot.elapsed_ms:.0f} ms", "info")
+            self._store_snapshot(snapshot)
+            self._clock_sync.set()
+            if cached is None:
+                self.ui.call(self._apply_event_loaded, snapshot, ev_ref)
+            else:
+                self.ui.call(self._apply_fresh_snapshot, snapshot)
+
+        threading.Thread(target=do_load, daemon=True).start()
+
+    def _store_snapshot(self, snapshot):
+        """Write what ``snapshot`` fetched to the offline cache, keeping cached parts it did not fetch."""
+        key = cache_key(self.api_base_url, 'event', snapshot.event_id)
+        try:
+            with self._state_lock:  # socket pushes and loads merge into the same entry
+                previous = self.cache.get(key)
+                self.cache.put(key, snapshot.to_cache(previous.value if previous else None))
+        except Exception as e:
+            self.log_message(f"Cache write failed: {e}", "warning")
+
+    def _apply_fresh_snapshot(self, snapshot):
+        """Fresh data for the event shown from cache; ignored if the user has moved on."""
+        if str(self.current_event_id) == str(snapshot.event_id):
+            self._apply_refresh_results(snapshot)
+
+    def _apply_event_loaded(self, snapshot, ev_ref):
+        """Apply loaded event data on the dispatcher thread (no blocking)."""
+        event_id = snapshot.event_id
+        try:
+            self.schedule_data = snapshot.schedule_items
+            self.current_event_id = event_id
+            self.current_event = ev_ref
+            self._set_timer(IDLE)
+            self.start_cue_id = None
+
+            sorted_days = self.schedule.days or [1]
+            with self._state_lock:
+                self.current_day = self.default_day if self.default_day in sorted_days else sorted_days[0]
+
+            # Apply timer state (same logic as _apply_refresh_results)
+            if snapshot.has_timers:
+                self._reduce_timer('record', snapshot.timers)
+
+            # Apply STAR row
+            if snapshot.has_start_cue:
+                self.start_cue_id = snapshot.start_cue_id
+            if self.hooks.event_loaded:
+                self.hooks.event_loaded(self.current_event)
+            self._schedule_changed()
+            self.join_event_room(event_id)
+            self._start_auto_refresh()
+            note = f" (cached {describe_age(snapshot.cached_age)} ago)" if snapshot.cached_age is not None else ""
+            self.log_message(f"Event loaded: {len(self.schedule_data)} schedule items{note}", "success")
+        except Exception as e:
+            self.log_message(f"Error loading event: {e}", "error")
+            self._error("Error", str(e))
+
+    def close_event(self):
+        event_id = self.current_event_id
+        self.current_event = None
+        self.current_event_id = None
+        self.schedule_data = []
+        self._set_timer(IDLE)
+        self._stop_auto_refresh()
+        self._schedule_refetch.cancel()
+        if event_id is not None and self.ws is not None:
+            # Stay connected for the next event; just stop receiving this one's updates.
+            self.ws.emit('leaveEvent', str(event_id))
+
+    def set_day(self, day):
+        with self._state_lock:
+            self.current_day = day
+        self._schedule_changed()
+
+    # -- refresh ------------------------------------------------------------------
+
+    def set_auto_refresh(self, seconds):
+        """Refetch the open event every ``seconds`` (0 = off, the default)."""
+        self.auto_refresh_interval_sec = max(0, int(seconds or 0))
+        if self.auto_refresh_interval_sec and self.current_event_id:
+            self._start_auto_refresh()
+        else:
+            self._stop_auto_refresh()
+
+    def _start_auto_refresh(self):
+        """Only fetch on the chosen interval; refresh_schedule does run-of-show + active-timers + start-cue."""
+        self._stop_auto_refresh()
+        if not self.current_event_id or self.auto_refresh_interval_sec <= 0:
+            return
+
+        def tick():
+            if not self.current_event_id or self.auto_refresh_interval_sec <= 0:
+                return
+            try:
+                self.refresh_schedule()  # 3 API calls only, at this interval
+            except Exception:
+                pass
+            self._start_auto_refresh()
+
+        timer = threading.Timer(self.auto_refresh_interval_sec, tick)
+        timer.daemon = True
+        with self._auto_refresh_lock:
+            self._auto_refresh_timer = timer
+        timer.start()
+
+    def _stop_auto_refresh(self):
+        with self._auto_refresh_lock:
+            timer, self._auto_refresh_timer = self._auto_refresh_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def refresh_schedule(self):
+        """Refetch schedule and sync timer state in a background thread so the UI/log don't hang."""
+        if not self.current_event_id:
+            return
+        self.log_message("Refreshing...", "info")
+
+        event_id = self.current_event_id
+
+        def do_refresh():
+            snapshot = self.api.event_snapshot(event_id)
+            if not snapshot.fetched:
+                self.log_message(f"Refresh failed: {snapshot.errors.get('run_of_show', '')}", "error")
+                return
+            self._store_snapshot(snapshot)
+            self.ui.call(self._apply_refresh_results, snapshot)
+
+        threading.Thread(target=do_refresh, daemon=True).start()
+
+    def _apply_refresh_results(self, snapshot):
+        """Apply an EventSnapshot on the dispatcher thread and update log (loaded/running)."""
+        try:
+            if snapshot.has_schedule:
+                self.schedule_data = snapshot.schedule_items
+
+            # Apply timer state from active-timers response (same logic as _sync_timer_status)
+            if snapshot.has_timers:
+                self._reduce_timer('record', snapshot.timers)
+            else:
+                self._set_timer(IDLE)
+
+            # Apply STAR row from start-cue-selection response
+            if snapshot.has_start_cue:
+                self.start_cue_id = snapshot.start_cue_id
+            # else leave start_cue_id unchanged
+
+            self._schedule_changed()
+
+            # Log so user always sees refresh + loaded/running state in event log
+            self.log_message("Schedule refreshed", "success")
+            if self.active_item_id is not None:
+                self.log_message(f"Current cue: {self.timer.state}", "info")
+        except Exception as e:
+            self.log_message(f"Refresh failed: {e}", "error")
+
+    def _sync_timer_status(self):
+        """Fetch current timer state from API (same as Electron syncTimerStatus)."""
+        if not self.current_event_id:
+            return
+        try:
+            r = self.api.get(f"/api/active-timers/{self.current_event_id}")
+            if r.status_code != 200:
+                return
+            self._reduce_timer('record', r.json())
+            self.ui.post('schedule', self._schedule_changed)
+        except Exception as e:
+            self.log_message(f"Sync timer: {e}", "warning")
+
+    # -- SHOW START (STAR) ------------------------------------------------------------
+
+    def _update_start_cue_id(self):
+        """Set start_cue_id from schedule when present; do not clear if only in API."""
+        for it in (self.schedule_data or []):
+            if it.get('isStartCue') is True:
+                self.start_cue_id = it.get('id')
+                return
+        # If no schedule item has isStartCue, leave start_cue_id unchanged (API may have it)
+
+    def _fetch_start_cue_selection(self):
+        """Fetch which cue is marked as START from API and set start_cue_id."""
+        if not self.current_event_id:
+            return
+        try:
+            r = self.api.get(f"/api/start-cue-selection/{self.current_event_id}")
+            if r.status_code == 200:
+                data = r.json()
+                if data is not None and data.get('itemId') is not None:
+                    self.start_cue_id = int(data['itemId']) if not isinstance(data['itemId'], int) else data['itemId']
+                    self.log_message(f"STAR row from API: item {self.start_cue_id}", "info")
+                else:
+                    self.start_cue_id = None
+                self._schedule_changed()
+        except Exception as e:
+            self.log_message(f"Could not fetch start-cue-selection: {e}", "warning")
+
+    def toggle_start_cue(self, item_id):
+        """Set or unset the STAR row via API."""
+        if not self.current_event_id:
+            return
+        is_currently_star = self.start_cue_id == item_id
+        try:
+            if is_currently_star:
+                r = self.api.request(
+                    'DELETE', "/api/start-cue-selection",
+                    json={"event_id": self.current_event_id, "item_id": item_id},
+                )
+                if r.status_code in (200, 404):
+                    self.start_cue_id = None
+                    self.log_message("SHOW START unmarked", "info")
+            else:
+                r = self.api.request(
+                    'POST', "/api/start-cue-selection",
+                    json={"event_id": self.current_event_id, "item_id": item_id},
+                )
+                if r.status_code == 200:
+                    self.start_cue_id = item_id
+                    self.log_message(f"Marked as SHOW START (item {item_id})", "success")
+            self._schedule_changed()
+        except Exception as e:
+            self.log_message(f"Failed to update SHOW START: {e}", "error")
+
+    # -- OSC state push -------------------------------------------------------------------
+
+    def _osc_state(self):
+        """Snapshot pushed to /subscribe clients as /state/<key>."""
+        timer = self.timer
+        item = self.schedule.get(timer.item_id) if timer.active else None
+        return {
+            'event': str(self.current_event_id or ''),
+            'day': self.current_day,
+            'cue': (item_cue(item) or '') if item else '',
+            'segment': item.get('segmentName', '') if item else '',
+            'running': bool(item and timer.running),
+            'remaining': timer.remaining(self.clock.now()) if item else 0,
+        }
+
+    def _publish_osc_state(self):
+        try:
+            self.osc_subscriptions.publish(self._osc_state())
+        except Exception as e:
+            self.log_message(f"OSC push failed: {e}", "error")
+
+    # -- Socket.IO ----------------------------------------------------------------------------
+
+    def connect_websocket(self):
+        """Start the Socket.IO supervisor: real-time updates like the Electron app, reconnecting on its own."""
+        if self.ws is not None:
+            self.ws.stop()
+        self.ws = ws = SocketSupervisor(
+            self.api_base_url,
+            on_connect=self._on_ws_connect,
+            on_disconnect=self._on_ws_disconnect,
+            on_status=lambda text: self._status('ws', text),
+            probe=self._ws_probe,
+        )
+
+        @ws.on('update')
+        def on_update(message):
+            """Handle real-time updates from server (timer, schedule, reset) - same as Electron."""
+            try:
+                msg = message or {}
+                msg_type = msg.get('type')
+                data = msg.get('data')
+                event_id = msg.get('eventId') or (data or {}).get('event_id')
+                if event_id is not None and str(event_id) != str(self.current_event_id):
+                    return
+                # Timer transitions are all applied, in order (a reset then a load must not lose the reset);
+                # the redraw they trigger is what coalesces.
+                if msg_type == 'timerUpdated':
+                    self.ui.call(self._handle_timer_updated, data)
+                elif msg_type == 'timerStopped':
+                    self.ui.call(self._handle_timer_stopped, data)
+                # Schedule edits: a payload carrying the rows is diffed in place (latest wins);
+                # otherwise bursts coalesce into one conditional GET (a cheap 304 when nothing changed).
+                elif msg_type in SCHEDULE_UPDATE_TYPES:
+                    if isinstance(data, dict) and 'schedule_items' in data:
+                        self._handle_schedule_pushed(data)
+                    else:
+                        self._handle_schedule_updated()
+                elif msg_type == 'resetAllStates':
+                    self.ui.call(self._handle_reset_states)
+            except Exception as e:
+                self.log_message(f"WS update error: {e}", "error")
+
+        @ws.on('serverTime')
+        def on_server_time(data):
+            """Sent on connect/joinEvent; only checked for a server clock step between /api/time round trips."""
+            if isinstance(data, dict) and self.clock.add_one_way(parse_server_time(data.get('serverTime'))):
+                self.log_message("Server clock stepped forward; resyncing", "warning")
+                self._clock_sync.set()
+
+        @ws.on('startCueSelectionUpdate')
+        def on_start_cue_selection(data):
+            """When another client marks/unmarks the STAR row."""
+            try:
+                if not data or str(data.get('event_id')) != str(self.current_event_id):
+                    return
+                item_id = data.get('item_id')
+                self.start_cue_id = int(item_id) if item_id is not None else None
+                self.ui.post('schedule', self._schedule_changed)
+            except Exception:
+                pass
+
+        ws.start()
+
+    def _on_ws_connect(self, reconnect):
+        """Supervisor thread, after every connect: rejoin the event room; after a drop, resync once."""
+        self.log_message("Socket.IO reconnected" if reconnect else "Socket.IO connected", "success")
+        event_id = self.current_event_id
+        if not event_id:
+            return
+        self.ws.emit('joinEvent', str(event_id))
+        if reconnect:
+            self._resync_event(event_id)
+
+    def _on_ws_disconnect(self):
+        self.log_message("Socket.IO disconnected", "warning")
+
+    def _ws_probe(self):
+        """Heartbeat: the server answers joinEvent with serverTime. Nothing to probe without an event."""
+        return bool(self.current_event_id) and self.ws.emit('joinEvent', str(self.current_event_id))
+
+    def _resync_event(self, event_id):
+        """One consolidated fetch after a reconnect; anything that changed while offline counts as missed."""
+        snapshot = self.api.event_snapshot(event_id)
+        if not snapshot.fetched:
+            self.log_message(f"Resync failed: {snapshot.errors.get('run_of_show', '')}", "warning")
+            return
+        self._store_snapshot(snapshot)
+        self.ui.call(self._apply_resync, snapshot)
+
+    def _apply_resync(self, snapshot):
+        if str(self.current_event_id) != str(snapshot.event_id):
+            return
+        missed = 0
+        if snapshot.has_schedule and snapshot.schedule_items != self.schedule_data:
+            missed += 1
+        if snapshot.has_timers and reduce_timer(self.timer, 'record', snapshot.timers) != self.timer:
+            missed += 1
+        if snapshot.has_start_cue and snapshot.start_cue_id != self.start_cue_id:
+            missed += 1
+        if missed:
+            self.ws.record_missed(missed)
+        self._apply_refresh_results(snapshot)
+        self.log_message(f"Resynced after reconnect ({missed} missed update(s); {self.ws.describe()})", "info")
+
+    def _handle_timer_updated(self, data):
+        """Update timer state from broadcast (same as Electron handleTimerUpdate)."""
+        if not data or str(data.get('event_id')) != str(self.current_event_id):
+            return
+        if data.get('item_id') is None:
+            return
+        self._reduce_timer('updated', data)
+        self.ui.post('schedule', self._schedule_changed)
+        self.log_message("Timer/cue update (live)", "info")
+
+    def _handle_timer_stopped(self, data):
+        """Clear timer state when stop is broadcast (same as Electron handleTimerStopped)."""
+        if data and str(data.get('event_id')) != str(self.current_event_id):
+            return
+        self._set_timer(IDLE)
+        self.ui.post('schedule', self._schedule_changed)
+        self.log_message("Timer stopped (live)", "info")
+
+    def _handle_schedule_pushed(self, data):
+        """Socket payload with the full run-of-show row: apply it without another request."""
+        event_id = self.current_event_id
+        if not event_id:
+            return
+        snapshot = EventSnapshot(event_id=event_id, schedule_items=schedule_items_of(data), fetched=frozenset({RUN_OF_SHOW}))
+        self._store_snapshot(snapshot)
+        self.ui.post('schedule_push', lambda: self._apply_schedule_updated(snapshot))
+
+    def _handle_schedule_updated(self):
+        """Socket schedule edit: debounce ~0.25 s, merge bursts, always fetch once more after the last edit."""
+        if self.current_event_id:
+            self._schedule_refetch.trigger()
+
+    def _fetch_schedule_update(self):
+        """CoalescingRunner thread: one conditional GET of the current event's run-of-show data."""
+        event_id = self.current_event_id
+        if not event_id:
+            return
+        snapshot = self.api.event_snapshot(event_id, timers=False, start_cue=False)
+        if not snapshot.fetched:
+            self.log_message(f"Live schedule refresh failed: {snapshot.errors.get('run_of_show', '')}", "error")
+            return
+        self._store_snapshot(snapshot)
+        self.ui.call(self._apply_schedule_updated, snapshot)
+
+    def _apply_schedule_updated(self, snapshot):
+        """Apply a live schedule update on the dispatcher thread; a rows-only patch redraws just those rows."""
+        if str(self.current_event_id) != str(snapshot.event_id):
+            return
+        try:
+            patch = self._apply_schedule_items(snapshot.schedule_items)
+            if patch.empty:
+                return  # 304 or an identical body: nothing to redraw
+            self._schedule_changed(patch.changed if patch.rows_only else None)
+            self.log_message(f"Schedule updated (live): {patch.describe()}", "success")
+        except Exception as e:
+            self.log_message(f"Live schedule refresh failed: {e}", "error")
+
+    def _handle_reset_states(self):
+        """Clear timer state when reset is broadcast (same as Electron handleResetAllStates)."""
+        self._set_timer(IDLE)
+        self.ui.post('schedule', self._schedule_changed)
+        self.log_message("Reset (live)", "info")
+
+    def join_event_room(self, event_id):
+        """Join server event room so we receive real-time updates (server expects 'joinEvent', eventId)."""
+        if self.ws is not None and self.ws.emit('joinEvent', str(event_id)):
+            self.log_message(f"Joined event room: {event_id}", "info")
+
+    # -- OSC ----------------------------------------------------------------------------------
+
+    def start_osc_server(self):
+        if self.osc_server.start():
+            self.log_message(f"OSC running on {self.osc_server.describe()}", "success")
+            self._status('osc', f"OSC running on {self.osc_server.describe()}")
+        else:
+            self.log_message(f"OSC failed to start: {self.osc_server.error}", "error")
+            self._status('osc', "OSC failed to start")
+
+    def start_message_processor(self):
+        self.processing_messages = True
+        self.osc_dispatch.start()
+
+    def _on_osc_message(self, address, args, addr):
+        """OSC server loop thread (bundle messages at their timetag): queue for the dispatcher's workers."""
+        if not self.processing_messages:
+            return
+        try:
+            self.log_message(f"OSC: {address} {args}")
+            if not self.osc_dispatch.submit(address, args, addr):
+                self.log_message(f"OSC busy, dropped: {address}", "warning")
+                self.osc_server.send_response('/error', [f'busy: {address}'], addr)
+        except Exception as e:
+            self.log_message(f"OSC error: {e}", "error")
+
+    def _on_osc_client_gone(self, client):
+        """OSC server loop thread: a TCP client disconnected or a send to it failed."""
+        if self.osc_subscriptions.unsubscribe(client):
+            self.log_message(f"OSC client {client} unreachable; subscription dropped", "warning")
+
+    def _handle_osc(self, address, args, client_addr):
+        try:
+            # Unknown addresses are ignored, as before.
+            self.osc_router.dispatch(address, args, client_addr)
+        except OscArgumentError as e:
+            self.log_message(f"OSC: {e}", "warning")
+            self.osc_server.send_response('/error', [str(e)], client_addr)
+        except Exception as e:
+            self.log_message(f"OSC command error: {e}", "error")
+            try:
+                self.osc_server.send_response('/error', [str(e)], client_addr)
+            except Exception:
+                pass
+
+    @osc_route('/set-event', args=(str,))
+    def _osc_set_event(self, client_addr, event_id, *_):
+        self.ui.call(self.open_event, event_id)
+        self.osc_server.send_response('/event/set', [event_id], client_addr)
+
+    @osc_route('/list-events')
+    def _osc_list_events(self, client_addr, *args):
+        names = [f"{ev.get('name')} ({ev.get('id')})" for ev in self.filtered_events[:10]]
+        if args and args[0] == 'bundle':
+            # Opt-in: surfaces that unpack bundles get the whole list in one datagram.
+            self.osc_server.send_bundle('/events/list', names, client_addr)
+            return
+        for name in names:
+            self.osc_server.send_response('/events/list', [name], client_addr)
+
+    @osc_route('/cue/<cue_name>/load')
+    def _osc_load_cue(self, client_addr, *_, cue_name):
+        self._ack(self._load_cue(cue_name), client_addr, '/cue/loaded', [cue_name])
+
+    @osc_route('/timer/start')
+    def _osc_timer_start(self, client_addr, *_):
+        self._ack(self._start_timer(), client_addr, '/timer/started', ['ok'])
+
+    @osc_route('/timer/stop')
+    def _osc_timer_stop(self, client_addr, *_):
+        self._ack(self._stop_timer(), client_addr, '/timer/stopped', ['ok'])
+
+    @osc_route('/timer/reset')
+    def _osc_timer_reset(self, client_addr, *_):
+        self._ack(self._reset_timer(), client_addr, '/timer/reset', ['ok'])
+
+    @osc_route('/timer/adjust/<adj>')
+    def _osc_timer_adjust(self, client_addr, *_, adj):
+        try:
+            # '+1', '-1', '+5', '-5'
+            mult = 1 if adj.startswith('+') else -1
+            minutes = mult * int(adj.lstrip('+-'))
+        except ValueError:
+            self.log_message('Timer adjust: invalid value (use +1, -1, +5, -5)', 'warning')
+            return
+        self._ack(self._adjust_timer(minutes), client_addr, '/timer/adjusted', [f'{minutes:+d} min'])
+
+    @osc_route('/subtimer/cue/<cue_num>/start')
+    def _osc_subtimer_start(self, client_addr, *_, cue_num):
+        self._ack(self._start_subtimer(cue_num), client_addr, '/subtimer/started', [cue_num])
+
+    @osc_route('/subtimer/cue/<cue_num>/stop')
+    def _osc_subtimer_stop(self, client_addr, *_, cue_num):
+        self._ack(self._stop_subtimer(cue_num), client_addr, '/subtimer/stopped', [cue_num])
+
+    @osc_route('/set-day', args=(int,))
+    def _osc_set_day(self, client_addr, day, *_):
+        with self._state_lock:  # OSC worker thread
+            self.current_day = day
+        if self.hooks.day_changed:
+            self.ui.post('day', lambda: self.hooks.day_changed(day))
+        self.ui.post('schedule', self._schedule_changed)
+        self.osc_server.send_response('/day/set', [f'Day {day}'], client_addr)
+
+    @osc_route('/get-day')
+    def _osc_get_day(self, client_addr, *_):
+        self.osc_server.send_response('/day/current', [f'Day {self.current_day}'], client_addr)
+
+    @osc_route('/status')
+    def _osc_status(self, client_addr, *_):
+        msg = f"Event: {self.current_event_id}, Day: {self.current_day}, Active: {self.active_item_id or 'None'}"
+        self.osc_server.send_response('/status/info', [msg], client_addr)
+
+    @osc_route('/subscribe')
+    def _osc_subscribe(self, client_addr, *args):
+        try:
+            ttl = float(args[0]) if args else None
+        except (TypeError, ValueError):
+            ttl = None
+        granted = self.osc_subscriptions.subscribe(client_addr, ttl)
+        self.osc_server.send_response('/subscribed', [int(granted)], client_addr)
+
+    @osc_route('/unsubscribe')
+    def _osc_unsubscribe(self, client_addr, *_):
+        self.osc_subscriptions.unsubscribe(client_addr)
+        self.osc_server.send_response('/unsubscribed', ['ok'], client_addr)
+
+    @osc_route('/stats')
+    def _osc_stats(self, client_addr, *_):
+        self.osc_server.send_response('/stats/dispatch', [self.osc_dispatch.summary()], client_addr)
+        self.osc_server.send_response('/stats/clock', [self.clock.describe()], client_addr)
+        self.osc_server.send_response('/stats/api', [self.commands.summary()], client_addr)
+        if self.ws is not None:
+            self.osc_server.send_response('/stats/ws', [self.ws.describe()], client_addr)
+        r = self._schedule_refetch.stats()
+        self.osc_server.send_response('/stats/schedule', [
+            f"live refetch: {r['triggers']} pushes, {r['runs']} fetches, {r['coalesced']} coalesced, "
+            f"{self.api.not_modified} not modified"
+        ], client_addr)
+
+    # -- API commands ---------------------------------------------------------------------------
+
+    def _ack(self, future, client_addr, address, args):
+        """Reply ``address args`` once the API write succeeds, ``/queued`` if it waits in the outbox, ``/error`` if it fails."""
+        if future is None:
+            self.osc_server.send_response(address, args, client_addr)
+            return
+
+        def reply(f):
+            if f.cancelled():
+                return
+            result = f.result()
+            if result.ok:
+                self.osc_server.send_response(address, args, client_addr)
+            elif result.queued:
+                self.osc_server.send_response('/queued', [result.name], client_addr)
+            else:
+                self.osc_server.send_response('/error', [f"{result.name}: {result.error}"], client_addr)
+
+        future.add_done_callback(reply)
+
+    def _optimistic_timer(self, action, payload=None):
+        """Apply ``action`` now; the returned undo restores the previous state unless something newer arrived.
+
+        Runs on the OSC worker; the undo runs on a command lane thread.
+        """
+        with self._state_lock:
+            previous = self.timer
+            state = self._reduce_timer(action, payload)
+        self.ui.post('schedule', self._schedule_changed)
+
+        def undo():
+            with self._state_lock:
+                if self.timer is not state:
+                    return
+                self.timer = previous
+            self.ui.post('schedule', self._schedule_changed)
+        return undo
+
+    def _on_command_result(self, cmd, result):
+        if result.ok:
+            return
+        if result.queued:
+            self.log_message(f"API unreachable: {cmd.name} queued for replay ({self.commands.queued()} waiting)", 'warning')
+            return
+        note = ' (local change rolled back)' if result.rolled_back else ''
+        self.log_message(
+            f"{cmd.name} failed after {result.attempts} attempt(s), {result.latency_ms:.0f} ms: {result.error}{note}",
+            'error',
+        )
+
+    def _on_command_replayed(self, queued, result):
+        if result.ok:
+            self.log_message(f"Replayed {queued.name} queued {describe_age(queued.age)} ago", 'success')
+        else:
+            self.log_message(f"Dropped queued {queued.name}: {result.error}", 'error')
+
+    def _load_cue(self, cue_name):
+        """Load cue via API with duration and metadata (same as Electron loadCueById)."""
+        if not self.current_event_id:
+            raise RuntimeError("No event loaded")
+        schedule = self.schedule
+        item = schedule.find_cue(self.current_day, cue_name)
+        if item is None:
+            raise RuntimeError(f"Cue {cue_name} not found")
+        item_id = item['id']
+        # Duration in seconds (same as Electron), precomputed per schedule load
+        duration_seconds = schedule.duration.get(item_id, 0)
+        if duration_seconds <= 0:
+            duration_seconds = 300
+        # Row number (1-based index in full schedule, like Electron)
+        row_number = schedule.row_number.get(item_id, 1)
+        cue_is = item_custom_fields(item).get('cue') or item.get('timerId') or f'CUE {item_id}'
+        timer_id = item.get('timerId') or f'TMR{item_id}'
+        return self.commands.submit(Command(
+            'cue/load', 'POST', '/api/cues/load',
+            json={
+                'event_id': self.current_event_id,
+                'item_id': item_id,
+                'user_id': 'python-osc-app',
+                'duration_seconds': duration_seconds,
+                'row_is': row_number,
+                'cue_is': cue_is,
+                'timer_id': timer_id,
+            },
+            idempotent=True,
+            durable=True,
+            apply=lambda: self._optimistic_timer('loaded', (item_id, duration_seconds)),  # LOADED, not running
+        ))
+
+    def _start_timer(self):
+        if not self.current_event_id or not self.active_item_id:
+            return None
+        now = self.clock.now()
+        return self.commands.submit(Command(
+            'timer/start', 'POST', '/api/timers/start',
+            json={
+                'event_id': self.current_event_id,
+                'item_id': str(self.active_item_id),
+                'user_id': 'python-osc-app',
+                'started_at': format_server_time(now),  # the moment it was fired, even if replayed later
+            },
+            durable=True,
+            apply=lambda: self._optimistic_timer('started', now),
+        ))
+
+    def _stop_timer(self):
+        if not self.current_event_id:
+            return None
+        return self.commands.submit(Command(
+            'timer/stop', 'POST', '/api/timers/stop',
+            json={
+                'event_id': self.current_event_id,
+                'item_id': str(self.active_item_id),
+                'stopped_at': format_server_time(self.clock.now()),
+            },
+            idempotent=True,
+            durable=True,
+            apply=lambda: self._optimistic_timer('stopped'),
+        ))
+
+    def _reset_timer(self):
+        if not self.current_event_id:
+            return None
+        return self.commands.submit(Command(
+            'timer/reset', 'POST', '/api/timers/reset',
+            json={'event_id': self.current_event_id},
+            idempotent=True,
+            durable=True,
+            apply=lambda: self._optimistic_timer('reset'),
+        ))
+
+    def _adjust_timer(self, minutes):
+        """Adjust active timer duration by +/- minutes (like /timer/adjust/+1, -1, +5, -5)."""
+        if not self.current_event_id or not self.active_item_id:
+            self.log_message('Timer adjust: no active timer loaded', 'warning')
+            return None
+        item = self.schedule.find(self.current_day, self.active_item_id)
+        if not item:
+            self.log_message('Timer adjust: active item not found', 'warning')
+            return None
+        current_total = self.timer.total
+        if not current_total:
+            current_total = self.schedule.duration.get(self.active_item_id, 0) or 300
+        new_total = max(0, current_total + minutes * 60)
+        return self.commands.submit(Command(
+            'timer/adjust', 'PUT',
+            f"/api/active-timers/{self.current_event_id}/{self.active_item_id}/duration",
+            json={'duration_seconds': new_total},
+            idempotent=True,  # absolute value, not a delta
+            durable=True,
+            apply=lambda: self._optimistic_timer('duration', new_total),
+            on_done=lambda r: r.ok and self.log_message(f"Timer adjusted {minutes:+d} min", 'info'),
+        ))
+
+    def _start_subtimer(self, cue_number):
+        """Start sub-timer for cue (by cue label or timerId, like /subtimer/cue/5/start)."""
+        if not self.current_event_id:
+            self.log_message('Sub-timer: no event loaded', 'warning')
+            return None
+        schedule = self.schedule
+        item = schedule.find_subtimer_cue(self.current_day, cue_number)
+        if not item:
+            self.log_message(f"Sub-timer: cue '{cue_number}' not found", 'warning')
+            return None
+        item_id = item['id']
+        dur = schedule.duration.get(item_id, 0) or 300
+        row_num = schedule.row_number.get(item_id, 1)
+        cue_display = item_custom_fields(item).get('cue') or item.get('timerId') or f'CUE {item_id}'
+        timer_id = item.get('timerId') or f'SUB{item_id}'
+        return self.commands.submit(Command(
+            'subtimer/start', 'POST', '/api/sub-cue-timers',
+            json={
+                'event_id': self.current_event_id,
+                'item_id': item_id,
+                'user_id': 'python-osc-app',
+                'user_name': 'Python OSC',
+                'user_role': 'OPERATOR',
+                'duration_seconds': dur,
+                'row_number': row_num,
+                'cue_display': cue_display,
+                'timer_id': timer_id,
+                'is_active': True,
+                'is_running': True,
+                'started_at': datetime.now().isoformat(),
+            },
+            lane='subtimer',
+            on_done=lambda r: r.ok and self.log_message(f"Sub-timer started: {cue_display}", 'success'),
+        ))
+
+    def _stop_subtimer(self, cue_number):
+        """Stop sub-timer for cue or all (like /subtimer/cue/5/stop)."""
+        if not self.current_event_id:
+            self.log_message('Sub-timer: no event loaded', 'warning')
+            return None
+        item_id = None
+        if cue_number:
+            item = self.schedule.find_subtimer_cue(self.current_day, cue_number)
+            if item:
+                item_id = item['id']
+        payload = {'event_id': self.current_event_id}
+        if item_id:
+            payload['item_id'] = item_id
+        return self.commands.submit(Command(
+            'subtimer/stop', 'PUT', '/api/sub-cue-timers/stop',
+            json=payload,
+            lane='subtimer',
+            idempotent=True,
+            on_done=lambda r: r.ok and self.log_message(
+                'Sub-timer stopped' + (f': {cue_number}' if cue_number else ': all'), 'success'),
+        ))
@@ -0,0 +1,92 @@
+"""Headless OSC bridge: osc_core.OscBridge without Tk, for a machine with no display.
+
+Serves the same OSC commands on the same port as the GUI and opens the event
+given on the command line or in the environment:
+
+    python osc_daemon.py --event 123 --day 2
+    ROS_EVENT_ID=123 ROS_DAY=2 python osc_daemon.py
+
+``API_BASE_URL``, ``OSC_LISTEN_PORT``, ``OSC_TRANSPORT``, ``OSC_WORKERS`` and
+``OSC_RECV_BUFFER`` work as for ``app.py``. With no event, the bridge waits
+for ``/set-event``. The log goes to the console and to
+``logs/ros-osc-daemon.log``. SIGINT/SIGTERM shut it down.
+"""
+from __future__ import annotations
+
+import startup_trace  # first, so its clock starts before the heavy imports
+
+if startup_trace.trace_enabled():
+    startup_trace.install_import_timer()
+
+import argparse
+import os
+import signal
+import threading
+
+from log_sink import LogSink
+from osc_core import API_BASE_URL, LOG_DIR, OSC_PORT, BridgeHooks, OscBridge
+from ui_dispatch import ThreadDispatcher
+
+startup_trace.mark("imports")
+
+
+def _env_int(name: str) -> int | None:
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ROS OSC bridge without a GUI.")
+    parser.add_argument("--event", default=os.getenv("ROS_EVENT_ID") or None,
+                        help="event id to open (env ROS_EVENT_ID; default: wait for /set-event)")
+    parser.add_argument("--day", type=int, default=_env_int("ROS_DAY"),
+                        help="day to show when the event opens (env ROS_DAY; default: first day)")
+    parser.add_argument("--auto-refresh", type=int, default=_env_int("ROS_AUTO_REFRESH") or 0, metavar="SECONDS",
+                        help="refetch the event every SECONDS (env ROS_AUTO_REFRESH; default: off, live updates only)")
+    parser.add_argument("--port", type=int, default=OSC_PORT, help="OSC listen port (env OSC_LISTEN_PORT)")
+    parser.add_argument("--api", default=API_BASE_URL, help="API base URL (env API_BASE_URL)")
+    args = parser.parse_args(argv)
+
+    sink = LogSink("ros-osc-daemon", LOG_DIR, console=True)
+    dispatcher = ThreadDispatcher()
+    bridge = OscBridge(
+        dispatcher,
+        sink,
+        hooks=BridgeHooks(error=lambda title, message: sink.log(f"{title}: {message}", "error")),
+        api_base_url=args.api,
+        osc_port=args.port,
+    )
+    bridge.default_day = args.day
+    bridge.set_auto_refresh(args.auto_refresh)
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(sig, lambda *_: stop.set())
+        except (ValueError, OSError):
+            pass
+
+    sink.log(f"Using API: {args.api}, OSC port: {args.port}")
+    dispatcher.start()
+    bridge.start()
+    startup_trace.mark("osc")
+    sink.log(startup_trace.summary())
+    for line in startup_trace.slowest_imports():
+        sink.log(f"  import {line}")
+    if args.event:
+        dispatcher.call(bridge.open_event, args.event)
+    try:
+        while not stop.wait(1.0):
+            pass
+    finally:
+        sink.log("Shutting down")
+        bridge.close()
+        dispatcher.stop()
+        sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+"""Bounded worker pool for incoming OSC commands.
+
+Commands are queued on a *lane* derived from their address. Each lane runs
+on at most one worker at a time, so everything on a lane executes in arrival
+order (``/cue/*/load`` and ``/timer/*`` share a lane, so a load followed by a
+start never races), while different lanes run in parallel across a fixed
+number of threads.
+
+Each lane holds at most ``lane_depth`` pending commands. Idempotent queries
+(``/status``, ``/get-day``, ``/list-events``) are merged with an identical
+pending request from the same client; anything else arriving at a full lane
+is dropped and reported back to the caller.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+# First address segment -> lane. Commands that read or change the active cue,
+# the current day or the loaded event are serialized together.
+LANE_GROUPS = {
+    'cue': 'timer',
+    'timer': 'timer',
+    'set-day': 'timer',
+    'set-event': 'timer',
+}
+
+# Answering once answers every identical pending request.
+IDEMPOTENT_COMMANDS = frozenset({'status', 'get-day', 'list-events', 'stats'})
+
+LATENCY_SAMPLES = 512
+PATTERN_CHARS = frozenset('*?[]{}')
+
+Handler = Callable[[str, list, Any], Any]
+
+
+def command_of(address: str) -> str:
+    return address.strip('/').split('/', 1)[0]
+
+
+@dataclass
+class _Job:
+    address: str
+    args: list
+    client: Any
+    merge_key: tuple | None
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class OscDispatcher:
+    def __init__(
+        self,
+        handler: Handler,
+        *,
+        workers: int = 4,
+        lane_depth: int = 32,
+        lane_groups: dict[str, str] | None = None,
+        idempotent: frozenset[str] = IDEMPOTENT_COMMANDS,
+    ):
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.lane_depth = max(1, int(lane_depth))
+        self.lane_groups = LANE_GROUPS if lane_groups is None else lane_groups
+        self.idempotent = idempotent
+        self._cond = threading.Condition()
+        self._lanes: dict[str, deque[_Job]] = {}
+        self._ready: deque[str] = deque()   # lanes with pending work and no worker on them
+        self._scheduled: set[str] = set()   # lanes that are in _ready or currently running
+        self._threads: list[threading.Thread] = []
+        self._running = False
+        self._wait_ms: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._run_ms: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.submitted = 0
+        self.completed = 0
+        self.merged = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def lane_for(self, address: str) -> str:
+        cmd = command_of(address)
+        if not PATTERN_CHARS.isdisjoint(cmd):
+            # A wildcard may hit any command, so keep it ordered with the control lane.
+            return 'timer'
+        return self.lane_groups.get(cmd, cmd)
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        for n in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f'osc-worker-{n + 1}', daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self) -> None:
+        """Stop the workers; commands still queued are discarded."""
+        with self._cond:
+            self._running = False
+            self._lanes.clear()
+            self._ready.clear()
+            self._scheduled.clear()
+            self._cond.notify_all()
+        self._threads = []
+
+    def submit(self, address: str, args: list, client: Any) -> bool:
+        """Queue a command. Returns False if its lane is full and it was dropped."""
+        cmd = command_of(address)
+        lane = self.lane_for(address)
+        merge_key = (address, tuple(args), client) if cmd in self.idempotent else None
+        with self._cond:
+            self.submitted += 1
+            pending = self._lanes.get(lane)
+            if pending is None:
+                pending = self._lanes[lane] = deque()
+            if merge_key is not None and any(job.merge_key == merge_key for job in pending):
+                self.merged += 1
+                return True
+            if len(pending) >= self.lane_depth:
+                self.dropped += 1
+                return False
+            pending.append(_Job(address, list(args), client, merge_key))
+            if lane not in self._scheduled:
+                self._scheduled.add(lane)
+                self._ready.append(lane)
+                self._cond.notify()
+        return True
+
+    def depth(self) -> int:
+        with self._cond:
+            return sum(len(q) for q in self._lanes.values())
+
+    def stats(self) -> dict:
+        """Counters plus queue-wait and run-time percentiles (ms) over the last samples."""
+        with self._cond:
+            wait = sorted(self._wait_ms)
+            run = sorted(self._run_ms)
+            return {
+                'workers': self.workers,
+                'pending': sum(len(q) for q in self._lanes.values()),
+                'lanes': len(self._scheduled),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'merged': self.merged,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'wait_ms_p50': _percentile(wait, 50),
+                'wait_ms_p95': _percentile(wait, 95),
+                'wait_ms_max': wait[-1] if wait else 0.0,
+                'run_ms_p50': _percentile(run, 50),
+                'run_ms_p95': _percentile(run, 95),
+            }
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (
+            f"pending {s['pending']}, done {s['completed']}, merged {s['merged']}, "
+            f"dropped {s['dropped']}, wait p50/p95/max {s['wait_ms_p50']:.1f}/"
+            f"{s['wait_ms_p95']:.1f}/{s['wait_ms_max']:.1f} ms"
+        )
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._ready:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                lane = self._ready.popleft()
+                job = self._lanes[lane].popleft()
+            started = time.monotonic()
+            try:
+                self.handler(job.address, job.args, job.client)
+                failed = False
+            except Exception:
+                failed = True
+            finished = time.monotonic()
+            with self._cond:
+                self.completed += 1
+                if failed:
+                    self.errors += 1
+                self._wait_ms.append((started - job.enqueued) * 1000.0)
+                self._run_ms.append((finished - started) * 1000.0)
+                if not self._running:
+                    return
+                pending = self._lanes.get(lane)
+                if pending:
+                    # Back of the ready queue so one busy lane cannot starve the others.
+                    self._ready.append(lane)
+                    self._cond.notify()
+                else:
+                    self._lanes.pop(lane, None)
+                    self._scheduled.discard(lane)
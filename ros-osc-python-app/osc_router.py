@@ -0,0 +1,269 @@
+"""OSC address router: a segment trie with OSC 1.0 pattern matching.
+
+Routes are address templates whose segments are literals or captures
+(``/cue/<name>/load``, ``/timer/adjust/<int:minutes>``). Incoming addresses
+may use OSC patterns (``*``, ``?``, ``[a-z]``, ``[!0-9]``, ``{start,stop}``)
+and then invoke every literal route they match. An address that spells out a
+route with no captures is found with one dict lookup, as is a repeat of an
+address that fills a capture (its converted captures are kept with it).
+Patterns walk the trie, and their results are kept in an LRU cache.
+
+Handlers are registered with ``OscRouter.add``/``route`` or by decorating
+methods with ``osc_route`` and passing the object to ``include``. They are
+called as ``handler(client, *args, **captures)`` with OSC arguments coerced
+to the declared ``args`` types.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
+
+PATTERN_CHARS = frozenset('*?[]{}')
+CONVERTERS: dict[str, Callable[[str], Any]] = {'str': str, 'int': int, 'float': float}
+
+_CAPTURE = re.compile(r'^<(?:(\w+):)?(\w+)>$')
+
+
+class OscArgumentError(ValueError):
+    """Address matched a route but its captures or arguments could not be coerced."""
+
+
+def is_pattern(address: str) -> bool:
+    return not PATTERN_CHARS.isdisjoint(address)
+
+
+def _segment_regex(segment: str) -> re.Pattern:
+    """Translate one OSC address-pattern segment to a compiled regex."""
+    out = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        c = segment[i]
+        if c == '*':
+            out.append('.*')
+        elif c == '?':
+            out.append('.')
+        elif c == '[':
+            end = segment.find(']', i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = segment[i + 1:end]
+                negate = body.startswith('!')
+                if negate:
+                    body = body[1:]
+                body = body.replace('\\', '\\\\').replace('^', '\\^')
+                out.append(f"[{'^' if negate else ''}{body}]")
+                i = end
+        elif c == '{':
+            end = segment.find('}', i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                options = segment[i + 1:end].split(',')
+                out.append('(?:' + '|'.join(re.escape(o) for o in options) + ')')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile(''.join(out) + r'\Z', re.DOTALL)
+
+
+def _coerce(value, typ):
+    if typ is None or typ is Any:
+        return value
+    if typ is bool:
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes', 'on', 't')
+        return bool(value)
+    if typ is int and isinstance(value, str):
+        return int(float(value)) if '.' in value else int(value)
+    if typ is str and isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return typ(value)
+
+
+@dataclass(slots=True)
+class Route:
+    pattern: str
+    handler: Callable[..., Any]
+    args: tuple = ()
+    captures: tuple = ()  # (segment index, name, converter)
+
+    def bind(self, segments: tuple[str, ...]) -> dict[str, Any]:
+        """Convert this route's captures out of an address's ``segments``."""
+        params = {}
+        for index, name, conv in self.captures:
+            try:
+                params[name] = conv(segments[index])
+            except (TypeError, ValueError):
+                raise OscArgumentError(f"{self.pattern}: bad {name} {segments[index]!r}") from None
+        return params
+
+    def invoke(self, client, args, params: dict[str, Any]) -> Any:
+        if not self.args:
+            return self.handler(client, *args, **params)
+        if len(args) < len(self.args):
+            raise OscArgumentError(f"{self.pattern}: expected {len(self.args)} argument(s), got {len(args)}")
+        values = list(args)
+        for i, typ in enumerate(self.args):
+            if type(values[i]) is typ:
+                continue
+            try:
+                values[i] = _coerce(values[i], typ)
+            except (TypeError, ValueError):
+                raise OscArgumentError(f"{self.pattern}: argument {i + 1} {args[i]!r} is not {typ.__name__}") from None
+        return self.handler(client, *values, **params)
+
+    def call(self, client, segments: tuple[str, ...], args) -> Any:
+        return self.invoke(client, args, self.bind(segments))
+
+
+@dataclass
+class _Node:
+    static: dict[str, '_Node'] = field(default_factory=dict)
+    capture: '_Node | None' = None
+    routes: list[Route] = field(default_factory=list)
+
+
+def osc_route(pattern: str, *, args: tuple = ()):
+    """Mark a method as the handler for ``pattern``; register it with ``OscRouter.include``."""
+    def mark(fn):
+        fn.__dict__.setdefault('_osc_routes', []).append((pattern, tuple(args)))
+        return fn
+    return mark
+
+
+class OscRouter:
+    def __init__(self, cache_size: int = 1024):
+        self.root = _Node()
+        self.routes: list[Route] = []
+        # Address -> ((route, captured params), ...), checked before the trie. Routes
+        # without captures are entered by ``add`` (and kept in ``_literal``);
+        # concrete addresses that fill a capture are entered on first dispatch, up
+        # to ``cache_size`` of them.
+        self._literal: dict[str, tuple[tuple[Route, dict[str, Any]], ...]] = {}
+        self._calls: dict[str, tuple[tuple[Route, dict[str, Any]], ...]] = {}
+        self.cache_size = cache_size
+        self._resolve = lru_cache(maxsize=cache_size)(self._match)
+
+    def add(self, pattern: str, handler: Callable[..., Any], *, args: tuple = ()) -> Route:
+        segments = pattern.strip('/').split('/')
+        node = self.root
+        captures = []
+        for index, segment in enumerate(segments):
+            m = _CAPTURE.match(segment)
+            if m:
+                conv_name, name = m.group(1) or 'str', m.group(2)
+                if conv_name not in CONVERTERS:
+                    raise ValueError(f"unknown converter {conv_name!r} in {pattern}")
+                captures.append((index, name, CONVERTERS[conv_name]))
+                if node.capture is None:
+                    node.capture = _Node()
+                node = node.capture
+            else:
+                if is_pattern(segment):
+                    raise ValueError(f"route templates must be literal: {pattern}")
+                node = node.static.setdefault(segment, _Node())
+        route = Route(pattern, handler, tuple(args), tuple(captures))
+        node.routes.append(route)
+        self.routes.append(route)
+        if not captures:
+            key = '/' + '/'.join(segments)
+            self._literal[key] = self._literal.get(key, ()) + ((route, {}),)
+        self._calls = dict(self._literal)
+        self._resolve.cache_clear()
+        return route
+
+    def route(self, pattern: str, *, args: tuple = ()):
+        def register(fn):
+            self.add(pattern, fn, args=args)
+            return fn
+        return register
+
+    def include(self, obj) -> int:
+        """Register every ``osc_route``-marked method of ``obj``; returns how many routes were added."""
+        count = 0
+        for name in dir(type(obj)):
+            fn = getattr(type(obj), name, None)
+            for pattern, args in getattr(fn, '_osc_routes', ()):
+                self.add(pattern, getattr(obj, name), args=args)
+                count += 1
+        return count
+
+    def match(self, address: str) -> tuple[tuple[Route, tuple[str, ...]], ...]:
+        """``(route, address segments)`` for every route ``address`` resolves to (cached)."""
+        return self._resolve(address)
+
+    def dispatch(self, address: str, args, client=None) -> int:
+        """Call every matching handler; returns how many were called (0 = unknown address)."""
+        calls = self._calls.get(address)
+        if calls is None:
+            if not self.cache_size or is_pattern(address):
+                matches = self._resolve(address)
+                for route, segments in matches:
+                    route.call(client, segments, args)
+                return len(matches)
+            calls = self._bind(address)
+        for route, params in calls:
+            # Nothing to coerce: call the handler here and skip invoke's frame.
+            if route.args:
+                route.invoke(client, args, params)
+            elif params:
+                route.handler(client, *args, **params)
+            else:
+                route.handler(client, *args)
+        return len(calls)
+
+    def cache_info(self):
+        return self._resolve.cache_info()
+
+    def _bind(self, address: str) -> tuple[tuple[Route, dict[str, Any]], ...]:
+        calls = tuple((route, route.bind(segments)) for route, segments in self._resolve(address))
+        if calls:
+            if len(self._calls) >= len(self._literal) + self.cache_size:
+                self._calls = dict(self._literal)
+            self._calls[address] = calls
+        return calls
+
+    def _match(self, address: str) -> tuple[tuple[Route, tuple[str, ...]], ...]:
+        segments = tuple(address.strip('/').split('/'))
+        if not is_pattern(address):
+            return tuple(self._walk_literal(self.root, segments, 0))
+        compiled = [_segment_regex(s) if is_pattern(s) else None for s in segments]
+        found: list[tuple[Route, tuple[str, ...]]] = []
+        self._walk_pattern(self.root, segments, compiled, 0, (), found)
+        return tuple(found)
+
+    def _walk_literal(self, node: _Node, segments, index) -> list:
+        if index == len(segments):
+            return [(route, segments) for route in node.routes]
+        # A literal child beats a capture at the same depth (/timer/start over /timer/<action>).
+        child = node.static.get(segments[index])
+        if child is not None:
+            found = self._walk_literal(child, segments, index + 1)
+            if found:
+                return found
+        if node.capture is not None:
+            return self._walk_literal(node.capture, segments, index + 1)
+        return []
+
+    def _walk_pattern(self, node: _Node, segments, compiled, index, path, found) -> None:
+        if index == len(segments):
+            for route in node.routes:
+                found.append((route, path))
+            return
+        regex = compiled[index]
+        if regex is None:
+            child = node.static.get(segments[index])
+            if child is not None:
+                self._walk_pattern(child, segments, compiled, index + 1, path + (segments[index],), found)
+            if node.capture is not None:
+                self._walk_pattern(node.capture, segments, compiled, index + 1, path + (segments[index],), found)
+            return
+        # A wildcard segment expands over literal children only; captures need a concrete value.
+        for name, child in node.static.items():
+            if regex.match(name):
+                self._walk_pattern(child, segments, compiled, index + 1, path + (name,), found)
@@ -0,0 +1,341 @@
+"""asyncio OSC server: UDP datagrams and/or OSC 1.1 TCP streams with SLIP framing.
+
+Everything runs on one event-loop thread. With ``on_message`` set, packets
+are decoded there and every message (bundles are flattened) is passed to
+``on_message(address, args, client)``; messages in a bundle with a future
+timetag are delivered at that time via ``loop.call_later``. ``on_packet``
+gets the raw bytes instead; with neither callback packets go to
+``message_queue`` as before. ``send_response`` may be called from any thread.
+``on_client_gone(client)`` is called, on the loop thread, when a TCP client
+disconnects or a send to a client fails (for UDP, an ICMP unreachable for the
+last datagram sent).
+
+For UDP the client is the sender's ``(host, port)``; for TCP it is
+``('tcp', host, port)`` so replies go back down the same connection.
+"""
+from __future__ import annotations
+
+import asyncio
+import queue
+import socket
+import sys
+import threading
+from typing import Any, Callable
+
+from osc_codec import (
+    IMMEDIATELY,
+    OscDecodeError,
+    create_osc_message,
+    decode_packet,
+    encode_list_bundles,
+    iter_messages,
+    timetag_delay,
+)
+
+TRANSPORTS = ('udp', 'tcp', 'both')
+DEFAULT_RECV_BUFFER = 1024 * 1024
+MAX_SLIP_FRAME = 1024 * 1024
+MAX_UDP_BUNDLE = 8192  # keep list replies well under typical datagram limits
+MAX_SCHEDULE_AHEAD = 24 * 3600  # bundles timetagged further out than this are dropped
+
+# Linux only reports ICMP errors on an unconnected UDP socket with IP_RECVERR; they are then read,
+# with the original destination, from the socket's error queue.
+IP_RECVERR = getattr(socket, 'IP_RECVERR', 11)
+MSG_ERRQUEUE = getattr(socket, 'MSG_ERRQUEUE', 0x2000)
+
+SLIP_END = 0xC0
+SLIP_ESC = 0xDB
+SLIP_ESC_END = 0xDC
+SLIP_ESC_ESC = 0xDD
+
+PacketCallback = Callable[[bytes, Any], None]
+MessageCallback = Callable[[str, list, Any], None]
+ClientCallback = Callable[[Any], None]
+
+
+def slip_encode(packet: bytes) -> bytes:
+    """Double-END SLIP frame (OSC 1.1)."""
+    body = packet.replace(b'\xdb', b'\xdb\xdd').replace(b'\xc0', b'\xdb\xdc')
+    return b'\xc0' + body + b'\xc0'
+
+
+class SlipDecoder:
+    """Incremental SLIP decoder; ``feed`` returns the complete packets seen so far."""
+
+    def __init__(self, max_frame: int = MAX_SLIP_FRAME):
+        self.max_frame = max_frame
+        self._buf = bytearray()
+        self._escaped = False
+        self._overflow = False
+
+    def feed(self, data: bytes) -> list[bytes]:
+        packets = []
+        buf = self._buf
+        for byte in data:
+            if byte == SLIP_END:
+                if buf and not self._overflow:
+                    packets.append(bytes(buf))
+                buf.clear()
+                self._escaped = False
+                self._overflow = False
+                continue
+            if self._overflow:
+                continue
+            if self._escaped:
+                self._escaped = False
+                if byte == SLIP_ESC_END:
+                    byte = SLIP_END
+                elif byte == SLIP_ESC_ESC:
+                    byte = SLIP_ESC
+            elif byte == SLIP_ESC:
+                self._escaped = True
+                continue
+            buf.append(byte)
+            if len(buf) > self.max_frame:
+                # Drop the oversized frame and resync on the next END.
+                buf.clear()
+                self._overflow = True
+        return packets
+
+
+class _UdpProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: 'OSCServer'):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.server._deliver(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP port-unreachable (or a failed sendto) for a client that went away; keep serving.
+        server = self.server
+        if server._udp_errqueue is None:
+            # The error carries no address: blame the last destination, the one in a failed
+            # sendto and almost always the one an ICMP error answers.
+            server._client_gone(server._udp_last)
+            return
+        while True:
+            try:
+                _, _, _, addr = server._udp_errqueue.recvmsg(1, 512, MSG_ERRQUEUE)
+            except OSError:
+                return  # drained (BlockingIOError) or nothing queued
+            server._client_gone(addr)
+
+
+class _SlipProtocol(asyncio.Protocol):
+    def __init__(self, server: 'OSCServer'):
+        self.server = server
+        self.decoder = SlipDecoder()
+        self.client = None
+
+    def connection_made(self, transport) -> None:
+        peer = transport.get_extra_info('peername') or ('?', 0)
+        self.client = ('tcp', peer[0], peer[1])
+        self.server._tcp_clients[self.client] = transport
+
+    def data_received(self, data: bytes) -> None:
+        for packet in self.decoder.feed(data):
+            self.server._deliver(packet, self.client)
+
+    def connection_lost(self, exc) -> None:
+        self.server._tcp_clients.pop(self.client, None)
+        self.server._client_gone(self.client)
+
+
+class OSCServer:
+    def __init__(
+        self,
+        port: int = 57121,
+        *,
+        host: str = '0.0.0.0',
+        transport: str = 'udp',
+        recv_buffer: int = DEFAULT_RECV_BUFFER,
+        on_packet: PacketCallback | None = None,
+        on_message: MessageCallback | None = None,
+        on_client_gone: ClientCallback | None = None,
+    ):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"transport must be one of {', '.join(TRANSPORTS)}")
+        self.port = port
+        self.host = host
+        self.transport = transport
+        self.recv_buffer = recv_buffer
+        self.on_packet = on_packet
+        self.on_message = on_message
+        self.on_client_gone = on_client_gone
+        self.decode_errors = 0
+        self.scheduled = 0
+        self.message_queue: queue.Queue = queue.Queue()
+        self.running = False
+        self.error: Exception | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self._udp = None
+        self._udp_last = None  # destination of the last datagram sent; see _UdpProtocol.error_received
+        self._udp_errqueue: socket.socket | None = None  # the UDP socket, when IP_RECVERR is on
+        self._tcp = None
+        self._tcp_clients: dict = {}
+
+    def describe(self) -> str:
+        kinds = {'udp': 'UDP', 'tcp': 'TCP/SLIP', 'both': 'UDP + TCP/SLIP'}[self.transport]
+        return f"port {self.port} ({kinds})"
+
+    def start(self) -> bool:
+        """Start the loop thread and bind; returns False (see ``error``) if binding failed."""
+        if self.running:
+            return True
+        ready = threading.Event()
+        self.error = None
+        self.thread = threading.Thread(target=self._run, args=(ready,), name='osc-server', daemon=True)
+        self.thread.start()
+        ready.wait(5.0)
+        return self.running
+
+    def stop(self) -> None:
+        loop = self.loop
+        if loop is None or not self.running:
+            return
+        self.running = False
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            pass
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(2.0)
+
+    def send_response(self, address, args, client_addr) -> None:
+        try:
+            self.send_packet(create_osc_message(address, args), client_addr)
+        except Exception:
+            pass
+
+    def send_bundle(self, address, items, client_addr, timetag=IMMEDIATELY) -> None:
+        """Reply with one ``address item`` message per item, batched into bundles instead of a datagram each."""
+        try:
+            limit = MAX_SLIP_FRAME if self._is_tcp(client_addr) else MAX_UDP_BUNDLE
+            for packet in encode_list_bundles(address, items, limit, timetag):
+                self.send_packet(packet, client_addr)
+        except Exception:
+            pass
+
+    def send_packet(self, packet: bytes, client_addr) -> None:
+        loop = self.loop
+        if loop is None or not self.running:
+            return
+        loop.call_soon_threadsafe(self._send, packet, client_addr)
+
+    @staticmethod
+    def _is_tcp(client_addr) -> bool:
+        return isinstance(client_addr, tuple) and len(client_addr) == 3 and client_addr[0] == 'tcp'
+
+    def _send(self, packet: bytes, client_addr) -> None:
+        if self._is_tcp(client_addr):
+            transport = self._tcp_clients.get(client_addr)
+            if transport is None or transport.is_closing():
+                self._client_gone(client_addr)
+                return
+            transport.write(slip_encode(packet))  # a write error closes the connection -> connection_lost
+        elif self._udp is not None:
+            self._udp_last = client_addr
+            self._udp.sendto(packet, client_addr)  # errors go to _UdpProtocol.error_received
+
+    def _client_gone(self, client) -> None:
+        if client is None or self.on_client_gone is None:
+            return
+        try:
+            self.on_client_gone(client)
+        except Exception:
+            pass
+
+    def _deliver(self, data: bytes, client) -> None:
+        if self.on_message is not None:
+            self._dispatch_messages(data, client)
+            return
+        if self.on_packet is None:
+            self.message_queue.put((data, client))
+            return
+        try:
+            self.on_packet(data, client)
+        except Exception:
+            pass
+
+    def _dispatch_messages(self, data: bytes, client) -> None:
+        try:
+            packet = decode_packet(data)
+        except OscDecodeError:
+            self.decode_errors += 1
+            return
+        for timetag, message in iter_messages(packet):
+            delay = timetag_delay(timetag)
+            if delay <= 0:
+                self._call_message(message.address, message.args, client)
+            elif delay <= MAX_SCHEDULE_AHEAD:
+                self.scheduled += 1
+                self.loop.call_later(delay, self._call_message, message.address, message.args, client)
+
+    def _call_message(self, address: str, args: list, client) -> None:
+        try:
+            self.on_message(address, args, client)
+        except Exception:
+            pass
+
+    def _udp_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, int(self.recv_buffer))
+        except OSError:
+            pass  # OS cap; the default buffer still works
+        if sys.platform.startswith('linux'):
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, IP_RECVERR, 1)
+                self._udp_errqueue = sock
+            except OSError:
+                pass
+        sock.bind((self.host, self.port))
+        sock.setblocking(False)
+        return sock
+
+    async def _open(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.transport in ('udp', 'both'):
+            self._udp, _ = await loop.create_datagram_endpoint(
+                lambda: _UdpProtocol(self), sock=self._udp_socket()
+            )
+        if self.transport in ('tcp', 'both'):
+            self._tcp = await loop.create_server(
+                lambda: _SlipProtocol(self), self.host, self.port, reuse_address=True
+            )
+
+    def _close(self) -> None:
+        for transport in list(self._tcp_clients.values()):
+            transport.close()
+        self._tcp_clients.clear()
+        if self._tcp is not None:
+            self._tcp.close()
+            self._tcp = None
+        if self._udp is not None:
+            self._udp.close()
+            self._udp = None
+
+    def _run(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            loop.run_until_complete(self._open())
+            self.running = True
+        except Exception as e:
+            self.error = e
+            self._close()
+            loop.close()
+            self.loop = None
+            ready.set()
+            return
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self.running = False
+            self._close()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+            self.loop = None
@@ -0,0 +1,123 @@
+"""Push OSC state to subscribed control surfaces instead of having them poll.
+
+A client sends ``/subscribe [ttl]`` and then receives a bundle of
+``/state/<key>`` messages whenever something it has not seen yet changes.
+The first push after subscribing is the full state. Subscriptions expire
+after ``ttl`` seconds unless renewed; ``/unsubscribe`` ends one early.
+Sends are fire-and-forget; the OSC server reports clients that went away
+(``OSCServer.on_client_gone``) and the owner unsubscribes them.
+
+Keys in ``THROTTLED`` (the countdown) are pushed at most once per
+``min_interval`` per client. Other keys (cue, day, running) go out as soon
+as they change.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+from osc_codec import encode_bundle, encode_message
+
+DEFAULT_TTL = 60.0
+MAX_TTL = 3600.0
+MAX_CLIENTS = 64
+THROTTLED = frozenset({'remaining', 'elapsed'})
+
+SendPacket = Callable[[bytes, Any], None]
+
+
+class _Subscriber:
+    __slots__ = ('client', 'expires', 'sent', 'last_push')
+
+    def __init__(self, client, expires: float):
+        self.client = client
+        self.expires = expires
+        self.sent: dict[str, Any] = {}
+        self.last_push = 0.0
+
+
+class SubscriptionRegistry:
+    def __init__(
+        self,
+        send_packet: SendPacket,
+        *,
+        prefix: str = '/state',
+        default_ttl: float = DEFAULT_TTL,
+        min_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.send_packet = send_packet
+        self.prefix = prefix.rstrip('/')
+        self.default_ttl = default_ttl
+        self.min_interval = min_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._subs: dict[Any, _Subscriber] = {}
+        self._state: dict[str, Any] = {}
+        self.pushes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._subs)
+
+    def subscribe(self, client, ttl: float | None = None) -> float:
+        """Add or renew ``client``; returns the granted TTL. A new subscriber gets the full state at once."""
+        ttl = self.default_ttl if not ttl or ttl <= 0 else min(float(ttl), MAX_TTL)
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            sub = self._subs.get(client)
+            if sub is None:
+                if len(self._subs) >= MAX_CLIENTS:
+                    raise RuntimeError('too many subscribers')
+                sub = self._subs[client] = _Subscriber(client, now + ttl)
+                packet = self._take_delta(sub, now, force=True)
+            else:
+                sub.expires = now + ttl
+                packet = None
+        if packet:
+            self._send(packet, client)
+        return ttl
+
+    def unsubscribe(self, client) -> bool:
+        with self._lock:
+            return self._subs.pop(client, None) is not None
+
+    def publish(self, state: dict[str, Any]) -> int:
+        """Record the current state and push what changed; returns the number of clients pushed to."""
+        now = self.clock()
+        with self._lock:
+            self._state = dict(state)
+            self._expire(now)
+            packets = []
+            for sub in self._subs.values():
+                packet = self._take_delta(sub, now, force=False)
+                if packet:
+                    packets.append((packet, sub.client))
+        for packet, client in packets:
+            self._send(packet, client)
+        return len(packets)
+
+    def _take_delta(self, sub: _Subscriber, now: float, force: bool) -> bytes | None:
+        changed = {k: v for k, v in self._state.items() if k not in sub.sent or sub.sent[k] != v}
+        if not changed:
+            return None
+        throttled = now - sub.last_push < self.min_interval
+        if throttled and not force:
+            changed = {k: v for k, v in changed.items() if k not in THROTTLED}
+            if not changed:
+                return None
+        sub.sent.update(changed)
+        sub.last_push = now
+        return encode_bundle(elements=[
+            encode_message(f'{self.prefix}/{key}', [value]) for key, value in sorted(changed.items())
+        ])
+
+    def _expire(self, now: float) -> None:
+        for client in [c for c, sub in self._subs.items() if sub.expires <= now]:
+            del self._subs[client]
+
+    def _send(self, packet: bytes, client) -> None:
+        self.pushes += 1
+        self.send_packet(packet, client)
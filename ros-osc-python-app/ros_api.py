@@ -0,0 +1,219 @@
+"""ROS HTTP client for the OSC app (mirrors ``hyperdeck-ingest/ros_api.py``).
+
+One pooled ``requests.Session`` is shared by every call, so repeated requests
+reuse keep-alive connections instead of opening a new TLS connection each
+time. ``event_snapshot`` fetches run-of-show data, active timers and the
+start-cue selection concurrently and returns them as one ``EventSnapshot``.
+Loading an event then takes about as long as the slowest of the three
+requests, not their sum.
+
+Run-of-show data is fetched conditionally: the last ``ETag`` is sent as
+``If-None-Match``, and a ``304 Not Modified`` reuses the body already held,
+so frequent refetches of an unchanged schedule cost almost nothing.
+
+The session (and ``requests`` itself, the slowest import in the app) is
+created on first use, so startup does not pay for it.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+
+POOL_SIZE = 8
+FETCH_WORKERS = 4
+
+RUN_OF_SHOW = 'run_of_show'
+ACTIVE_TIMERS = 'active_timers'
+START_CUE = 'start_cue'
+
+
+class RosApiError(Exception):
+    pass
+
+
+def schedule_items_of(data) -> list[dict]:
+    """``schedule_items`` of a run-of-show row (API body or socket payload); the DB may hand back a JSON string."""
+    items = data.get('schedule_items') if isinstance(data, dict) else None
+    if isinstance(items, str):
+        try:
+            items = json.loads(items)
+        except Exception:
+            items = []
+    return items if isinstance(items, list) else []
+
+
+@dataclass(frozen=True)
+class EventSnapshot:
+    """Everything needed to show an event; a part that failed is absent from ``fetched``."""
+    event_id: Any
+    schedule_items: list = field(default_factory=list)
+    timers: Any = None           # raw /api/active-timers JSON, for reduce_timer(..., 'record', ...)
+    start_cue: Any = None        # raw /api/start-cue-selection JSON ({itemId: ...} or null)
+    fetched: frozenset = frozenset()
+    errors: dict = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+    cached_age: float | None = None  # seconds, when read back from the offline cache
+
+    @classmethod
+    def from_cache(cls, event_id, data: dict, age: float) -> 'EventSnapshot':
+        return cls(
+            event_id=event_id,
+            schedule_items=data.get('schedule_items') or [],
+            timers=data.get('timers'),
+            start_cue=data.get('start_cue'),
+            fetched=frozenset(data.get('fetched') or ()),
+            cached_age=age,
+        )
+
+    def to_cache(self, previous: dict | None = None) -> dict:
+        """JSON-able parts for the offline cache; parts not fetched this time keep their ``previous`` value."""
+        data = dict(previous or {})
+        parts = {RUN_OF_SHOW: 'schedule_items', ACTIVE_TIMERS: 'timers', START_CUE: 'start_cue'}
+        for part, attr in parts.items():
+            if part in self.fetched:
+                data[attr] = getattr(self, attr)
+        data['fetched'] = sorted(set(data.get('fetched') or ()) | self.fetched)
+        return data
+
+    @property
+    def has_schedule(self) -> bool:
+        return RUN_OF_SHOW in self.fetched
+
+    @property
+    def has_timers(self) -> bool:
+        return ACTIVE_TIMERS in self.fetched
+
+    @property
+    def has_start_cue(self) -> bool:
+        return START_CUE in self.fetched
+
+    @property
+    def start_cue_id(self):
+        if not isinstance(self.start_cue, dict) or self.start_cue.get('itemId') is None:
+            return None
+        item_id = self.start_cue['itemId']
+        return item_id if isinstance(item_id, int) else int(item_id)
+
+
+class RosApi:
+    def __init__(self, base_url: str, timeout: float = 15.0, pool_size: int = POOL_SIZE):
+        self.base_url = (base_url or '').rstrip('/')
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='ros-api')
+        self._etag_lock = threading.Lock()
+        self._etags: dict[str, tuple[str, Any]] = {}  # path -> (ETag, decoded body)
+        self.not_modified = 0
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared keep-alive session, built on first use."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers['Accept'] = 'application/json'
+                    self._session = session
+                session = self._session
+        return session
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path if path.startswith('/') else '/' + path}"
+
+    def request(self, method: str, path: str, *, timeout: float | None = None, **kwargs) -> requests.Response:
+        """Send on the shared session; raises RosApiError if the server cannot be reached."""
+        import requests
+
+        try:
+            return self.session.request(method, self.url(path), timeout=timeout or self.timeout, **kwargs)
+        except requests.RequestException as exc:
+            raise RosApiError(f"Cannot reach API: {exc}") from exc
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def _get_json(self, path: str, timeout: float | None = None, conditional: bool = False) -> Any:
+        headers = {}
+        known = None
+        if conditional:
+            with self._etag_lock:
+                known = self._etags.get(path)
+            if known is not None:
+                headers['If-None-Match'] = known[0]
+        res = self.get(path, timeout=timeout, headers=headers)
+        if res.status_code == 304 and known is not None:
+            with self._etag_lock:
+                self.not_modified += 1
+            return known[1]
+        if res.status_code != 200:
+            raise RosApiError(f"HTTP {res.status_code} for {path}")
+        try:
+            data = res.json()
+        except ValueError as exc:
+            raise RosApiError(f"API did not return JSON for {path}") from exc
+        etag = res.headers.get('ETag') if conditional else None
+        if etag:
+            with self._etag_lock:
+                self._etags[path] = (etag, data)
+        return data
+
+    def list_events(self) -> list[dict]:
+        data = self._get_json('/api/calendar-events')
+        return data if isinstance(data, list) else []
+
+    def get_run_of_show(self, event_id) -> dict:
+        data = self._get_json(f"/api/run-of-show-data/{event_id}", conditional=True)
+        return data if isinstance(data, dict) else {}
+
+    def get_active_timers(self, event_id, timeout: float | None = 10.0) -> Any:
+        return self._get_json(f"/api/active-timers/{event_id}", timeout=timeout)
+
+    def get_start_cue_selection(self, event_id, timeout: float | None = 10.0) -> Any:
+        return self._get_json(f"/api/start-cue-selection/{event_id}", timeout=timeout)
+
+    def event_snapshot(self, event_id, *, timers: bool = True, start_cue: bool = True) -> EventSnapshot:
+        """Fetch the requested parts of an event concurrently; never raises for a single failed part."""
+        started = time.monotonic()
+        jobs = {RUN_OF_SHOW: self._pool.submit(self.get_run_of_show, event_id)}
+        if timers:
+            jobs[ACTIVE_TIMERS] = self._pool.submit(self.get_active_timers, event_id)
+        if start_cue:
+            jobs[START_CUE] = self._pool.submit(self.get_start_cue_selection, event_id)
+        results, errors = {}, {}
+        for name, future in jobs.items():
+            try:
+                results[name] = future.result()
+            except Exception as exc:
+                errors[name] = str(exc)
+        return EventSnapshot(
+            event_id=event_id,
+            schedule_items=schedule_items_of(results.get(RUN_OF_SHOW)),
+            timers=results.get(ACTIVE_TIMERS),
+            start_cue=results.get(START_CUE),
+            fetched=frozenset(results),
+            errors=errors,
+            elapsed_ms=(time.monotonic() - started) * 1000.0,
+        )
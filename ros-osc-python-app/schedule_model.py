@@ -0,0 +1,96 @@
+"""Per-day schedule partitions and cue lookup maps, built once per schedule load."""
+
+
+def item_day(item):
+    return item.get('day', 1)
+
+
+def item_custom_fields(item):
+    fields = item.get('customFields')
+    return fields if isinstance(fields, dict) else {}
+
+
+def item_cue(item):
+    """Cue label as shown in the table (top-level ``cue`` first, then ``customFields.cue``)."""
+    return item.get('cue') or item_custom_fields(item).get('cue')
+
+
+def item_duration_seconds(item):
+    h = item.get('durationHours', 0) or 0
+    m = item.get('durationMinutes', 0) or 0
+    s = item.get('durationSeconds', 0) or 0
+    return h * 3600 + m * 60 + s
+
+
+class ScheduleModel:
+    """Read-only view over ``schedule_items`` with O(1) lookups for OSC commands.
+
+    Lookups keep the first match in schedule order, same as the linear scans
+    they replace.
+    """
+
+    def __init__(self, items=None):
+        self.items = list(items or [])
+        self.by_day = {}
+        self.by_id = {}
+        self.row_number = {}   # item id -> 1-based row in the full schedule (row_is / row_number)
+        self.duration = {}     # item id -> seconds from durationHours/Minutes/Seconds (0 when unset)
+        self._cue = {}         # (day, cue label) -> item
+        self._field_cue = {}   # (day, customFields.cue) -> item
+        self._timer_id = {}    # (day, timerId) -> item
+        for index, item in enumerate(self.items):
+            if not isinstance(item, dict):
+                continue
+            day = item_day(item)
+            self.by_day.setdefault(day, []).append(item)
+            item_id = item.get('id')
+            self.by_id.setdefault(item_id, item)
+            self.row_number.setdefault(item_id, index + 1)
+            self.duration.setdefault(item_id, item_duration_seconds(item))
+            cue = item_cue(item)
+            if cue is not None:
+                self._cue.setdefault((day, str(cue)), item)
+            field_cue = item_custom_fields(item).get('cue')
+            if field_cue:
+                self._field_cue.setdefault((day, str(field_cue)), item)
+            timer_id = item.get('timerId')
+            if timer_id:
+                self._timer_id.setdefault((day, str(timer_id)), item)
+        try:
+            self.days = sorted(self.by_day)
+        except TypeError:
+            self.days = sorted(self.by_day, key=str)
+
+    def __len__(self):
+        return len(self.items)
+
+    def day_items(self, day):
+        return self.by_day.get(day, [])
+
+    def get(self, item_id):
+        return self.by_id.get(item_id)
+
+    def find(self, day, item_id):
+        """Item with ``item_id`` if it belongs to ``day``."""
+        item = self.by_id.get(item_id)
+        if item is not None and item_day(item) == day:
+            return item
+        return None
+
+    def find_cue(self, day, cue_name):
+        """``/cue/<name>/load`` lookup: table cue label on ``day``."""
+        return self._cue.get((day, str(cue_name)))
+
+    def find_timer(self, day, timer_id):
+        return self._timer_id.get((day, str(timer_id)))
+
+    def find_subtimer_cue(self, day, key):
+        """``/subtimer/cue/<n>`` lookup: ``customFields.cue`` or ``timerId``, earliest row wins."""
+        key = str(key)
+        by_cue = self._field_cue.get((day, key))
+        by_timer = self._timer_id.get((day, key))
+        if by_cue is None or by_timer is None:
+            return by_cue or by_timer
+        if self.row_number.get(by_timer.get('id'), 0) < self.row_number.get(by_cue.get('id'), 0):
+            return by_timer
+        return by_cue
@@ -0,0 +1,84 @@
+"""Keyed, diff-based rendering for the Run of Show schedule Treeview."""
+
+
+class TreeDiffRenderer:
+    """Remembers the values and tags last written for each row iid.
+
+    ``render`` only calls ``item()`` on rows whose values/tags changed, and
+    only inserts, deletes or moves rows that were added, removed or reordered,
+    so a LOADED -> RUNNING change touches two rows instead of the whole day.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self._rows = {}    # iid -> (values, tags) as last written
+        self._order = []   # iids in the order they appear in the tree
+
+    def reset(self):
+        """Forget cached state and clear the tree (e.g. after the tree was edited elsewhere)."""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._rows = {}
+        self._order = []
+
+    def render(self, rows):
+        """Apply ``rows`` = [(iid, values, tags), ...] in display order. Returns the number of rows touched."""
+        wanted = []
+        seen = set()
+        for iid, values, tags in rows:
+            key = iid
+            n = 2
+            while key in seen:
+                key = f"{iid}#{n}"
+                n += 1
+            seen.add(key)
+            wanted.append((key, tuple(values), tuple(tags)))
+
+        touched = 0
+        removed = [iid for iid in self._order if iid not in seen]
+        if removed:
+            self.tree.delete(*removed)
+            for iid in removed:
+                self._rows.pop(iid, None)
+            touched += len(removed)
+        live = [iid for iid in self._order if iid in seen]
+
+        for index, (iid, values, tags) in enumerate(wanted):
+            prev = self._rows.get(iid)
+            if prev is None:
+                self.tree.insert('', index, iid=iid, values=values, tags=tags)
+                live.insert(index, iid)
+                self._rows[iid] = (values, tags)
+                touched += 1
+                continue
+            if index >= len(live) or live[index] != iid:
+                self.tree.move(iid, '', index)
+                live.remove(iid)
+                live.insert(index, iid)
+                touched += 1
+            if prev != (values, tags):
+                self.tree.item(iid, values=values, tags=tags)
+                self._rows[iid] = (values, tags)
+                touched += 1
+
+        self._order = live
+        return touched
+
+    def shown(self, iids):
+        """The subset of ``iids`` that are rows in the tree right now."""
+        return {iid for iid in iids if iid in self._rows}
+
+    def update(self, rows):
+        """Rewrite only the given rows, which must already be shown; rows not in the tree are ignored."""
+        touched = 0
+        for iid, values, tags in rows:
+            prev = self._rows.get(iid)
+            if prev is None:
+                continue
+            row = (tuple(values), tuple(tags))
+            if prev != row:
+                self.tree.item(iid, values=row[0], tags=row[1])
+                self._rows[iid] = row
+                touched += 1
+        return touched
@@ -0,0 +1,329 @@
+"""Cue latency across both apps, against local stand-ins (no Railway, no deck).
+
+    python scripts/e2e_bench.py [--items 500] [--cycles 10] [--latency 0.0] [--push-latency 0.0]
+                                [--skip-osc] [--skip-ingest] [--json]
+
+Runs ``fake_ros_api.FakeRosApi`` in this process. Each app's headless daemon
+runs in its own subprocess, because the two app folders share module names.
+All times are taken in this process, so one clock covers every case.
+
+OSC (``osc_daemon.py``; this script subscribes to its ``/state`` pushes):
+- event open: ``/set-event`` until ``/state/event``, with an ``--items`` schedule;
+- cue → OSC feedback: a server-side cue load (``timerUpdated`` push) until
+  ``/state/cue``, then the timer start until ``/state/running``;
+- schedule edit → OSC feedback: ``runOfShowDataUpdated`` carrying the rows
+  until ``/state/segment``, and the same edit without rows (debounced refetch);
+- OSC command: ``/cue/<n>/load`` until the optimistic ``/state/cue``, and until
+  the ``/cue/loaded`` ack that follows the API write.
+
+Ingest (``../hyperdeck-ingest/ingest_daemon.py`` with its ``FakeHyperDeck``):
+- cue → record: a server-side cue load until the deck gets ``record``;
+- stop → deck stop: the timer stop until the deck gets ``stop``.
+Ingest polls ``/api/active-timers`` (``poll_seconds``, 1 s at least), so each
+trigger waits a random part of a poll first. The median is then the average
+case, not the worst one.
+
+``--json`` prints one machine-readable object. Exits non-zero if a case fails.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INGEST_DIR = os.path.join(os.path.dirname(APP_DIR), 'hyperdeck-ingest')
+sys.path.insert(0, APP_DIR)
+
+from fake_ros_api import FakeRosApi  # noqa: E402
+from osc_codec import decode_packet, encode_message, iter_messages  # noqa: E402
+
+START_TIMEOUT = 30.0
+STEP_TIMEOUT = 10.0
+
+
+def row(name, samples, **extra):
+    ordered = sorted(samples)
+    return {
+        'case': name,
+        'runs': len(samples),
+        'p50_ms': statistics.median(ordered),
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'max_ms': ordered[-1],
+        **extra,
+    }
+
+
+def free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_until(predicate, timeout=STEP_TIMEOUT, step=0.001):
+    """perf_counter() when ``predicate()`` first holds; raises TimeoutError."""
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError('condition not met')
+        time.sleep(step)
+    return time.perf_counter()
+
+
+class Daemon:
+    """One app daemon in a subprocess, its console log kept in a file."""
+
+    def __init__(self, name, args, cwd, env, log_dir):
+        self.name = name
+        self.log_path = os.path.join(log_dir, f'{name}.log')
+        self._log = open(self.log_path, 'w', encoding='utf-8')
+        self.proc = subprocess.Popen(
+            [sys.executable, *args], cwd=cwd, env=env, stdout=self._log, stderr=subprocess.STDOUT,
+        )
+
+    def tail(self, lines=20):
+        with open(self.log_path, encoding='utf-8', errors='replace') as fh:
+            return ''.join(fh.readlines()[-lines:])
+
+    def stop(self):
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self._log.close()
+
+
+class OscProbe:
+    """UDP OSC client: sends commands to the daemon, records every reply with its arrival time."""
+
+    def __init__(self, port):
+        self.target = ('127.0.0.1', port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.2)
+        self._messages = []
+        self._cond = threading.Condition()
+        self._closed = False
+        threading.Thread(target=self._recv, name='osc-probe', daemon=True).start()
+
+    def _recv(self):
+        while not self._closed:
+            try:
+                data, _addr = self.sock.recvfrom(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            at = time.perf_counter()
+            try:
+                messages = [(at, m.address, m.args) for _tag, m in iter_messages(decode_packet(data))]
+            except Exception:
+                continue
+            with self._cond:
+                self._messages.extend(messages)
+                self._cond.notify_all()
+
+    def send(self, address, *args):
+        self.sock.sendto(encode_message(address, list(args)), self.target)
+
+    def mark(self):
+        with self._cond:
+            return len(self._messages)
+
+    def wait(self, address, value=None, since=0, timeout=STEP_TIMEOUT):
+        """Arrival time of the first ``address`` (with ``value`` as first arg, if given) after ``since``."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                for at, addr, args in self._messages[since:]:
+                    if addr == address and (value is None or (args and args[0] == value)):
+                        return at
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(f'no {address} {value!r}')
+                self._cond.wait(left)
+
+    def close(self):
+        self._closed = True
+        self.sock.close()
+
+
+def osc_cases(api, cycles, tmp):
+    event_id = api.event_ids[0]
+    items = api.schedules[event_id]
+    port = free_udp_port()
+    env = dict(os.environ, LOCALAPPDATA=os.path.join(tmp, 'osc'), OSC_TRANSPORT='udp', PYTHONUNBUFFERED='1')
+    daemon = Daemon('osc_daemon', ['osc_daemon.py', '--port', str(port), '--api', api.url], APP_DIR, env, tmp)
+    probe = OscProbe(port)
+    rows = []
+    try:
+        deadline = time.monotonic() + START_TIMEOUT
+        while True:
+            since = probe.mark()
+            probe.send('/status')
+            try:
+                probe.wait('/status/info', since=since, timeout=0.25)
+                break
+            except TimeoutError:
+                if daemon.proc.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError('osc_daemon did not start:\n' + daemon.tail())
+        since = probe.mark()
+        probe.send('/subscribe', 3600)
+        probe.wait('/subscribed', since=since)
+        wait_until(lambda: api.stats()['clients'] > 0, timeout=START_TIMEOUT)
+
+        since = probe.mark()
+        started = time.perf_counter()
+        probe.send('/set-event', event_id)
+        opened = probe.wait('/state/event', event_id, since=since, timeout=START_TIMEOUT)
+        rows.append(row(f'OSC event open, {len(items)} rows', [(opened - started) * 1000.0]))
+        wait_until(lambda: api.listeners(event_id) > 0, timeout=START_TIMEOUT)
+
+        load, run, push, refetch, optimistic, ack = [], [], [], [], [], []
+        for n in range(cycles):
+            item = items[(2 * n + 1) % len(items)]
+            cue = item['customFields']['cue']
+            since = probe.mark()
+            started = time.perf_counter()
+            api.load_cue(event_id, item['id'])
+            load.append((probe.wait('/state/cue', cue, since=since) - started) * 1000.0)
+            since = probe.mark()
+            started = time.perf_counter()
+            api.start_timer(event_id, item['id'])
+            run.append((probe.wait('/state/running', True, since=since) - started) * 1000.0)
+
+            name = f'Edited {n}'
+            since = probe.mark()
+            started = time.perf_counter()
+            api.update_items(event_id, {item['id']: {'segmentName': name}})
+            push.append((probe.wait('/state/segment', name, since=since) - started) * 1000.0)
+            name = f'Refetched {n}'
+            since = probe.mark()
+            started = time.perf_counter()
+            api.update_items(event_id, {item['id']: {'segmentName': name}}, push_rows=False)
+            refetch.append((probe.wait('/state/segment', name, since=since) - started) * 1000.0)
+
+            item = items[(2 * n + 2) % len(items)]
+            cue = item['customFields']['cue']
+            since = probe.mark()
+            started = time.perf_counter()
+            probe.send(f'/cue/{cue}/load')
+            optimistic.append((probe.wait('/state/cue', cue, since=since) - started) * 1000.0)
+            ack.append((probe.wait('/cue/loaded', cue, since=since) - started) * 1000.0)
+
+        rows.append(row('cue load → /state/cue', load))
+        rows.append(row('timer start → /state/running', run))
+        rows.append(row('schedule push → /state/segment', push))
+        rows.append(row('schedule refetch → /state/segment', refetch))
+        rows.append(row('/cue/N/load → /state/cue', optimistic))
+        rows.append(row('/cue/N/load → /cue/loaded ack', ack))
+    except TimeoutError as exc:
+        raise RuntimeError(f'OSC case timed out ({exc}):\n' + daemon.tail()) from exc
+    finally:
+        probe.close()
+        daemon.stop()
+    return rows
+
+
+def ingest_cases(api, cycles, tmp):
+    sys.path.append(INGEST_DIR)  # last, so this app's modules keep their names; fake_hyperdeck is stdlib-only
+    from fake_hyperdeck import FakeHyperDeck
+
+    event_id = api.event_ids[-1]
+    items = api.schedules[event_id]
+    home = os.path.join(tmp, 'ingest')
+    os.makedirs(home, exist_ok=True)
+    rows = []
+    with FakeHyperDeck() as deck:
+        config = os.path.join(home, 'config.json')
+        poll = 1
+        with open(config, 'w', encoding='utf-8') as fh:
+            json.dump({
+                'api_base_url': api.url,
+                'api_token': 'ros_itok_bench',
+                'event_id': event_id,
+                'hyperdeck_host': deck.host,
+                'hyperdeck_port': deck.port,
+                'target_folder': home,
+                'auto_copy': False,
+                'poll_seconds': poll,
+                'auto_stop_never': True,
+            }, fh)
+        env = dict(os.environ, LOCALAPPDATA=home, PYTHONUNBUFFERED='1')
+        daemon = Daemon('ingest_daemon', ['ingest_daemon.py', '--config', config, '--port', '0', '--never'],
+                        INGEST_DIR, env, tmp)
+        record, stop = [], []
+        try:
+            polled = lambda: api.stats()['hits'].get(r'^/api/active-timers/([^/]+)$', 0) > 0  # noqa: E731
+            try:
+                wait_until(lambda: polled() or daemon.proc.poll() is not None, timeout=START_TIMEOUT)
+            except TimeoutError:
+                pass
+            if not polled():
+                raise RuntimeError('ingest_daemon did not start following:\n' + daemon.tail())
+            for n in range(cycles):
+                item = items[n % len(items)]
+                time.sleep(random.uniform(0, poll))
+                started = time.perf_counter()
+                api.load_cue(event_id, item['id'])
+                record.append((wait_until(lambda: deck.recording) - started) * 1000.0)
+                time.sleep(random.uniform(0, poll))
+                started = time.perf_counter()
+                api.stop_timer(event_id, item['id'])
+                stop.append((wait_until(lambda: not deck.recording) - started) * 1000.0)
+        except TimeoutError as exc:
+            raise RuntimeError('ingest case timed out:\n' + daemon.tail()) from exc
+        finally:
+            daemon.stop()
+    rows.append(row(f'cue load → deck record (poll {poll} s)', record))
+    rows.append(row(f'timer stop → deck stop (poll {poll} s)', stop))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=500, help='schedule rows per event (e.g. 5000)')
+    parser.add_argument('--cycles', type=int, default=10, help='cues per case')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds the fake API waits before each reply')
+    parser.add_argument('--push-latency', type=float, default=0.0, help='seconds before each Socket.IO broadcast')
+    parser.add_argument('--skip-osc', action='store_true')
+    parser.add_argument('--skip-ingest', action='store_true')
+    parser.add_argument('--json', action='store_true', help='print one JSON object instead of a table')
+    args = parser.parse_args()
+
+    transport = 'websocket' if importlib.util.find_spec('websocket') else 'polling (websocket-client not installed)'
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp, FakeRosApi(
+        events=2, items=args.items, latency=args.latency, push_latency=args.push_latency,
+    ) as api:
+        if not args.skip_osc:
+            rows.extend(osc_cases(api, args.cycles, tmp))
+        if not args.skip_ingest:
+            rows.extend(ingest_cases(api, args.cycles, tmp))
+
+    if args.json:
+        print(json.dumps({
+            'python': sys.version.split()[0], 'items': args.items, 'latency': args.latency,
+            'push_latency': args.push_latency, 'socket_transport': transport, 'cases': rows,
+        }, indent=1))
+        return
+    print(f'{args.items} rows, API latency {args.latency * 1000:g} ms, push latency {args.push_latency * 1000:g} ms, '
+          f'OSC app socket: {transport}')
+    width = max(len(r['case']) for r in rows) if rows else 0
+    for r in rows:
+        print(f"{r['case']:<{width}}  x{r['runs']:<3}  p50 {r['p50_ms']:8.1f} ms  p95 {r['p95_ms']:8.1f} ms  "
+              f"max {r['max_ms']:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""Throughput benchmark for osc_codec.
+
+    python scripts/osc_codec_bench.py [seconds-per-case]
+
+Prints packets/s and MB/s for decoding and encoding typical control traffic
+(short commands, a status reply, a 10-message bundle) and a 10-item
+list reply sent as separate messages vs one bundle. Each case is also run
+through ``baseline_parse`` / ``baseline_create``, the parser and encoder the
+app used before osc_codec, so a regression shows up next to the number it
+replaced.
+"""
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from osc_codec import (  # noqa: E402
+    IMMEDIATELY, OscMessage, decode_packet, encode_bundle, encode_list_bundles, encode_message, iter_messages,
+)
+
+CASES = {
+    'command': ('/timer/start', []),
+    'cue load': ('/cue/12A/load', []),
+    'set day': ('/set-day', [2]),
+    'set event': ('/set-event', ['1234']),
+    'mixed args': ('/status/info', ['Event: 42, Day: 1, Active: 17', 3, 0.5, True, None]),
+}
+
+
+def baseline_parse(data):
+    """The pre-osc_codec ``parse_osc_message`` (s/i/f only), kept verbatim as the reference."""
+    try:
+        null_idx = data.find(b'\x00')
+        if null_idx == -1:
+            return None, []
+        address = data[:null_idx].decode('utf-8')
+        padded_addr_len = ((null_idx + 1) + 3) // 4 * 4
+        if len(data) <= padded_addr_len:
+            return address, []
+        type_start = padded_addr_len
+        if type_start >= len(data) or data[type_start:type_start + 1] != b',':
+            return address, []
+        type_null = data.find(b'\x00', type_start)
+        if type_null == -1:
+            return address, []
+        type_tags = data[type_start + 1:type_null].decode('utf-8')
+        args = []
+        padded_type_len = ((type_null + 1) + 3) // 4 * 4
+        arg_start = padded_type_len
+        for tag in type_tags:
+            if arg_start >= len(data):
+                break
+            if tag == 's':
+                str_end = data.find(b'\x00', arg_start)
+                if str_end == -1:
+                    break
+                args.append(data[arg_start:str_end].decode('utf-8'))
+                arg_start = ((str_end + 1) + 3) // 4 * 4
+            elif tag == 'i':
+                if arg_start + 4 > len(data):
+                    break
+                args.append(struct.unpack('>i', data[arg_start:arg_start + 4])[0])
+                arg_start += 4
+            elif tag == 'f':
+                if arg_start + 4 > len(data):
+                    break
+                args.append(struct.unpack('>f', data[arg_start:arg_start + 4])[0])
+                arg_start += 4
+        return address, args
+    except Exception:
+        return None, []
+
+
+def baseline_create(address, args=None):
+    """The pre-osc_codec ``create_osc_message`` (s/i/f only; no type tag string without args)."""
+    if args is None:
+        args = []
+    addr_bytes = address.encode('utf-8') + b'\x00'
+    addr_padding = (4 - len(addr_bytes) % 4) % 4
+    addr_padded = addr_bytes + (b'\x00' * addr_padding)
+    if not args:
+        return addr_padded
+    type_tag = ',' + ''.join(
+        ['s' if isinstance(a, str) else 'i' if isinstance(a, int) else 'f' for a in args]
+    )
+    type_bytes = type_tag.encode('utf-8') + b'\x00'
+    type_padding = (4 - len(type_bytes) % 4) % 4
+    type_padded = type_bytes + (b'\x00' * type_padding)
+    arg_bytes = b''
+    for arg in args:
+        if isinstance(arg, str):
+            s = arg.encode('utf-8') + b'\x00'
+            s += b'\x00' * ((4 - len(s) % 4) % 4)
+            arg_bytes += s
+        elif isinstance(arg, int):
+            arg_bytes += struct.pack('>i', arg)
+        elif isinstance(arg, float):
+            arg_bytes += struct.pack('>f', arg)
+    return addr_padded + type_padded + arg_bytes
+
+
+def rate(fn, seconds):
+    n = 0
+    batch = 1000
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        for _ in range(batch):
+            fn()
+        n += batch
+        now = time.perf_counter()
+        if now >= deadline:
+            return n / (now - start)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    rows = []
+    for name, (address, args) in CASES.items():
+        raw = encode_message(address, args)
+        rows.append((f'decode {name}', rate(lambda: decode_packet(raw), seconds), len(raw)))
+        rows.append(('  baseline parse', rate(lambda: baseline_parse(raw), seconds), len(raw)))
+        rows.append((f'encode {name}', rate(lambda: encode_message(address, args), seconds), len(raw)))
+        rows.append(('  baseline create', rate(lambda: baseline_create(address, args), seconds), len(raw)))
+    names = [f'Event {i} ({i})' for i in range(10)]
+    rows.append(('encode list x10 (messages)', rate(lambda: [encode_message('/events/list', [n]) for n in names], seconds), 0))
+    rows.append(('  baseline create', rate(lambda: [baseline_create('/events/list', [n]) for n in names], seconds), 0))
+    rows.append(('encode list x10 (bundle)', rate(lambda: encode_list_bundles('/events/list', names, 8192), seconds), 0))
+    bundle = encode_bundle(IMMEDIATELY, [OscMessage('/events/list', [f'Event {i} ({i})']) for i in range(10)])
+    rows.append(('decode bundle x10', rate(lambda: list(iter_messages(decode_packet(bundle))), seconds), len(bundle)))
+
+    width = max(len(r[0]) for r in rows)
+    for name, per_sec, size in rows:
+        if size:
+            print(f'{name:<{width}}  {per_sec:>12,.0f} pkt/s  {per_sec * size / 1e6:>8.1f} MB/s  ({size} B)')
+        else:
+            print(f'{name:<{width}}  {per_sec:>12,.0f} op/s')
+
+
+if __name__ == '__main__':
+    main()
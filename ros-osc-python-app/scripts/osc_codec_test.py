@@ -0,0 +1,129 @@
+"""Round-trip fuzz test for osc_codec.
+
+    python scripts/osc_codec_test.py [iterations] [seed]
+
+Encodes random messages and nested bundles, decodes them and checks they
+match; then flips/truncates random bytes and checks the decoder only ever
+raises OscDecodeError. Exits non-zero on the first mismatch.
+"""
+import math
+import os
+import random
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from osc_codec import (  # noqa: E402
+    IMMEDIATELY, IMPULSE, OscBundle, OscDecodeError, OscMessage, Timetag,
+    decode_packet, encode_bundle, encode_message, encode_packet, iter_messages, parse_osc_message,
+)
+
+TAGS = 'ifsSbhdtcTFNI'
+
+
+def rand_str(rng, max_len=24):
+    alphabet = 'abcdefghijklmnopqrstuvwxyz0123456789 -_/éü✓'
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+
+
+def rand_arg(rng, tag):
+    if tag == 'i':
+        return rng.randint(-2**31, 2**31 - 1)
+    if tag == 'f':
+        return struct.unpack('>f', struct.pack('>f', rng.uniform(-1e6, 1e6)))[0]
+    if tag in 'sS':
+        return rand_str(rng)
+    if tag == 'b':
+        return bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 40)))
+    if tag == 'h':
+        return rng.randint(-2**63, 2**63 - 1)
+    if tag == 'd':
+        return rng.uniform(-1e12, 1e12)
+    if tag == 't':
+        return Timetag(rng.getrandbits(64))
+    if tag == 'c':
+        return chr(rng.randint(32, 0x2FFF))
+    return {'T': True, 'F': False, 'N': None, 'I': IMPULSE}[tag]
+
+
+def rand_message(rng):
+    address = '/' + '/'.join(rand_str(rng, 8).replace('/', '') or 'x' for _ in range(rng.randint(1, 4)))
+    tags = ''.join(rng.choice(TAGS) for _ in range(rng.randint(0, 8)))
+    return OscMessage(address, [rand_arg(rng, t) for t in tags], tags)
+
+
+def rand_packet(rng, depth=0):
+    if depth >= 3 or rng.random() < 0.6:
+        return rand_message(rng)
+    timetag = IMMEDIATELY if rng.random() < 0.3 else Timetag(rng.getrandbits(64) | 2)
+    return OscBundle(timetag, [rand_packet(rng, depth + 1) for _ in range(rng.randint(0, 4))])
+
+
+def same(a, b):
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (math.isnan(a) and math.isnan(b))
+    return a == b and type(a) is type(b)
+
+
+def check(original, decoded):
+    if isinstance(original, OscMessage):
+        assert isinstance(decoded, OscMessage), decoded
+        assert decoded.address == original.address, (decoded.address, original.address)
+        assert decoded.typetags == original.typetags, (decoded.typetags, original.typetags)
+        assert len(decoded.args) == len(original.args)
+        for x, y in zip(original.args, decoded.args):
+            assert same(x, y), (original.typetags, x, y)
+        return
+    assert isinstance(decoded, OscBundle), decoded
+    assert decoded.timetag == original.timetag
+    assert len(decoded.elements) == len(original.elements)
+    for x, y in zip(original.elements, decoded.elements):
+        check(x, y)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else random.randrange(1 << 30)
+    rng = random.Random(seed)
+    print(f'osc_codec fuzz: {iterations} iterations, seed {seed}')
+
+    for _ in range(iterations):
+        packet = rand_packet(rng)
+        raw = encode_packet(packet)
+        assert len(raw) % 4 == 0
+        check(packet, decode_packet(raw))
+        # Inferred type tags round-trip for the common types too.
+        if isinstance(packet, OscMessage):
+            inferred = [a for a, t in zip(packet.args, packet.typetags) if t not in 'SdcI']
+            address, args = parse_osc_message(encode_message(packet.address, inferred))
+            assert address == packet.address and len(args) == len(inferred)
+
+        # Corrupted input: anything but OscDecodeError is a bug.
+        bad = bytearray(raw)
+        for _ in range(rng.randint(1, 4)):
+            if bad:
+                bad[rng.randrange(len(bad))] = rng.getrandbits(8)
+        if bad and rng.random() < 0.5:
+            del bad[rng.randrange(len(bad)):]
+        try:
+            decode_packet(bytes(bad))
+        except OscDecodeError:
+            pass
+
+    # Nested bundles never fire before their parent.
+    later, earlier = Timetag.from_unix(2000.0), Timetag.from_unix(1000.0)
+    nested = decode_packet(encode_bundle(later, [OscBundle(earlier, [OscMessage('/a')])]))
+    assert [tt for tt, _ in iter_messages(nested)] == [later]
+    assert abs(Timetag.from_unix(1234.5).to_unix() - 1234.5) < 1e-6
+
+    # Cached decode plans: one address, type tag strings of every length.
+    for tags in ['', 'i', 'ii', 'iii', 'iiii', 'iiiii', 'iiiiiiii', 'ii', 'iii', '']:
+        decoded = decode_packet(encode_message('/plan', [7] * len(tags), tags))
+        assert decoded.typetags == tags and decoded.args == [7] * len(tags), decoded
+
+    print('ok')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Routing throughput for the OSC app's command set.
+
+    python scripts/osc_router_bench.py [seconds-per-case]
+
+Registers no-op handlers under the same templates as app.py and measures
+dispatch rate for the mixed command traffic, then for its literal addresses
+(the dict fast path) and its capture addresses (bound on first use) alone,
+each next to the if/elif chain it replaced; then cold lookups (cache
+disabled) and wildcard patterns.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from osc_router import OscRouter  # noqa: E402
+
+ROUTES = [
+    ('/set-event', (str,)),
+    ('/list-events', ()),
+    ('/cue/<cue_name>/load', ()),
+    ('/timer/start', ()),
+    ('/timer/stop', ()),
+    ('/timer/reset', ()),
+    ('/timer/adjust/<adj>', ()),
+    ('/subtimer/cue/<cue_num>/start', ()),
+    ('/subtimer/cue/<cue_num>/stop', ()),
+    ('/set-day', (int,)),
+    ('/get-day', ()),
+    ('/status', ()),
+    ('/stats', ()),
+]
+
+TRAFFIC = [
+    ('/timer/start', []),
+    ('/timer/stop', []),
+    ('/cue/12A/load', []),
+    ('/timer/adjust/+1', []),
+    ('/subtimer/cue/5/start', []),
+    ('/set-day', ['2']),
+    ('/status', []),
+    ('/get-day', []),
+]
+
+LITERAL = [(address, args) for address, args in TRAFFIC if address in {p for p, _ in ROUTES}]
+CAPTURE = [item for item in TRAFFIC if item not in LITERAL]
+
+PATTERNS = [
+    ('/timer/{start,stop}', []),
+    ('/timer/*', []),
+    ('/subtimer/cue/5/st[ao]*', []),
+    ('/s?t-day', [1]),
+]
+
+
+def noop(_client, *_args, **_params):
+    pass
+
+
+def build(cache_size):
+    router = OscRouter(cache_size=cache_size)
+    for pattern, args in ROUTES:
+        router.add(pattern, noop, args=args)
+    return router
+
+
+def if_chain(address, args):
+    parts = address.strip('/').split('/')
+    cmd = parts[0]
+    if cmd == 'set-event' and args:
+        noop(None, str(args[0]))
+    elif cmd == 'list-events':
+        noop(None)
+    elif cmd == 'cue' and len(parts) >= 3 and parts[2] == 'load':
+        noop(None, parts[1])
+    elif cmd == 'timer' and len(parts) >= 2:
+        action = parts[1]
+        if action in ('start', 'stop', 'reset'):
+            noop(None)
+        elif action == 'adjust' and len(parts) >= 3:
+            noop(None, parts[2])
+    elif cmd == 'subtimer' and len(parts) >= 4 and parts[1] == 'cue':
+        noop(None, parts[2])
+    elif cmd == 'set-day' and args:
+        noop(None, int(args[0]))
+    elif cmd in ('get-day', 'status', 'stats'):
+        noop(None)
+
+
+def rate(traffic, send, seconds):
+    n = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        for address, args in traffic:
+            send(address, args)
+        n += len(traffic)
+        now = time.perf_counter()
+        if now >= deadline:
+            return n / (now - start)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    cached = build(1024)
+    cold = build(0)
+    rows = [
+        ('if/elif chain (baseline)', rate(TRAFFIC, if_chain, seconds)),
+        ('router, cached', rate(TRAFFIC, cached.dispatch, seconds)),
+        ('if/elif chain, literal only', rate(LITERAL, if_chain, seconds)),
+        ('router, literal only', rate(LITERAL, cached.dispatch, seconds)),
+        ('if/elif chain, captures only', rate(CAPTURE, if_chain, seconds)),
+        ('router, captures only', rate(CAPTURE, cached.dispatch, seconds)),
+        ('router, uncached', rate(TRAFFIC, cold.dispatch, seconds)),
+        ('router, patterns cached', rate(PATTERNS, cached.dispatch, seconds)),
+        ('router, patterns uncached', rate(PATTERNS, cold.dispatch, seconds)),
+    ]
+    width = max(len(name) for name, _ in rows)
+    for name, per_sec in rows:
+        print(f'{name:<{width}}  {per_sec:>12,.0f} msg/s')
+    print(f'cache: {cached.cache_info()}')
+
+
+if __name__ == '__main__':
+    main()
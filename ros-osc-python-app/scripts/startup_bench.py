@@ -0,0 +1,54 @@
+"""Startup import cost of the OSC app, each run in a fresh interpreter.
+
+    python scripts/startup_bench.py [runs]
+
+For ``app`` (Tk front-end) and ``osc_daemon`` (headless), reports the median
+wall time of ``python -c "import <module>"`` (interpreter start included) and
+the median ``imports`` mark from startup_trace. It also checks that
+``requests`` and ``socketio`` are still left for first use. No window is
+opened and nothing touches the network.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY = ('requests', 'socketio')
+PROBE = (
+    "import sys, json, {module}, startup_trace; "
+    "print(json.dumps({{'marks': dict(startup_trace.marks()), "
+    "'loaded': [m for m in {lazy!r} if m in sys.modules]}}))"
+)
+
+
+def run_once(module):
+    code = PROBE.format(module=module, lazy=LAZY)
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, '-c', code], cwd=APP_DIR, capture_output=True, text=True, check=True,
+    ).stdout
+    wall = (time.perf_counter() - started) * 1000.0
+    return wall, json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for module in ('app', 'osc_daemon'):
+        run_once(module)  # warm the OS file cache and .pyc files
+        walls, imports, loaded = [], [], set()
+        for _ in range(runs):
+            wall, data = run_once(module)
+            walls.append(wall)
+            imports.append(data['marks'].get('imports', 0.0))
+            loaded.update(data['loaded'])
+        print(f"{module:>10}: process {statistics.median(walls):6.1f} ms, "
+              f"imports {statistics.median(imports):6.1f} ms (median of {runs})")
+        if loaded:
+            print(f"{'':>10}  eagerly imported: {', '.join(sorted(loaded))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""Server clock estimate on top of ``time.monotonic``.
+
+``ServerClock.now()`` returns the API server's wall-clock time as
+``time.monotonic() + offset``. Until the first sample arrives, the offset is
+taken from the local wall clock once at startup. After that, NTP corrections
+or manual clock changes on this machine no longer move running countdowns.
+
+The offset comes from time samples:
+
+* round trips (``add_round_trip``): the server time is assumed to fall at the
+  midpoint of the request, with an error of at most half the round-trip time
+  plus half the timestamp resolution (1 s for an HTTP ``Date`` header, 1 ms
+  for an ISO ``timestamp`` in a JSON body);
+* one-way pushes such as Socket.IO ``serverTime`` (``add_one_way``). A
+  push's delivery delay has no upper bound, so it never becomes a sample; it
+  only tells us the server clock was at least that far along on arrival. If
+  that is later than the current estimate allows, the server clock has
+  stepped: the old samples are dropped and the caller should take new round
+  trips.
+
+Like NTP's clock filter, the sample with the smallest error wins. A sample's
+error grows with its age (``DRIFT_PPM``), so fresh samples take over from
+old ones.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+WINDOW = 16
+DRIFT_PPM = 50.0  # assumed worst-case drift between this machine and the server
+MS_RESOLUTION = 0.001
+DATE_HEADER_RESOLUTION = 1.0
+
+
+def parse_server_time(value) -> float | None:
+    """Epoch seconds from an ISO-8601 string (``...Z`` allowed); None if unparseable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def format_server_time(epoch: float) -> str:
+    """ISO-8601 UTC with milliseconds and a ``Z`` suffix, as the API writes timestamps."""
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+class ServerClock:
+    def __init__(self, window: int = WINDOW):
+        self._lock = threading.Lock()
+        # (offset, error at capture, captured at monotonic, rtt)
+        self._samples: deque[tuple[float, float, float, float]] = deque(maxlen=window)
+        self._offset = time.time() - time.monotonic()
+        self._error = float('inf')
+        self._best_rtt: float | None = None
+        self.samples = 0
+
+    @property
+    def synced(self) -> bool:
+        return self._error != float('inf')
+
+    def now(self) -> float:
+        """Estimated server epoch time, advancing with ``time.monotonic``."""
+        return time.monotonic() + self._offset
+
+    def offset_from_local(self) -> float:
+        """Server clock minus this machine's wall clock, in seconds (for display/logging)."""
+        return self.now() - time.time()
+
+    def error(self) -> float:
+        """Current error bound in seconds (``inf`` before the first sample)."""
+        with self._lock:
+            return self._current()[1]
+
+    def describe(self) -> str:
+        if not self.synced:
+            return 'server clock: not synced (using local clock)'
+        return (
+            f"server clock: {self.offset_from_local() * 1000:+.0f} ms vs local, "
+            f"±{self.error() * 1000:.0f} ms ({self.samples} samples)"
+        )
+
+    def add_round_trip(self, sent_mono: float, server_epoch: float, received_mono: float,
+                       resolution: float = MS_RESOLUTION) -> None:
+        rtt = received_mono - sent_mono
+        if rtt < 0 or server_epoch is None:
+            return
+        offset = server_epoch + resolution / 2 - (sent_mono + received_mono) / 2
+        with self._lock:
+            if self._best_rtt is None or rtt < self._best_rtt:
+                self._best_rtt = rtt
+            self._add(offset, rtt / 2 + resolution / 2, received_mono, rtt)
+
+    def add_one_way(self, server_epoch: float, received_mono: float | None = None,
+                    resolution: float = MS_RESOLUTION) -> bool:
+        """Check a pushed server time against the estimate; True if the server clock stepped forward.
+
+        Ignored until the first round trip. A step drops all samples (``synced`` turns False) and
+        moves the offset to the push, assuming half the best round trip in transit.
+        """
+        if server_epoch is None:
+            return False
+        received_mono = time.monotonic() if received_mono is None else received_mono
+        with self._lock:
+            if self._best_rtt is None:
+                return False
+            offset, error = self._current()
+            # The push left the server before it arrived: server time on arrival >= server_epoch.
+            if server_epoch - resolution / 2 - received_mono <= offset + error:
+                return False
+            self._offset = server_epoch + self._best_rtt / 2 - received_mono
+            self._samples.clear()
+            self._best_rtt = None  # measure the path again along with the clock
+            self._error = float('inf')
+            return True
+
+    def _add(self, offset: float, error: float, taken: float, rtt: float) -> None:
+        self._samples.append((offset, error, taken, rtt))
+        self.samples += 1
+        self._offset, self._error = self._current()
+
+    def _current(self) -> tuple[float, float]:
+        if not self._samples:
+            return self._offset, float('inf')
+        now = time.monotonic()
+        drift = DRIFT_PPM / 1e6
+        best = min(self._samples, key=lambda s: s[1] + max(0.0, now - s[2]) * drift)
+        return best[0], best[1] + max(0.0, now - best[2]) * drift
+
+
+def sample_http(clock: ServerClock, url: str, get=None, timeout: float = 5.0) -> bool:
+    """One round-trip sample from ``url``: JSON ``timestamp`` (ms) if present, else the ``Date`` header (1 s)."""
+    if get is None:
+        import requests
+        get = requests.get
+    sent = time.monotonic()
+    r = get(url, timeout=timeout)
+    received = time.monotonic()
+    if getattr(r, 'status_code', 200) == 404:
+        return False  # no such endpoint here (its Date header is no sample worth keeping)
+    server_epoch = None
+    resolution = MS_RESOLUTION
+    try:
+        body = r.json()
+        if isinstance(body, dict):
+            server_epoch = parse_server_time(body.get('timestamp') or body.get('serverTime'))
+    except ValueError:
+        pass
+    if server_epoch is None:
+        date = r.headers.get('Date') if getattr(r, 'headers', None) is not None else None
+        if date:
+            try:
+                server_epoch = parsedate_to_datetime(date).timestamp()
+                resolution = DATE_HEADER_RESOLUTION
+            except (TypeError, ValueError):
+                server_epoch = None
+    if server_epoch is None:
+        return False
+    clock.add_round_trip(sent, server_epoch, received, resolution)
+    return True
@@ -0,0 +1,131 @@
+"""Active cue timer state, parsed once from API records and socket payloads.
+
+``TimerState`` is immutable; ``reduce_timer`` returns a new state for each
+change. ``started_at`` is parsed to a server epoch exactly once, when the
+record arrives. ``elapsed``/``remaining`` take the current server time
+(``ServerClock.now()``, which advances with ``time.monotonic``), so the 1 s UI
+tick is plain arithmetic and never parses ISO strings or reads the local
+wall clock.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any
+
+# The API parks a loaded-but-not-started timer at a 2099 started_at.
+PLACEHOLDER_YEAR = '2099'
+
+
+def parse_started_at(value) -> float | None:
+    """Epoch seconds for a real ``started_at`` (ISO string or datetime), None for the placeholder or junk."""
+    if not value or str(value)[:4] == PLACEHOLDER_YEAR:
+        return None
+    try:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return value.timestamp()
+    except (AttributeError, TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _item_id(raw):
+    if isinstance(raw, bool):
+        return raw
+    if isinstance(raw, (int, float)):
+        return int(raw)
+    if isinstance(raw, str) and raw.strip().lstrip('-').isdigit():
+        return int(raw)
+    return raw
+
+
+def _field(record: dict, snake: str, camel: str, default=None):
+    value = record.get(snake)
+    return record.get(camel, default) if value is None else value
+
+
+@dataclass(frozen=True)
+class TimerState:
+    item_id: Any = None
+    running: bool = False
+    total: int = 0                      # duration in seconds
+    started_at: str | None = None       # raw value from the server, for display/debugging
+    started_epoch: float | None = None  # server epoch seconds, parsed once
+
+    @property
+    def active(self) -> bool:
+        return self.item_id is not None
+
+    @property
+    def state(self) -> str:
+        if not self.active:
+            return 'IDLE'
+        return 'RUNNING' if self.running else 'LOADED'
+
+    def elapsed_exact(self, now: float) -> float:
+        """Seconds since start at server time ``now`` (0 unless running with a real started_at)."""
+        if not self.running or self.started_epoch is None:
+            return 0.0
+        return max(0.0, now - self.started_epoch)
+
+    def elapsed(self, now: float) -> int:
+        return int(self.elapsed_exact(now))
+
+    def remaining(self, now: float) -> int:
+        return max(0, int(self.total) - self.elapsed(now))
+
+    def is_running(self, item_id) -> bool:
+        return self.running and item_id == self.item_id
+
+
+IDLE = TimerState()
+
+
+def timer_from_record(record: dict) -> TimerState | None:
+    """Parse an active-timers row or a ``timerUpdated`` payload; None if it names no item."""
+    item_id = _field(record, 'item_id', 'itemId')
+    if item_id is None:
+        return None
+    started_at = _field(record, 'started_at', 'startedAt')
+    started_epoch = parse_started_at(started_at)
+    # RUNNING if is_running true, timer_state is 'running', or started_at is real (not the 2099 placeholder)
+    running = bool(
+        _field(record, 'is_running', 'isRunning', False)
+        or record.get('timer_state') == 'running'
+        or record.get('timerState') == 'running'
+        or (started_at and str(started_at)[:4] != PLACEHOLDER_YEAR)
+    )
+    total = _field(record, 'duration_seconds', 'durationSeconds') or 0
+    if not (running and started_epoch is not None):
+        return TimerState(_item_id(item_id), running, total)
+    return TimerState(_item_id(item_id), True, total, started_at, started_epoch)
+
+
+def reduce_timer(state: TimerState, action: str, payload=None) -> TimerState:
+    """Return the timer state after ``action``.
+
+    - ``record``: active-timers API response (list or row); inactive/missing -> IDLE
+    - ``updated``: socket ``timerUpdated`` payload
+    - ``loaded``: ``(item_id, total)`` after a local cue load (LOADED, not running)
+    - ``started``: server epoch the active timer started at (local start, before the API confirms)
+    - ``duration``: new total in seconds for the active timer
+    - ``stopped`` / ``reset``: IDLE
+    A record/payload without an item id leaves the state unchanged.
+    """
+    if action in ('stopped', 'reset'):
+        return IDLE
+    if action == 'record':
+        record = (payload[0] if payload else None) if isinstance(payload, list) else payload
+        if not record or not (record.get('is_active') or record.get('isActive')):
+            return IDLE
+        return timer_from_record(record) or state
+    if action == 'updated':
+        return (timer_from_record(payload) if payload else None) or state
+    if action == 'loaded':
+        item_id, total = payload
+        return TimerState(item_id=item_id, running=False, total=total)
+    if action == 'started':
+        return replace(state, running=True, started_at=None, started_epoch=payload) if state.active else state
+    if action == 'duration':
+        return replace(state, total=payload) if state.active else state
+    raise ValueError(f'unknown timer action {action!r}')
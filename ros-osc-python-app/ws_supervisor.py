@@ -0,0 +1,271 @@
+"""Keeps the Socket.IO connection to the API alive.
+
+``SocketSupervisor`` owns a background thread that connects, watches the
+connection and reconnects with jittered exponential backoff, including when
+the very first attempt fails. Each attempt gets a fresh ``socketio.Client``
+(its own reconnection turned off) with the handlers registered through
+``on``.
+
+Liveness: Engine.IO pings catch a dead transport eventually. When the
+connection has been quiet for ``heartbeat`` seconds, the supervisor also
+calls ``probe``. The app re-emits ``joinEvent``, and the server answers with
+``serverTime``. If nothing at all arrives within ``liveness`` seconds of a
+probe, the connection is treated as dead and replaced.
+
+``on_connect(reconnect)`` runs after every successful connect; the app joins
+its event room there and, on a reconnect, resyncs timer and schedule state
+once. Reconnect count, time spent disconnected and missed updates (resyncs
+that found changed state, reported via ``record_missed``) are in ``stats``.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable
+
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+HEARTBEAT = 15.0
+LIVENESS = 10.0
+CONNECT_TIMEOUT = 10
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX,
+                  rand: Callable[[], float] = random.random) -> float:
+    """Equal-jitter exponential backoff: half the capped step plus a random share of the other half."""
+    step = min(cap, base * (2 ** max(0, attempt - 1)))
+    return step / 2 + rand() * step / 2
+
+
+class SocketSupervisor:
+    def __init__(
+        self,
+        url: str,
+        *,
+        on_connect: Callable[[bool], Any] | None = None,
+        on_disconnect: Callable[[], Any] | None = None,
+        on_status: Callable[[str], Any] | None = None,
+        probe: Callable[[], bool] | None = None,
+        heartbeat: float = HEARTBEAT,
+        liveness: float = LIVENESS,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        client_factory: Callable[[], Any] | None = None,
+    ):
+        self.url = url
+        self.on_connect = on_connect
+        self.on_disconnect = on_disconnect
+        self.on_status = on_status
+        self.probe = probe
+        self.heartbeat = heartbeat
+        self.liveness = liveness
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.client_factory = client_factory
+        self._handlers: dict[str, Callable] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._kick = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.client = None
+        self.connected = False
+        self._last_seen = 0.0
+        self._probe_sent = None
+        self._down_since: float | None = time.monotonic()
+        self.connects = 0
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.stale_drops = 0
+        self.missed_updates = 0
+        self.disconnected_seconds = 0.0
+        self.last_outage = 0.0
+
+    def on(self, event: str):
+        """Register a handler for ``event`` on every client this supervisor creates."""
+        def register(fn):
+            self._handlers[event] = fn
+            return fn
+        return register
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ws-supervisor', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._kick.set()
+        client = self.client
+        if client is not None:
+            try:
+                client.disconnect()
+            except Exception:
+                pass
+
+    def reconnect_now(self) -> None:
+        """Drop the current connection (if any) and skip the backoff wait."""
+        self._kick.set()
+
+    def emit(self, event: str, data=None) -> bool:
+        client = self.client
+        if client is None or not self.connected:
+            return False
+        try:
+            client.emit(event, data)
+            return True
+        except Exception:
+            return False
+
+    def record_missed(self, count: int = 1) -> None:
+        with self._lock:
+            self.missed_updates += count
+
+    def stats(self) -> dict:
+        with self._lock:
+            down = self.disconnected_seconds
+            if self._down_since is not None and self.connects:
+                down += time.monotonic() - self._down_since
+            return {
+                'connected': self.connected,
+                'connects': self.connects,
+                'reconnects': self.reconnects,
+                'failed_attempts': self.failed_attempts,
+                'stale_drops': self.stale_drops,
+                'disconnected_s': round(down, 1),
+                'last_outage_s': round(self.last_outage, 1),
+                'missed_updates': self.missed_updates,
+            }
+
+    def describe(self) -> str:
+        s = self.stats()
+        return (
+            f"{'connected' if s['connected'] else 'disconnected'}, reconnects {s['reconnects']}, "
+            f"down {s['disconnected_s']:.0f}s total (last {s['last_outage_s']:.0f}s), "
+            f"missed updates {s['missed_updates']}"
+        )
+
+    def _status(self, text: str) -> None:
+        if self.on_status:
+            try:
+                self.on_status(text)
+            except Exception:
+                pass
+
+    def _touch(self) -> None:
+        self._last_seen = time.monotonic()
+        self._probe_sent = None
+
+    def _make_client(self):
+        if self.client_factory is not None:
+            client = self.client_factory()
+        else:
+            import socketio
+            client = socketio.Client(reconnection=False)
+
+        def connect():
+            self._touch()
+
+        def disconnect(*_):
+            self._mark_down()
+
+        client.on('connect', connect)
+        client.on('disconnect', disconnect)
+        for event, fn in self._handlers.items():
+            client.on(event, self._wrap(fn))
+        return client
+
+    def _wrap(self, fn):
+        def handler(*args):
+            self._touch()
+            return fn(*args)
+        return handler
+
+    def _mark_down(self) -> None:
+        with self._lock:
+            if not self.connected:
+                return
+            self.connected = False
+            self._down_since = time.monotonic()
+        if self.on_disconnect:
+            try:
+                self.on_disconnect()
+            except Exception:
+                pass
+
+    def _mark_up(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            reconnect = self.connects > 0
+            if reconnect and self._down_since is not None:
+                self.last_outage = now - self._down_since
+                self.disconnected_seconds += self.last_outage
+                self.reconnects += 1
+            self._down_since = None
+            self.connects += 1
+            self.connected = True
+        return reconnect
+
+    def _run(self) -> None:
+        attempt = 0
+        while not self._stop.is_set():
+            self._kick.clear()
+            self._status('Connecting...' if attempt == 0 else f'Reconnecting (attempt {attempt + 1})...')
+            client = self._make_client()
+            try:
+                client.connect(self.url, wait_timeout=CONNECT_TIMEOUT)
+            except Exception as e:
+                with self._lock:
+                    self.failed_attempts += 1
+                attempt += 1
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                self._status(f'Disconnected, retry in {delay:.0f}s ({type(e).__name__})')
+                self._kick.wait(delay)
+                continue
+            attempt = 0
+            self.client = client
+            self._touch()
+            reconnect = self._mark_up()
+            self._status('Connected')
+            if self.on_connect:
+                try:
+                    self.on_connect(reconnect)
+                except Exception:
+                    pass
+            self._watch(client)
+            self._mark_down()
+            try:
+                client.disconnect()
+            except Exception:
+                pass
+            if not self._stop.is_set():
+                attempt = 1
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                self._status(f'Disconnected, retry in {delay:.0f}s')
+                self._kick.wait(delay)
+
+    def _watch(self, client) -> None:
+        """Block while the connection looks alive."""
+        while not self._stop.is_set() and not self._kick.is_set():
+            self._kick.wait(1.0)
+            if not getattr(client, 'connected', False) or not self.connected:
+                return
+            now = time.monotonic()
+            if self._probe_sent is not None:
+                if now - self._probe_sent > self.liveness:
+                    with self._lock:
+                        self.stale_drops += 1
+                    self._status('Connection stale, reconnecting...')
+                    return
+            elif now - self._last_seen > self.heartbeat and self.probe is not None:
+                # Mark first: the reply may arrive (and clear the mark) before probe() returns.
+                self._probe_sent = now
+                try:
+                    sent = self.probe()
+                except Exception:
+                    sent = False
+                if not sent:
+                    self._probe_sent = None
+                    self._last_seen = now  # nothing to probe with; check again after another heartbeat